@@ -0,0 +1,66 @@
+"""
+Benchmark of the installed JSON codecs on account list pages, as returned by the CRM.
+
+Run from the repository root:
+    python -m benchmarks.bench_codecs
+"""
+import argparse
+import timeit
+from ds_crm_sdk.transports.http.codec import available_codecs, get_codec
+
+PAGE_SIZES = (10, 100, 1000)
+
+
+def account_page(size: int) -> dict:
+    """
+    Build a list accounts response with realistic account records.
+    :param size: Number of accounts in the page.
+    :return: The response document.
+    """
+    accounts = [{
+        'id': index, 'name': f'Account {index}', 'description': 'Residential monitoring ' * 4,
+        'email_address': f'owner{index}@example.com', 'phone_number': '6505559004',
+        'account_type': index % 7 + 1, 'billing_frequency': 3, 'is_active': index % 3 != 0,
+        'is_autocollect': True, 'is_vip': False, 'pay_by_check': False, 'external_id': None,
+        'stripe_customer_id': f'cus_{index:012d}', 'parent_account': 7,
+        'created': 'Thu, 19 Jun 2025 07:53:22 GMT', 'created_by': 'system',
+        'modified': 'Thu, 19 Jun 2025 07:53:22 GMT', 'modified_by': 'system',
+        'last_billing_date': 'Sun, 01 Jun 2025 00:00:00 GMT',
+    } for index in range(size)]
+    return {'accounts': accounts, 'total': size, 'offset': 0, 'limit': size}
+
+
+def run(number: int, repeat: int) -> None:
+    """
+    Time encoding and decoding of every page size with every installed codec and print
+    operations per second and the decode speedup over the stdlib codec.
+    :param number: Operations per timing run.
+    :param repeat: Timing runs per case; the best one is reported.
+    """
+    codecs = [get_codec(name) for name in available_codecs()]
+    print(f"{'page':<7}{'codec':<10}{'dumps/s':>12}{'loads/s':>12}{'vs json':>9}")
+    for size in PAGE_SIZES:
+        page = account_page(size)
+        body = get_codec('json').dumps(page)
+        baseline = None
+        rounds = max(1, number // size)
+        timings = []
+        for codec in codecs:
+            # pylint: disable=cell-var-from-loop
+            dumps = min(timeit.repeat(lambda: codec.dumps(page), number=rounds, repeat=repeat))
+            loads = min(timeit.repeat(lambda: codec.loads(body), number=rounds, repeat=repeat))
+            timings.append((codec.name, dumps, loads))
+            if codec.name == 'json':
+                baseline = loads
+        for name, dumps, loads in timings:
+            print(f"{size:<7}{name:<10}{rounds / dumps:>12,.0f}{rounds / loads:>12,.0f}"
+                  f"{baseline / loads:>8.1f}x")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--number', type=int, default=100000,
+                        help='Accounts encoded/decoded per timing run')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+    run(number=args.number, repeat=args.repeat)
@@ -0,0 +1,280 @@
+"""
+Microbenchmarks of the SDK's own per-call overhead on the request-preparation hot path.
+
+Every case runs offline: full client calls go through a transport that returns a canned
+response without touching the network. For each case the suite reports calls per second, the
+peak memory allocated by a single call and the memory still held after many calls (tracemalloc),
+and compares them with the stored baseline.
+
+Run from the repository root:
+    python -m benchmarks.bench_hot_path                    # compare with the baseline
+    python -m benchmarks.bench_hot_path --save-baseline    # record a new baseline
+    python -m benchmarks.bench_hot_path --max-regression 0.2   # exit 1 on a >20% regression
+"""
+import argparse
+import asyncio
+import json
+import platform
+import sys
+import timeit
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+from ds_crm_sdk.clients.http.async_crm_client import AsyncCRMClient
+from ds_crm_sdk.clients.http.base import BaseCRMClient
+from ds_crm_sdk.clients.http.crm_client import CRMClient
+from ds_crm_sdk.clients.http.endpoints import AccountAddressEndpoint
+from ds_crm_sdk.constants import ClientOrigin, SortOrder
+from ds_crm_sdk.dtos import AccountRequestDTO
+from ds_crm_sdk.logging import set_logger_level
+from ds_crm_sdk.payloads import MainPayloadBuilder
+from ds_crm_sdk.transports.http.base import (AsyncHTTPTransport, HTTPHeaderTokenProvider,
+                                             HTTPTransport)
+
+BASELINE_PATH = Path(__file__).with_name('baseline.json')
+BASE_URL = 'https://crm.invalid'
+LIST_PARAMS = {'offset': 100, 'limit': 50, 'sort_by': 'name', 'sort_order': SortOrder.DESC,
+               'filters': {'status': 'active', 'account_type': 'residential'}}
+ACCOUNT = AccountRequestDTO(account_type_id=3, name='Acme Corp', email_address='ops@acme.test',
+                            phone_number='6505559004', created_by='system', user_id='u-42',
+                            first_name='Ada', last_name='Lovelace')
+
+
+class NullTransport(HTTPHeaderTokenProvider, HTTPTransport):
+    """
+    Sync transport preparing the headers like a real one and returning a canned response.
+    """
+    def send(self, method, endpoint, payload=None, params=None, headers=None, timeout=30.0, *,
+             route=None, response_model=None):
+        self.set_headers(headers)
+        return {}, 200
+
+
+class AsyncNullTransport(HTTPHeaderTokenProvider, AsyncHTTPTransport):
+    """
+    Async transport preparing the headers like a real one and returning a canned response.
+    """
+    async def send(self, method, endpoint, payload=None, params=None, headers=None, *,
+                   route=None, response_model=None):
+        await self.aset_headers(headers)
+        return {}, 200
+
+
+def _token() -> str:
+    return 'Bearer benchmark-token'
+
+
+def sync_cases() -> Dict[str, Callable[[], Any]]:
+    """
+    The synchronous benchmark cases.
+    :return: Dict of zero-argument callables keyed by case name.
+    """
+    builder = MainPayloadBuilder(client_origin=ClientOrigin.WEB)
+    base_client = BaseCRMClient(builder=builder, base_url=BASE_URL)
+    provider = HTTPHeaderTokenProvider(_token)
+    client = CRMClient(base_url=BASE_URL, client_origin=ClientOrigin.WEB,
+                       transport=NullTransport(_token))
+    # pylint: disable=protected-access
+    return {
+        'build_main_payload': lambda: builder.build_main_payload(**LIST_PARAMS),
+        'build_endpoint_url': lambda: base_client._build_endpoint_url(
+            AccountAddressEndpoint.ACCOUNT_ADDRESS, {'account_id': '42', 'address_id': '7'}),
+        'client_origin_header': lambda: base_client._build_custom_client_origin(ClientOrigin.WEB),
+        'set_headers': lambda: provider.set_headers({'X-Client-Origin': ClientOrigin.WEB}),
+        'account_dto_dump': ACCOUNT.model_dump,
+        'client.get_account': lambda: client.get_account(account_id='42'),
+        'client.get_accounts': lambda: client.get_accounts(**LIST_PARAMS),
+        'client.create_account': lambda: client.create_account(ACCOUNT),
+    }
+
+
+def async_cases() -> Dict[str, Callable[[], Any]]:
+    """
+    The asynchronous benchmark cases.
+    :return: Dict of coroutine functions keyed by case name.
+    """
+    client = AsyncCRMClient(base_url=BASE_URL, client_origin=ClientOrigin.WEB,
+                            transport=AsyncNullTransport(_token))
+    return {
+        'async_client.get_account': lambda: client.get_account(account_id='42'),
+        'async_client.get_accounts': lambda: client.get_accounts(**LIST_PARAMS),
+    }
+
+
+def _measure_memory(call: Callable[[], Any], number: int) -> Tuple[int, int]:
+    """
+    Measure the memory of a case with tracemalloc.
+    :param call: Callable running the case once.
+    :param number: Calls run to detect memory retained across calls.
+    :return: Peak bytes allocated by one call and bytes still held after ``number`` calls.
+    """
+    call()  # warm up caches so only the steady-state cost is measured
+    tracemalloc.start()
+    try:
+        start, _ = tracemalloc.get_traced_memory()
+        call()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        tracemalloc.start()
+        start, _ = tracemalloc.get_traced_memory()
+        for _ in range(number):
+            call()
+        retained, _ = tracemalloc.get_traced_memory()
+        return peak - start, max(0, retained - start)
+    finally:
+        tracemalloc.stop()
+
+
+def run_case(call: Callable[[], Any], number: int, repeat: int) -> Dict[str, float]:
+    """
+    Benchmark one synchronous case.
+    :param call: Callable running the case once.
+    :param number: Calls per timing run.
+    :param repeat: Timing runs; the best one is reported.
+    :return: Dict with ops_per_sec, peak_bytes and retained_bytes.
+    """
+    best = min(timeit.repeat(call, number=number, repeat=repeat))
+    peak, retained = _measure_memory(call, min(number, 1000))
+    return {'ops_per_sec': number / best, 'peak_bytes': peak, 'retained_bytes': retained}
+
+
+def run_async_case(call: Callable[[], Any], number: int, repeat: int) -> Dict[str, float]:
+    """
+    Benchmark one asynchronous case; every call is awaited in turn on a single event loop.
+    :param call: Coroutine function running the case once.
+    :param number: Calls per timing run.
+    :param repeat: Timing runs; the best one is reported.
+    :return: Dict with ops_per_sec, peak_bytes and retained_bytes.
+    """
+    loop = asyncio.new_event_loop()
+
+    async def calls(count: int) -> None:
+        for _ in range(count):
+            await call()
+
+    try:
+        best = min(timeit.repeat(lambda: loop.run_until_complete(calls(number)),
+                                 number=1, repeat=repeat))
+        peak, retained = _measure_memory(lambda: loop.run_until_complete(calls(1)),
+                                         min(number, 1000))
+    finally:
+        loop.close()
+    return {'ops_per_sec': number / best, 'peak_bytes': peak, 'retained_bytes': retained}
+
+
+def run(number: int, repeat: int, only: Optional[str] = None) -> Dict[str, Dict[str, float]]:
+    """
+    Run every benchmark case.
+    :param number: Calls per timing run.
+    :param repeat: Timing runs per case.
+    :param only: Substring selecting the cases to run (optional).
+    :return: Results keyed by case name.
+    """
+    results = {}
+    for runner, cases in ((run_case, sync_cases()), (run_async_case, async_cases())):
+        for name, call in cases.items():
+            if only is None or only in name:
+                results[name] = runner(call, number, repeat)
+    return results
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]],
+            max_regression: float) -> Dict[str, list]:
+    """
+    Compare results with a baseline.
+    :param results: Results of ``run``.
+    :param baseline: Stored results of an earlier run.
+    :param max_regression: Tolerated relative regression, e.g. 0.2 for 20%.
+    :return: Dict of regression descriptions keyed by case name (empty when none regressed).
+    """
+    regressions = {}
+    for name, result in results.items():
+        reference = baseline.get(name)
+        if reference is None:
+            continue
+        problems = []
+        if result['ops_per_sec'] < reference['ops_per_sec'] * (1 - max_regression):
+            problems.append('ops/s')
+        if result['peak_bytes'] > reference['peak_bytes'] * (1 + max_regression) + 64:
+            problems.append('peak memory')
+        if problems:
+            regressions[name] = problems
+    return regressions
+
+
+def report(results: Dict[str, Dict[str, float]],
+           baseline: Optional[Dict[str, Dict[str, float]]]) -> None:
+    """
+    Print the results, with the change relative to the baseline when there is one.
+    :param results: Results of ``run``.
+    :param baseline: Stored baseline results (optional).
+    """
+    print(f"{'case':<28}{'ops/s':>12}{'vs base':>9}{'peak B':>9}{'vs base':>9}{'retained B':>12}")
+    for name, result in results.items():
+        reference = (baseline or {}).get(name)
+        speed = peak = ''
+        if reference:
+            speed = f"{result['ops_per_sec'] / reference['ops_per_sec'] - 1:+.0%}"
+            peak = f"{result['peak_bytes'] - reference['peak_bytes']:+,d}"
+        print(f"{name:<28}{result['ops_per_sec']:>12,.0f}{speed:>9}"
+              f"{result['peak_bytes']:>9,d}{peak:>9}{result['retained_bytes']:>12,d}")
+
+
+def load_baseline(path: Path) -> Optional[Dict[str, Dict[str, float]]]:
+    """
+    Load the stored baseline.
+    :param path: The baseline file.
+    :return: Baseline results keyed by case name, or None when there is no baseline.
+    """
+    if not path.exists():
+        return None
+    return json.loads(path.read_text())['results']
+
+
+def save_baseline(path: Path, results: Dict[str, Dict[str, float]]) -> None:
+    """
+    Store results as the new baseline, with the interpreter and platform they were taken on.
+    :param path: The baseline file.
+    :param results: Results of ``run``.
+    """
+    document = {'python': platform.python_version(), 'platform': platform.platform(),
+                'results': results}
+    path.write_text(json.dumps(document, indent=2, sort_keys=True) + '\n')
+
+
+def main() -> int:
+    """
+    Command line entry point.
+    :return: Process exit code, 1 when a case regressed beyond ``--max-regression``.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--number', type=int, default=20000, help='Calls per timing run')
+    parser.add_argument('--repeat', type=int, default=5, help='Timing runs per case')
+    parser.add_argument('--only', help='Only run the cases whose name contains this')
+    parser.add_argument('--baseline', type=Path, default=BASELINE_PATH)
+    parser.add_argument('--save-baseline', action='store_true',
+                        help='Store the results as the new baseline')
+    parser.add_argument('--max-regression', type=float, default=None,
+                        help='Fail when ops/s drop or peak memory grows by more than this ratio')
+    parser.add_argument('--log-level', default='WARNING',
+                        help='SDK log level while benchmarking (DEBUG includes logging costs)')
+    args = parser.parse_args()
+    set_logger_level(args.log_level)
+
+    results = run(number=args.number, repeat=args.repeat, only=args.only)
+    baseline = load_baseline(args.baseline)
+    report(results, baseline)
+    if args.save_baseline:
+        save_baseline(args.baseline, results)
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+    if args.max_regression is not None and baseline:
+        regressions = compare(results, baseline, args.max_regression)
+        for name, problems in regressions.items():
+            print(f"REGRESSION {name}: {', '.join(problems)}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
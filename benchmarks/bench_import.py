@@ -0,0 +1,89 @@
+"""
+Benchmark of the import time of the SDK's entry points, each in a fresh interpreter.
+
+Every case imports one entry point in a new Python process with ``-X importtime`` and reports
+the best cumulative import time of the case and the heavy third-party dependencies it loaded.
+
+Run from the repository root:
+    python -m benchmarks.bench_import
+    python -m benchmarks.bench_import --max-ms 150    # exit 1 when a case imports slower
+"""
+import argparse
+import re
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+CASES = {
+    'ds_crm_sdk': 'import ds_crm_sdk',
+    'transports.http': 'import ds_crm_sdk.transports.http',
+    'DSHTTPTransport': 'from ds_crm_sdk.transports.http import DSHTTPTransport',
+    'DSAsyncHTTPTransport': 'from ds_crm_sdk.transports.http import DSAsyncHTTPTransport',
+    'CRMClient': 'from ds_crm_sdk.clients.http.crm_client import CRMClient',
+    'AsyncCRMClient': 'from ds_crm_sdk.clients.http.async_crm_client import AsyncCRMClient',
+}
+HEAVY = ('loguru', 'pydantic', 'requests', 'httpx', 'orjson', 'msgspec')
+_IMPORT_LINE = re.compile(r'^import time:\s+\d+ \|\s+(\d+) \| ( *)(\S+)$')
+
+
+def measure(statement: str) -> Tuple[float, List[str]]:
+    """
+    Run an import statement in a fresh interpreter.
+    :param statement: The import statement.
+    :return: Milliseconds spent importing the SDK modules (their dependencies included) and
+             the heavy dependencies loaded.
+    """
+    process = subprocess.run([sys.executable, '-X', 'importtime', '-c', statement],
+                             capture_output=True, text=True, check=True)
+    total_us, loaded = 0, set()
+    for line in process.stderr.splitlines():
+        match = _IMPORT_LINE.match(line)
+        if match is None:
+            continue
+        cumulative, indent, module = match.groups()
+        top = module.split('.')[0]
+        if top in HEAVY:
+            loaded.add(top)
+        # Top-level SDK modules include everything they import; the interpreter startup does not
+        if not indent and top == 'ds_crm_sdk':
+            total_us += int(cumulative)
+    return total_us / 1000, sorted(loaded, key=HEAVY.index)
+
+
+def run(repeat: int) -> Dict[str, Tuple[float, List[str]]]:
+    """
+    Measure every case.
+    :param repeat: Processes per case; the fastest one is reported.
+    :return: Best milliseconds and heavy dependencies loaded, keyed by case name.
+    """
+    results = {}
+    for name, statement in CASES.items():
+        runs = [measure(statement) for _ in range(repeat)]
+        results[name] = (min(milliseconds for milliseconds, _ in runs), runs[0][1])
+    return results
+
+
+def main() -> int:
+    """
+    Command line entry point.
+    :return: Process exit code, 1 when a case is slower than ``--max-ms``.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5, help='Processes per case')
+    parser.add_argument('--max-ms', type=float, default=None,
+                        help='Fail when a case takes longer than this many milliseconds')
+    args = parser.parse_args()
+    results = run(args.repeat)
+    print(f"{'case':<22}{'import ms':>10}  dependencies loaded")
+    for name, (milliseconds, loaded) in results.items():
+        print(f"{name:<22}{milliseconds:>10.1f}  {', '.join(loaded) or '-'}")
+    if args.max_ms is not None:
+        slow = [name for name, (milliseconds, _) in results.items() if milliseconds > args.max_ms]
+        for name in slow:
+            print(f"TOO SLOW {name}: {results[name][0]:.1f} ms > {args.max_ms} ms")
+        return 1 if slow else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,43 @@
+"""
+Microbenchmark of MainPayloadBuilder: compiled per-origin template vs pydantic model dump.
+
+Run from the repository root:
+    python -m benchmarks.bench_payload_builder
+"""
+import argparse
+import timeit
+from ds_crm_sdk.constants import ClientOrigin, SortOrder
+from ds_crm_sdk.payloads import MainPayloadBuilder
+
+CASES = {
+    'no_params': {},
+    'list_page': {'offset': 100, 'limit': 50, 'sort_by': 'name', 'sort_order': SortOrder.DESC,
+                  'filters': None},
+    'filtered': {'offset': 0, 'limit': 10, 'sort_by': 'created', 'sort_order': SortOrder.ASC,
+                 'filters': {'status': 'active', 'account_type': 'residential'}},
+}
+
+
+def run(number: int, repeat: int) -> None:
+    """
+    Time both builder paths for every case and print calls per second and the speedup.
+    :param number: Calls per timing run.
+    :param repeat: Timing runs per case; the best one is reported.
+    """
+    builder = MainPayloadBuilder(client_origin=ClientOrigin.WEB)
+    print(f"{'case':<12}{'model dump/s':>16}{'compiled/s':>16}{'speedup':>10}")
+    for name, extra in CASES.items():
+        # pylint: disable=protected-access,cell-var-from-loop
+        slow = min(timeit.repeat(lambda: builder._build_with_model(**extra),
+                                 number=number, repeat=repeat))
+        fast = min(timeit.repeat(lambda: builder.build_main_payload(**extra),
+                                 number=number, repeat=repeat))
+        print(f"{name:<12}{number / slow:>16,.0f}{number / fast:>16,.0f}{slow / fast:>9.1f}x")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--number', type=int, default=20000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+    run(number=args.number, repeat=args.repeat)
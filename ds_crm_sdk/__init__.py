@@ -1,3 +1,10 @@
-from .logging import set_logger_level
+from typing import TYPE_CHECKING
+from .utils import lazy_attributes
+
+if TYPE_CHECKING:
+    from .logging import set_logger_level
+
+# Submodules are imported on first access, so importing the package stays cheap (PEP 562)
+__getattr__, __dir__ = lazy_attributes(__name__, {'set_logger_level': '.logging'})
 
 __all__ =['set_logger_level']
@@ -2,14 +2,28 @@
 AsyncCRMClient for interacting with CRM API endpoints.
 """
 # pylint: disable=duplicate-code
+import asyncio
+import functools
+import time
+from typing import Any, AsyncIterator, Awaitable, Collection, Iterable, List, Optional, Union
 from ds_crm_sdk.transports.http.base import HTTPMethod, AsyncHTTPTransport
+from ds_crm_sdk.transports.http.hooks import RequestHooks, client_hooks
+from ds_crm_sdk.transports.http.ratelimit import RateLimiter
 from ds_crm_sdk.payloads import MainPayloadBuilder
+from ds_crm_sdk.exceptions import CRMRequestError
 from ds_crm_sdk.constants import SortOrder, ClientOrigin
-from .endpoints import AccountEndpoint, AccountAddressEndpoint, AccountTypesEndpoint
+from .endpoints import AccountEndpoint, AccountAddressEndpoint, AccountTypesEndpoint, ResultKey
 from .base import BaseCRMClient
+from .cache import FRESH, STALE, ResponseCache
+from .coalesce import RequestCoalescer
+from .hedge import RequestHedger
+from .loader import AccountLoader
+from .pagination import aiter_pages
+from .bulk import (BulkItemResult, BulkReport, DEFAULT_FATAL_STATUSES, aiter_bounded,
+                   gather_bounded)
 from ds_crm_sdk.sdk_contracts.asyncio import AsyncCRMClientAPI
 from ds_crm_sdk.dtos import AccountRequestDTO
-from ds_crm_sdk.logging import logger
+from ds_crm_sdk.logging import log_request, log_response, sample_bodies
 
 
 class AsyncCRMClient(BaseCRMClient, AsyncCRMClientAPI):
@@ -17,10 +31,137 @@ class AsyncCRMClient(BaseCRMClient, AsyncCRMClientAPI):
     Async CRMClient for interacting with CRM API endpoints.
     """
     def __init__(self, base_url: str, client_origin: ClientOrigin,
-                 transport: AsyncHTTPTransport):
-        super().__init__(base_url=base_url, builder=MainPayloadBuilder(client_origin=client_origin))
+                 transport: AsyncHTTPTransport, cache: Optional[ResponseCache] = None,
+                 coalescer: Optional[RequestCoalescer] = None,
+                 rate_limiter: Optional[RateLimiter] = None, response_models: bool = False,
+                 hooks: Optional[RequestHooks] = None, hedger: Optional[RequestHedger] = None):
+        """
+        Initialize the client.
+        :param base_url: Base URL of the CRM service.
+        :param client_origin: The origin of the client making the requests.
+        :param transport: The transport used to send the requests.
+        :param cache: Optional response cache for read endpoints (e.g. account types).
+        :param coalescer: Optional coalescer sharing one request between identical concurrent GETs.
+        :param rate_limiter: Optional rate limiter applied per client origin or endpoint template.
+        :param response_models: Return typed response models (validated straight from the
+                                response bytes) instead of dictionaries for GET endpoints.
+        :param hooks: Optional lifecycle hooks receiving the requests of this client, with
+                      per-phase timings (also reported to the transport's own hooks).
+        :param hedger: Optional hedger sending a second copy of slow GET requests; the first
+                       response wins.
+        """
+        super().__init__(base_url=base_url, builder=MainPayloadBuilder(client_origin=client_origin),
+                         cache=cache, coalescer=coalescer,
+                         rate_limiter=rate_limiter, response_models=response_models,
+                         hooks=hooks, hedger=hedger)
         self.__transport = transport
         self.__client_origin = client_origin
+        self.__background_tasks = set()
+
+    def _get(self, endpoint_template: str, values_to_inject: dict = None,
+             **extra) -> Awaitable[tuple]:
+        """
+        Send a GET request for an endpoint template, using the response cache when enabled.
+        Stale cached responses are returned immediately and refreshed in the background.
+        :param endpoint_template: The endpoint template string with placeholders.
+        :param values_to_inject: Values to inject into the endpoint template.
+        :param extra: Additional parameters for the request payload.
+        :return: Awaitable of the response data with http status code.
+        """
+        # A plain function, so that calls without hooks do not create one more coroutine
+        if self._hooks is None:
+            return self.__get(endpoint_template, values_to_inject, extra)
+        return self.__get_with_hooks(time.perf_counter(), endpoint_template, values_to_inject,
+                                     extra)
+
+    async def __get_with_hooks(self, started: float, endpoint_template: str,
+                               values_to_inject: Optional[dict], extra: dict) -> tuple:
+        with client_hooks(self._hooks, started):
+            return await self.__get(endpoint_template, values_to_inject, extra)
+
+    async def __get(self, endpoint_template: str, values_to_inject: Optional[dict],
+                    extra: dict) -> tuple:
+        endpoint = self._build_endpoint_url(endpoint_template=endpoint_template,
+                                            values_to_inject=values_to_inject)
+        params = self._builder.build_main_payload(**extra)
+        headers = self._build_custom_client_origin(client_origin=self.__client_origin)
+        key = self._cache_key(endpoint_template, endpoint, params)
+        if key is None:
+            return await self.__send_get(endpoint_template, endpoint, params, headers)
+        state, cached = self._cache.lookup(key)
+        if state == FRESH:
+            return cached
+        if state == STALE:
+            if self._cache.begin_refresh(key):
+                task = asyncio.ensure_future(self.__refresh(key, endpoint, params, headers))
+                self.__background_tasks.add(task)
+                task.add_done_callback(self.__background_tasks.discard)
+            return cached
+        response = await self.__send_get(endpoint_template, endpoint, params, headers)
+        self._cache_response(key, response)
+        return response
+
+    async def __send_get(self, route: str, endpoint: str, params: dict, headers: dict) -> tuple:
+        if self._coalescer is not None:
+            return await self._coalescer.ado(
+                self._coalescer.make_key(endpoint, params, headers,
+                                         self._response_model(route)),
+                lambda: self.__transport_get(route, endpoint, params, headers))
+        return await self.__transport_get(route, endpoint, params, headers)
+
+    async def __transport_get(self, route: str, endpoint: str, params: dict,
+                              headers: dict) -> tuple:
+        if not await self.__acquire_rate_limit(route):
+            return self._rate_limited()
+        sent = time.perf_counter()
+        if self._hedger is None:
+            data, status_code = await self.__transport.send(
+                method=HTTPMethod.GET, endpoint=endpoint, params=params, headers=headers,
+                route=route, response_model=self._response_model(route))
+        else:
+            data, status_code = await self._hedger.ado(route, functools.partial(
+                self.__transport.send, method=HTTPMethod.GET, endpoint=endpoint, params=params,
+                headers=headers, route=route, response_model=self._response_model(route)))
+        log_response('get', route, status_code, time.perf_counter() - sent)
+        return data, status_code
+
+    async def _stream(self, endpoint_template: str, result_key: str,
+                      values_to_inject: dict = None, max_body_size: Optional[int] = None,
+                      **extra) -> AsyncIterator[Any]:
+        """
+        Stream the records of a list endpoint from a single request, one record at a time.
+        :param endpoint_template: The endpoint template string with placeholders.
+        :param result_key: Key holding the records in the response.
+        :param values_to_inject: Values to inject into the endpoint template.
+        :param max_body_size: Maximum response size in bytes (optional).
+        :param extra: Additional parameters for the request payload.
+        :return: An async iterator over the records.
+        :raises CRMRequestError: If the request is rejected or fails.
+        """
+        if not await self.__acquire_rate_limit(endpoint_template):
+            data, status_code = self._rate_limited()
+            raise CRMRequestError(status_code=status_code, data=data)
+        async for record in self.__transport.stream(
+                endpoint=self._build_endpoint_url(endpoint_template=endpoint_template,
+                                                  values_to_inject=values_to_inject),
+                result_key=result_key,
+                params=self._builder.build_main_payload(**extra),
+                headers=self._build_custom_client_origin(client_origin=self.__client_origin),
+                route=endpoint_template,
+                item_model=self._item_model(result_key),
+                max_body_size=max_body_size):
+            yield record
+
+    async def __refresh(self, key: tuple, endpoint: str, params: dict, headers: dict) -> None:
+        try:
+            self._cache_response(key, await self.__send_get(key[0], endpoint, params, headers))
+        finally:
+            self._cache.end_refresh(key)
+
+    async def __acquire_rate_limit(self, route: str) -> bool:
+        if self._rate_limiter is None:
+            return True
+        return await self._rate_limiter.aacquire(origin=self.__client_origin, route=route)
 
     async def get_account(self, account_id: str) -> tuple:
         """
@@ -28,17 +169,8 @@ class AsyncCRMClient(BaseCRMClient, AsyncCRMClientAPI):
         :param account_id: The ID of the account to retrieve.
         :return: Account details as a dictionary with http status code.
         """
-        endpoint = self._build_endpoint_url(endpoint_template=AccountEndpoint.SPECIFIC_ACCOUNT,
-                                            values_to_inject={'account_id': account_id})
-        params = self._builder.build_main_payload()
-        headers = self._build_custom_client_origin(client_origin=self.__client_origin)
-        data, status_code = await self.__transport.send(
-            method=HTTPMethod.GET,
-            endpoint=endpoint,
-            params=params,
-            headers=headers
-        )
-        return data, status_code
+        return await self._get(AccountEndpoint.SPECIFIC_ACCOUNT,
+                               values_to_inject={'account_id': account_id})
 
     async def get_accounts(self, filters: dict = None, offset=0, limit=10,
                            sort_by: str = 'name',
@@ -52,18 +184,8 @@ class AsyncCRMClient(BaseCRMClient, AsyncCRMClientAPI):
         :param sort_order: The order of sorting, default is descending (DESC).
         :return: A list of accounts matching the filters with http status code
         """
-        endpoint = self._build_endpoint_url(endpoint_template=AccountEndpoint.ACCOUNTS)
-        params = self._builder.build_main_payload(**{'offset': offset, 'limit': limit,
-                                                     'sort_by': sort_by, 'sort_order': sort_order,
-                                                     'filters': filters})
-        headers = self._build_custom_client_origin(client_origin=self.__client_origin)
-        data, status_code = await self.__transport.send(
-            method=HTTPMethod.GET,
-            endpoint=endpoint,
-            params=params,
-            headers=headers
-        )
-        return data, status_code
+        return await self._get(AccountEndpoint.ACCOUNTS, offset=offset, limit=limit,
+                               sort_by=sort_by, sort_order=sort_order, filters=filters)
 
     async def get_account_addresses(self, account_id: str, filters: dict = None, offset=0, limit=10,
                                     sort_by: str = 'created',
@@ -78,19 +200,10 @@ class AsyncCRMClient(BaseCRMClient, AsyncCRMClientAPI):
         :param sort_order: The order of sorting, default is descending (DESC).
         :return: A list of addresses associated with the account with http status code.
         """
-        endpoint = self._build_endpoint_url(endpoint_template=AccountAddressEndpoint.ACCOUNT_ADDRESSES,
-                                            values_to_inject={'account_id': account_id})
-        params = self._builder.build_main_payload(**{'offset': offset, 'limit': limit,
-                                                     'sort_by': sort_by, 'sort_order': sort_order,
-                                                     'filters': filters})
-        headers = self._build_custom_client_origin(client_origin=self.__client_origin)
-        data, status_code = await self.__transport.send(
-            method=HTTPMethod.GET,
-            endpoint=endpoint,
-            params=params,
-            headers=headers
-        )
-        return data, status_code
+        return await self._get(AccountAddressEndpoint.ACCOUNT_ADDRESSES,
+                               values_to_inject={'account_id': account_id},
+                               offset=offset, limit=limit, sort_by=sort_by, sort_order=sort_order,
+                               filters=filters)
 
     async def get_account_address(self, account_id: str, address_id: str) -> tuple:
         """
@@ -100,18 +213,9 @@ class AsyncCRMClient(BaseCRMClient, AsyncCRMClientAPI):
         :return: A list of addresses associated with
          the account with http status code.
         """
-        endpoint = self._build_endpoint_url(endpoint_template=AccountAddressEndpoint.ACCOUNT_ADDRESS,
-                                            values_to_inject={'account_id': account_id,
-                                                              'address_id': address_id})
-        params = self._builder.build_main_payload()
-        headers = self._build_custom_client_origin(client_origin=self.__client_origin)
-        data, status_code = await self.__transport.send(
-            method=HTTPMethod.GET,
-            endpoint=endpoint,
-            params=params,
-            headers=headers
-        )
-        return data, status_code
+        return await self._get(AccountAddressEndpoint.ACCOUNT_ADDRESS,
+                               values_to_inject={'account_id': account_id,
+                                                 'address_id': address_id})
 
     async def get_account_types(self, filters: dict = None, offset=0, limit=10,
                                 sort_by: str = 'created',
@@ -125,18 +229,8 @@ class AsyncCRMClient(BaseCRMClient, AsyncCRMClientAPI):
         :param sort_order: The order of sorting, default is descending (DESC).
         :return: A list of account types with http status code.
         """
-        endpoint = self._build_endpoint_url(AccountEndpoint.ACCOUNT_TYPES)
-        params = self._builder.build_main_payload(**{'offset': offset, 'limit': limit,
-                                                     'sort_by': sort_by, 'sort_order': sort_order,
-                                                     'filters': filters})
-        headers = self._build_custom_client_origin(client_origin=self.__client_origin)
-        data, status_code = await self.__transport.send(
-            method=HTTPMethod.GET,
-            endpoint=endpoint,
-            params=params,
-            headers=headers
-        )
-        return data, status_code
+        return await self._get(AccountEndpoint.ACCOUNT_TYPES, offset=offset, limit=limit,
+                               sort_by=sort_by, sort_order=sort_order, filters=filters)
 
     async def get_account_type(self, type_id: str) -> tuple:
         """
@@ -144,16 +238,231 @@ class AsyncCRMClient(BaseCRMClient, AsyncCRMClientAPI):
         :param type_id: The ID of the account type to retrieve.
         :return: A list of account types with http status code.
         """
-        endpoint = self._build_endpoint_url(endpoint_template=AccountTypesEndpoint.ACCOUNT_TYPE,
-                                            values_to_inject={'type_id': type_id})
-        params = self._builder.build_main_payload()
-        headers = self._build_custom_client_origin(client_origin=self.__client_origin)
-        data, status_code = await self.__transport.send(
-            method=HTTPMethod.GET,
-            endpoint=endpoint,
-            params=params,
-            headers=headers)
-        return data, status_code
+        return await self._get(AccountTypesEndpoint.ACCOUNT_TYPE,
+                               values_to_inject={'type_id': type_id})
+
+    def aiter_accounts(self, filters: dict = None, page_size: int = 100,
+                       sort_by: str = 'name', sort_order: SortOrder = SortOrder.DESC,
+                       prefetch: int = 1, max_items: Optional[int] = None) -> AsyncIterator[Any]:
+        """
+        Asynchronously iterate over all accounts matching the filters, fetching pages on demand.
+        The next page is requested in the background while the current one is consumed.
+        :param filters: A dictionary containing the filters to apply (optional).
+        :param page_size: The number of accounts requested per page.
+        :param sort_by: The field to sort by, default is 'name'.
+        :param sort_order: The order of sorting, default is descending (DESC).
+        :param prefetch: The number of pages fetched ahead, 0 disables prefetching.
+        :param max_items: Maximum number of accounts to yield (optional).
+        :return: An async iterator over account records.
+        :raises CRMRequestError: If a page request fails.
+        """
+        return aiter_pages(
+            lambda offset, limit: self.get_accounts(filters=filters, offset=offset, limit=limit,
+                                                    sort_by=sort_by, sort_order=sort_order),
+            result_key=ResultKey.ACCOUNTS, page_size=page_size, prefetch=prefetch,
+            max_items=max_items)
+
+    def aiter_account_addresses(self, account_id: str, filters: dict = None,
+                                page_size: int = 100, sort_by: str = 'created',
+                                sort_order: SortOrder = SortOrder.DESC, prefetch: int = 1,
+                                max_items: Optional[int] = None) -> AsyncIterator[Any]:
+        """
+        Asynchronously iterate over all addresses of an account, fetching pages on demand.
+        The next page is requested in the background while the current one is consumed.
+        :param account_id: The ID of the account whose addresses are to be retrieved.
+        :param filters: A dictionary containing the filters to apply (optional).
+        :param page_size: The number of addresses requested per page.
+        :param sort_by: The field to sort by, default is 'created'.
+        :param sort_order: The order of sorting, default is descending (DESC).
+        :param prefetch: The number of pages fetched ahead, 0 disables prefetching.
+        :param max_items: Maximum number of addresses to yield (optional).
+        :return: An async iterator over address records.
+        :raises CRMRequestError: If a page request fails.
+        """
+        return aiter_pages(
+            lambda offset, limit: self.get_account_addresses(account_id=account_id, filters=filters,
+                                                             offset=offset, limit=limit,
+                                                             sort_by=sort_by,
+                                                             sort_order=sort_order),
+            result_key=ResultKey.ADDRESSES, page_size=page_size, prefetch=prefetch,
+            max_items=max_items)
+
+    def aiter_account_types(self, filters: dict = None, page_size: int = 100,
+                            sort_by: str = 'created', sort_order: SortOrder = SortOrder.DESC,
+                            prefetch: int = 1,
+                            max_items: Optional[int] = None) -> AsyncIterator[Any]:
+        """
+        Asynchronously iterate over all account types matching the filters.
+        The next page is requested in the background while the current one is consumed.
+        :param filters: A dictionary containing the filters to apply (optional).
+        :param page_size: The number of account types requested per page.
+        :param sort_by: The field to sort by, default is 'created'.
+        :param sort_order: The order of sorting, default is descending (DESC).
+        :param prefetch: The number of pages fetched ahead, 0 disables prefetching.
+        :param max_items: Maximum number of account types to yield (optional).
+        :return: An async iterator over account type records.
+        :raises CRMRequestError: If a page request fails.
+        """
+        return aiter_pages(
+            lambda offset, limit: self.get_account_types(filters=filters, offset=offset,
+                                                         limit=limit, sort_by=sort_by,
+                                                         sort_order=sort_order),
+            result_key=ResultKey.ACCOUNT_TYPES, page_size=page_size, prefetch=prefetch,
+            max_items=max_items)
+
+    def astream_accounts(self, filters: dict = None, offset=0, limit=1000,
+                         sort_by: str = 'name', sort_order: SortOrder = SortOrder.DESC,
+                         max_body_size: Optional[int] = None) -> AsyncIterator[Any]:
+        """
+        Asynchronously stream the accounts of one (large) page, decoding them one by one as
+        they arrive, so memory stays bounded by a single account instead of the whole page.
+        :param filters: A dictionary containing the filters to apply (optional).
+        :param offset: Starting point for pagination, default is 0.
+        :param limit: The number of accounts requested.
+        :param sort_by: The field to sort by, default is 'name'.
+        :param sort_order: The order of sorting, default is descending (DESC).
+        :param max_body_size: Maximum response size in bytes (optional).
+        :return: An async iterator over account records.
+        :raises CRMRequestError: If the request fails.
+        :raises CRMResponseTooLargeError: If the response exceeds ``max_body_size``.
+        """
+        return self._stream(AccountEndpoint.ACCOUNTS, ResultKey.ACCOUNTS,
+                            max_body_size=max_body_size, offset=offset, limit=limit,
+                            sort_by=sort_by, sort_order=sort_order, filters=filters)
+
+    def astream_account_addresses(self, account_id: str, filters: dict = None, offset=0,
+                                  limit=1000, sort_by: str = 'created',
+                                  sort_order: SortOrder = SortOrder.DESC,
+                                  max_body_size: Optional[int] = None) -> AsyncIterator[Any]:
+        """
+        Asynchronously stream the addresses of an account from one (large) page.
+        :param account_id: The ID of the account whose addresses are to be retrieved.
+        :param filters: A dictionary containing the filters to apply (optional).
+        :param offset: Starting point for pagination, default is 0.
+        :param limit: The number of addresses requested.
+        :param sort_by: The field to sort by, default is 'created'.
+        :param sort_order: The order of sorting, default is descending (DESC).
+        :param max_body_size: Maximum response size in bytes (optional).
+        :return: An async iterator over address records.
+        :raises CRMRequestError: If the request fails.
+        :raises CRMResponseTooLargeError: If the response exceeds ``max_body_size``.
+        """
+        return self._stream(AccountAddressEndpoint.ACCOUNT_ADDRESSES, ResultKey.ADDRESSES,
+                            values_to_inject={'account_id': account_id},
+                            max_body_size=max_body_size, offset=offset, limit=limit,
+                            sort_by=sort_by, sort_order=sort_order, filters=filters)
+
+    def account_loader(self, max_batch_size: int = 100, window: float = 0.0,
+                       id_filter: str = 'ids', separator: Optional[str] = ',',
+                       cache: bool = True) -> AccountLoader:
+        """
+        Create a loader batching the single-account lookups of a unit of work (e.g. a web
+        request) into ``get_accounts`` calls filtered on the account IDs.
+        :param max_batch_size: Maximum number of IDs per call; a full batch is sent at once.
+        :param window: Seconds to wait for more lookups before sending a batch; 0 sends it at
+                       the end of the current event loop tick.
+        :param id_filter: Name of the ``get_accounts`` filter taking the list of account IDs.
+        :param separator: Joins the IDs into one filter value; None sends them as a list.
+        :param cache: Remember successful lookups for the lifetime of the loader.
+        :return: An AccountLoader; ``await loader.load(account_id)`` replaces ``get_account``.
+        """
+        return AccountLoader(self, max_batch_size=max_batch_size, window=window,
+                             id_filter=id_filter, separator=separator, cache=cache,
+                             typed=self._response_models)
+
+    async def get_accounts_by_ids(self, account_ids: Iterable[str], concurrency: int = 10,
+                                  fatal_statuses: Collection[int] = DEFAULT_FATAL_STATUSES
+                                  ) -> List[BulkItemResult]:
+        """
+        Get many accounts by ID with at most ``concurrency`` requests in flight.
+        :param account_ids: The IDs of the accounts to retrieve.
+        :param concurrency: Maximum number of concurrent requests.
+        :param fatal_statuses: Status codes that cancel the outstanding lookups and raise.
+        :return: One BulkItemResult (data and http status code) per ID, in input order.
+        :raises CRMBulkOperationError: If a lookup returns one of the fatal status codes.
+        """
+        return await gather_bounded(lambda account_id: self.get_account(account_id=account_id),
+                                    account_ids, concurrency=concurrency,
+                                    fatal_statuses=fatal_statuses)
+
+    def aiter_accounts_by_ids(self, account_ids: Iterable[str], concurrency: int = 10,
+                              fatal_statuses: Collection[int] = DEFAULT_FATAL_STATUSES
+                              ) -> AsyncIterator[BulkItemResult]:
+        """
+        Get many accounts by ID with bounded concurrency, yielding results as they complete.
+        :param account_ids: The IDs of the accounts to retrieve.
+        :param concurrency: Maximum number of concurrent requests.
+        :param fatal_statuses: Status codes that cancel the outstanding lookups and raise.
+        :return: An async iterator of BulkItemResult in completion order.
+        :raises CRMBulkOperationError: If a lookup returns one of the fatal status codes.
+        """
+        return aiter_bounded(lambda account_id: self.get_account(account_id=account_id),
+                             account_ids, concurrency=concurrency, fatal_statuses=fatal_statuses)
+
+    async def get_account_addresses_by_ids(self, account_id: str, address_ids: Iterable[str],
+                                           concurrency: int = 10,
+                                           fatal_statuses: Collection[int] = DEFAULT_FATAL_STATUSES
+                                           ) -> List[BulkItemResult]:
+        """
+        Get many addresses of an account by ID with at most ``concurrency`` requests in flight.
+        :param account_id: The ID of the account the addresses belong to.
+        :param address_ids: The IDs of the addresses to retrieve.
+        :param concurrency: Maximum number of concurrent requests.
+        :param fatal_statuses: Status codes that cancel the outstanding lookups and raise.
+        :return: One BulkItemResult (data and http status code) per ID, in input order.
+        :raises CRMBulkOperationError: If a lookup returns one of the fatal status codes.
+        """
+        return await gather_bounded(
+            lambda address_id: self.get_account_address(account_id=account_id,
+                                                        address_id=address_id),
+            address_ids, concurrency=concurrency, fatal_statuses=fatal_statuses)
+
+    def aiter_account_addresses_by_ids(self, account_id: str, address_ids: Iterable[str],
+                                       concurrency: int = 10,
+                                       fatal_statuses: Collection[int] = DEFAULT_FATAL_STATUSES
+                                       ) -> AsyncIterator[BulkItemResult]:
+        """
+        Get many addresses of an account by ID, yielding results as they complete.
+        :param account_id: The ID of the account the addresses belong to.
+        :param address_ids: The IDs of the addresses to retrieve.
+        :param concurrency: Maximum number of concurrent requests.
+        :param fatal_statuses: Status codes that cancel the outstanding lookups and raise.
+        :return: An async iterator of BulkItemResult in completion order.
+        :raises CRMBulkOperationError: If a lookup returns one of the fatal status codes.
+        """
+        return aiter_bounded(
+            lambda address_id: self.get_account_address(account_id=account_id,
+                                                        address_id=address_id),
+            address_ids, concurrency=concurrency, fatal_statuses=fatal_statuses)
+
+    async def get_account_types_by_ids(self, type_ids: Iterable[str], concurrency: int = 10,
+                                       fatal_statuses: Collection[int] = DEFAULT_FATAL_STATUSES
+                                       ) -> List[BulkItemResult]:
+        """
+        Get many account types by ID with at most ``concurrency`` requests in flight.
+        :param type_ids: The IDs of the account types to retrieve.
+        :param concurrency: Maximum number of concurrent requests.
+        :param fatal_statuses: Status codes that cancel the outstanding lookups and raise.
+        :return: One BulkItemResult (data and http status code) per ID, in input order.
+        :raises CRMBulkOperationError: If a lookup returns one of the fatal status codes.
+        """
+        return await gather_bounded(lambda type_id: self.get_account_type(type_id=type_id),
+                                    type_ids, concurrency=concurrency,
+                                    fatal_statuses=fatal_statuses)
+
+    def aiter_account_types_by_ids(self, type_ids: Iterable[str], concurrency: int = 10,
+                                   fatal_statuses: Collection[int] = DEFAULT_FATAL_STATUSES
+                                   ) -> AsyncIterator[BulkItemResult]:
+        """
+        Get many account types by ID with bounded concurrency, yielding results as they complete.
+        :param type_ids: The IDs of the account types to retrieve.
+        :param concurrency: Maximum number of concurrent requests.
+        :param fatal_statuses: Status codes that cancel the outstanding lookups and raise.
+        :return: An async iterator of BulkItemResult in completion order.
+        :raises CRMBulkOperationError: If a lookup returns one of the fatal status codes.
+        """
+        return aiter_bounded(lambda type_id: self.get_account_type(type_id=type_id),
+                             type_ids, concurrency=concurrency, fatal_statuses=fatal_statuses)
 
     async def create_account(self, account_data: AccountRequestDTO) -> tuple:
         """
@@ -161,17 +470,50 @@ class AsyncCRMClient(BaseCRMClient, AsyncCRMClientAPI):
         :param account_data: An instance of AccountRequestDTO containing the account data to create.
         :return: A dictionary representing the created account data with http status code.
         """
+        started = time.perf_counter()
         endpoint = self._build_endpoint_url(AccountEndpoint.ACCOUNTS)
         meta = self._builder.build_main_payload()
         headers = self._build_custom_client_origin(client_origin=self.__client_origin)
         payload = {'account_data': {**account_data.model_dump()}, 'meta': meta}
-        logger.debug(f'[create_account] Sending request to create account with data: {payload}')
-        data, status_code = self.__transport.send(
-            method=HTTPMethod.POST,
-            endpoint=endpoint,
-            payload=payload,
-            headers=headers
-        )
-        logger.debug(f'[create_account] Received response: {data} with status code: {status_code}')
+        sampled = sample_bodies()
+        if sampled:
+            log_request('create_account', AccountEndpoint.ACCOUNTS, payload)
+        if not await self.__acquire_rate_limit(AccountEndpoint.ACCOUNTS):
+            return self._rate_limited()
+        with self._hooks_scope(started):
+            data, status_code = await self.__transport.send(
+                method=HTTPMethod.POST,
+                endpoint=endpoint,
+                payload=payload,
+                headers=headers,
+                route=AccountEndpoint.ACCOUNTS
+            )
+        log_response('create_account', AccountEndpoint.ACCOUNTS, status_code,
+                     time.perf_counter() - started, data, sampled)
+        if self._cache is not None and 200 <= int(status_code) < 300:
+            self._cache.invalidate(AccountEndpoint.ACCOUNTS)
         return data, status_code
 
+    async def create_accounts(self, accounts: Iterable[Union[AccountRequestDTO, dict]],
+                              concurrency: int = 10,
+                              fatal_statuses: Collection[int] = DEFAULT_FATAL_STATUSES
+                              ) -> BulkReport:
+        """
+        Create many CRM accounts, validating and dispatching them with bounded concurrency.
+        Items that fail validation are reported without being sent.
+        :param accounts: AccountRequestDTO instances or dictionaries with the account fields.
+        :param concurrency: Maximum number of concurrent create requests.
+        :param fatal_statuses: Status codes that cancel the outstanding requests and raise.
+        :return: A BulkReport with the successes and failures keyed by input index.
+        :raises CRMBulkOperationError: If a request returns one of the fatal status codes.
+        """
+        started = time.perf_counter()
+        results = await gather_bounded(self._create_account_item, accounts,
+                                       concurrency=concurrency, fatal_statuses=fatal_statuses)
+        return BulkReport(results=results, elapsed=time.perf_counter() - started)
+
+    async def _create_account_item(self, account_data: Union[AccountRequestDTO, dict]) -> tuple:
+        account_dto, error = self._validate_account_data(account_data)
+        if error:
+            return error
+        return await self.create_account(account_dto)
@@ -1,8 +1,40 @@
 """
 Base class for CRM HTTP clients.
 """
+from contextlib import nullcontext
+from http import HTTPStatus
+from enum import Enum
+from typing import ContextManager, Dict, Optional, Tuple, Type, Union
+from pydantic import BaseModel, ValidationError
 from ds_crm_sdk.payloads import PayloadBuilder
 from ds_crm_sdk.constants import ClientOrigin
+from ds_crm_sdk.dtos import AccountRequestDTO
+from ds_crm_sdk.dtos.responses import (AccountDTO, AccountResponse, AccountsPage, AccountTypeDTO,
+                                       AccountTypeResponse, AccountTypesPage, AddressDTO,
+                                       AddressesPage, AddressResponse)
+from ds_crm_sdk.transports.http.hooks import RequestHooks, client_hooks
+from ds_crm_sdk.transports.http.ratelimit import RATE_LIMITED_ERROR, RateLimiter
+from .cache import ResponseCache
+from .coalesce import RequestCoalescer
+from .hedge import RequestHedger
+from .endpoints import AccountEndpoint, AccountAddressEndpoint, AccountTypesEndpoint, ResultKey
+
+RESPONSE_MODELS: Dict[str, Type[BaseModel]] = {
+    AccountEndpoint.SPECIFIC_ACCOUNT.value: AccountResponse,
+    AccountEndpoint.ACCOUNTS.value: AccountsPage,
+    AccountAddressEndpoint.ACCOUNT_ADDRESSES.value: AddressesPage,
+    AccountAddressEndpoint.ACCOUNT_ADDRESS.value: AddressResponse,
+    AccountTypesEndpoint.ACCOUNT_TYPES.value: AccountTypesPage,
+    AccountTypesEndpoint.ACCOUNT_TYPE.value: AccountTypeResponse,
+}
+
+ITEM_MODELS: Dict[str, Type[BaseModel]] = {
+    ResultKey.ACCOUNTS.value: AccountDTO,
+    ResultKey.ADDRESSES.value: AddressDTO,
+    ResultKey.ACCOUNT_TYPES.value: AccountTypeDTO,
+}
+
+_NO_HOOKS = nullcontext()
 
 
 class BaseCRMClient:
@@ -11,9 +43,50 @@ class BaseCRMClient:
     This class should be extended by specific CRM clients to implement the required methods.
     """
 
-    def __init__(self, builder: PayloadBuilder, base_url: str):
+    def __init__(self, builder: PayloadBuilder, base_url: str,
+                 cache: Optional[ResponseCache] = None,
+                 coalescer: Optional[RequestCoalescer] = None,
+                 rate_limiter: Optional[RateLimiter] = None, response_models: bool = False,
+                 hooks: Optional[RequestHooks] = None, hedger: Optional[RequestHedger] = None):
         self._builder = builder
         self._base_url = base_url
+        self._cache = cache
+        self._coalescer = coalescer
+        self._rate_limiter = rate_limiter
+        self._response_models = response_models
+        self._hooks = hooks
+        self._hedger = hedger
+
+    @property
+    def cache(self) -> Optional[ResponseCache]:
+        """
+        The response cache of the client, if caching is enabled.
+        """
+        return self._cache
+
+    @property
+    def coalescer(self) -> Optional[RequestCoalescer]:
+        """
+        The coalescer of identical in-flight GET requests, if coalescing is enabled.
+        """
+        return self._coalescer
+
+    @property
+    def hedger(self) -> Optional[RequestHedger]:
+        """
+        The hedger of slow GET requests, if hedging is enabled.
+        """
+        return self._hedger
+
+    def _hooks_scope(self, started: float) -> ContextManager:
+        """
+        Context in which the transport also reports requests to the client's hooks.
+        :param started: ``time.perf_counter()`` when the call started, to time its build phase.
+        :return: A context manager (a no-op one when the client has no hooks).
+        """
+        if self._hooks is None:
+            return _NO_HOOKS
+        return client_hooks(self._hooks, started)
 
     def _build_endpoint_url(self, endpoint_template: str, values_to_inject: dict = None) -> str:
         """
@@ -34,6 +107,58 @@ class BaseCRMClient:
         """
         return self._builder.build_main_payload(**extra)
 
+    def _cache_key(self, endpoint_template: str, endpoint: str, params: dict) -> Optional[tuple]:
+        """
+        Build the response cache key of a GET request.
+        :param endpoint_template: The endpoint template of the request.
+        :param endpoint: The full endpoint URL.
+        :param params: The params built for the request.
+        :return: The cache key, or None when responses of this endpoint are not cached.
+        """
+        if self._cache is None or self._cache.ttl_for(endpoint_template) is None:
+            return None
+        return self._cache.make_key(endpoint_template, endpoint, params,
+                                    self._response_model(endpoint_template))
+
+    def _response_model(self, endpoint_template: str) -> Optional[Type[BaseModel]]:
+        """
+        Get the typed response model of a GET endpoint.
+        :param endpoint_template: The endpoint template of the request.
+        :return: The response model, or None when responses are returned as dictionaries.
+        """
+        if not self._response_models:
+            return None
+        if isinstance(endpoint_template, Enum):
+            endpoint_template = endpoint_template.value
+        return RESPONSE_MODELS.get(endpoint_template)
+
+    def _cache_response(self, key: tuple, response: tuple) -> None:
+        """
+        Cache a GET response if it was successful.
+        :param key: The cache key from ``_cache_key``.
+        :param response: Tuple of data and http status code.
+        """
+        if 200 <= int(response[1]) < 300:
+            self._cache.store(key, response)
+
+    def _item_model(self, result_key: str) -> Optional[Type[BaseModel]]:
+        """
+        Get the typed model of the records streamed from a list endpoint.
+        :param result_key: Key holding the records in the response.
+        :return: The record model, or None when records are returned as dictionaries.
+        """
+        if not self._response_models:
+            return None
+        return ITEM_MODELS.get(result_key.value if isinstance(result_key, Enum) else result_key)
+
+    @staticmethod
+    def _rate_limited() -> tuple:
+        """
+        Result of a request rejected by the client's rate limiter.
+        :return: Error data with http status code 429.
+        """
+        return {'error': RATE_LIMITED_ERROR}, HTTPStatus.TOO_MANY_REQUESTS
+
     @staticmethod
     def _build_custom_client_origin(client_origin: ClientOrigin) -> dict:
         """
@@ -42,3 +167,19 @@ class BaseCRMClient:
         :return: A dictionary containing the client origin.
         """
         return {'X-Client-Origin': client_origin} if client_origin else {}
+
+    @staticmethod
+    def _validate_account_data(account_data: Union[AccountRequestDTO, dict]
+                               ) -> Tuple[Optional[AccountRequestDTO], Optional[tuple]]:
+        """
+        Validate the account data of a bulk create item.
+        :param account_data: An AccountRequestDTO or a dictionary with the account fields.
+        :return: Tuple of the validated DTO and, when validation fails instead,
+                 the error data with http status code to report for the item.
+        """
+        if isinstance(account_data, AccountRequestDTO):
+            return account_data, None
+        try:
+            return AccountRequestDTO.model_validate(account_data), None
+        except ValidationError as e:
+            return None, ({'error': str(e)}, HTTPStatus.UNPROCESSABLE_ENTITY)
@@ -0,0 +1,227 @@
+"""
+Bounded-concurrency helpers for running many CRM calls at once.
+"""
+import asyncio
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from typing import (Any, AsyncIterator, Awaitable, Callable, Collection, Dict, Iterable, List,
+                    Optional, Tuple)
+from ds_crm_sdk.exceptions import CRMBulkCancelledError, CRMBulkOperationError
+
+DEFAULT_FATAL_STATUSES = frozenset({HTTPStatus.UNAUTHORIZED, HTTPStatus.FORBIDDEN})
+
+ItemCall = Callable[[Any], Tuple[Any, int]]
+AsyncItemCall = Callable[[Any], Awaitable[Tuple[Any, int]]]
+
+
+@dataclass
+class BulkItemResult:
+    """
+    Outcome of a single item of a bulk operation.
+    """
+    index: int
+    key: Any
+    data: Any
+    status_code: int
+
+    @property
+    def ok(self) -> bool:
+        """
+        Whether the call for this item returned a successful (2xx) status code.
+        """
+        return 200 <= int(self.status_code) < 300
+
+
+@dataclass
+class BulkReport:
+    """
+    Structured outcome of a bulk write, keyed by the index of each input item.
+    """
+    results: List[BulkItemResult] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def succeeded(self) -> Dict[int, BulkItemResult]:
+        """
+        Results of the items that returned a successful status code, keyed by input index.
+        """
+        return {result.index: result for result in self.results if result.ok}
+
+    @property
+    def failed(self) -> Dict[int, BulkItemResult]:
+        """
+        Results of the items that failed validation or returned an error, keyed by input index.
+        """
+        return {result.index: result for result in self.results if not result.ok}
+
+    @property
+    def throughput(self) -> float:
+        """
+        Items processed per second.
+        """
+        return len(self.results) / self.elapsed if self.elapsed else 0.0
+
+
+_WORKER_DONE = object()
+_CANCEL_POLL_INTERVAL = 0.05
+
+
+async def aiter_bounded(call: AsyncItemCall, keys: Iterable[Any], concurrency: int = 10,
+                        fatal_statuses: Collection[int] = DEFAULT_FATAL_STATUSES
+                        ) -> AsyncIterator[BulkItemResult]:
+    """
+    Run ``call`` for every key on a pool of ``concurrency`` workers and yield results as they
+    complete. Keys are pulled lazily, so at most ``concurrency`` calls are in flight at a time.
+    :param call: Coroutine function taking a key and returning (data, status_code).
+    :param keys: The keys to process.
+    :param concurrency: Maximum number of calls in flight.
+    :param fatal_statuses: Status codes that abort the whole operation.
+    :return: An async iterator of BulkItemResult in completion order.
+    :raises CRMBulkOperationError: If an item returns one of the fatal status codes.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    items = enumerate(keys)
+    results: asyncio.Queue = asyncio.Queue()
+
+    async def worker():
+        try:
+            for index, key in items:
+                data, status_code = await call(key)
+                results.put_nowait(BulkItemResult(index=index, key=key, data=data,
+                                                  status_code=status_code))
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            results.put_nowait(e)
+        finally:
+            results.put_nowait(_WORKER_DONE)
+
+    workers = [asyncio.ensure_future(worker()) for _ in range(concurrency)]
+    try:
+        running = len(workers)
+        while running:
+            result = await results.get()
+            if result is _WORKER_DONE:
+                running -= 1
+                continue
+            if isinstance(result, Exception):
+                raise result
+            if result.status_code in fatal_statuses:
+                raise CRMBulkOperationError(result)
+            yield result
+    finally:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+
+async def gather_bounded(call: AsyncItemCall, keys: Iterable[Any], concurrency: int = 10,
+                         fatal_statuses: Collection[int] = DEFAULT_FATAL_STATUSES
+                         ) -> List[BulkItemResult]:
+    """
+    Run ``call`` for every key with bounded concurrency and return the results in input order.
+    :param call: Coroutine function taking a key and returning (data, status_code).
+    :param keys: The keys to process.
+    :param concurrency: Maximum number of calls in flight.
+    :param fatal_statuses: Status codes that abort the whole operation.
+    :return: List of BulkItemResult, one per key, in the order of ``keys``.
+    :raises CRMBulkOperationError: If an item returns one of the fatal status codes.
+    """
+    results = []
+    try:
+        async for result in aiter_bounded(call, keys, concurrency=concurrency,
+                                          fatal_statuses=fatal_statuses):
+            results.append(result)
+    except CRMBulkOperationError as e:
+        e.completed = sorted(results, key=lambda result: result.index)
+        raise
+    results.sort(key=lambda result: result.index)
+    return results
+
+
+def gather_bounded_threads(call: ItemCall, keys: Iterable[Any], concurrency: int = 10,
+                           fatal_statuses: Collection[int] = DEFAULT_FATAL_STATUSES,
+                           executor: ThreadPoolExecutor = None, timeout: Optional[float] = None,
+                           cancel: Optional[threading.Event] = None) -> List[BulkItemResult]:
+    """
+    Run ``call`` for every key on worker threads with bounded concurrency and return the
+    results in input order. Keys are submitted lazily as earlier calls complete.
+    :param call: Callable taking a key and returning (data, status_code).
+    :param keys: The keys to process.
+    :param concurrency: Maximum number of calls in flight.
+    :param fatal_statuses: Status codes that abort the whole operation.
+    :param executor: Executor to run the calls on; a temporary one is created when not given.
+    :param timeout: Seconds to wait for each call from its submission; a call that takes longer
+                    is reported with status 504 and its result is discarded (a running thread
+                    cannot be interrupted, so it still completes in the background).
+    :param cancel: Event that, once set, cancels the calls not started yet and raises.
+    :return: List of BulkItemResult, one per key, in the order of ``keys``.
+    :raises CRMBulkOperationError: If an item returns one of the fatal status codes.
+    :raises CRMBulkCancelledError: If ``cancel`` is set before every call completed.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    if executor is None:
+        own_executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='ds-crm-bulk')
+        try:
+            return gather_bounded_threads(call, keys, concurrency=concurrency,
+                                          fatal_statuses=fatal_statuses, executor=own_executor,
+                                          timeout=timeout, cancel=cancel)
+        finally:
+            # Do not wait for the calls that timed out.
+            own_executor.shutdown(wait=timeout is None)
+    items = enumerate(keys)
+    pending = {}
+    deadlines = {}
+    results = []
+
+    def submit_next() -> None:
+        item = next(items, None)
+        if item is not None:
+            future = executor.submit(call, item[1])
+            pending[future] = item
+            if timeout is not None:
+                deadlines[future] = time.monotonic() + timeout
+
+    def finish(result: BulkItemResult) -> None:
+        if result.status_code in fatal_statuses:
+            raise CRMBulkOperationError(
+                result, completed=sorted(results, key=lambda item: item.index))
+        results.append(result)
+        submit_next()
+
+    try:
+        for _ in range(concurrency):
+            if cancel is not None and cancel.is_set():
+                break
+            submit_next()
+        while pending:
+            if cancel is not None and cancel.is_set():
+                raise CRMBulkCancelledError(sorted(results, key=lambda item: item.index))
+            wait_for = _CANCEL_POLL_INTERVAL if cancel is not None else None
+            if deadlines:
+                remaining = max(min(deadlines.values()) - time.monotonic(), 0)
+                wait_for = remaining if wait_for is None else min(wait_for, remaining)
+            done, _ = wait(pending, timeout=wait_for, return_when=FIRST_COMPLETED)
+            for future in done:
+                index, key = pending.pop(future)
+                deadlines.pop(future, None)
+                data, status_code = future.result()
+                finish(BulkItemResult(index=index, key=key, data=data, status_code=status_code))
+            now = time.monotonic()
+            for future in [future for future, deadline in deadlines.items() if deadline <= now]:
+                index, key = pending.pop(future)
+                del deadlines[future]
+                future.cancel()
+                finish(BulkItemResult(index=index, key=key,
+                                      data={'error': f'Call timed out after {timeout}s'},
+                                      status_code=HTTPStatus.GATEWAY_TIMEOUT))
+    finally:
+        for future in pending:
+            future.cancel()
+    if cancel is not None and cancel.is_set() and next(items, None) is not None:
+        raise CRMBulkCancelledError(sorted(results, key=lambda item: item.index))
+    results.sort(key=lambda result: result.index)
+    return results
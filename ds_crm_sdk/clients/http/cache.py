@@ -0,0 +1,168 @@
+"""
+Opt-in TTL/LRU response cache for CRM read endpoints.
+"""
+import threading
+import time
+from collections import OrderedDict
+from enum import Enum
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+from ds_crm_sdk.utils import freeze
+
+FRESH = 'fresh'
+STALE = 'stale'
+
+
+def _template_key(endpoint_template: str) -> str:
+    """
+    Normalise an endpoint template (plain string or endpoint Enum member) to its string value.
+    Endpoint enums hash by member name, so they can't be used as dict keys next to plain strings.
+    """
+    return endpoint_template.value if isinstance(endpoint_template, Enum) else endpoint_template
+
+
+class ResponseCache:
+    """
+    In-memory cache of successful GET responses with per-endpoint TTL and LRU eviction.
+
+    Only endpoint templates with a TTL (``ttls`` or ``default_ttl``) are cached. Entries past
+    their TTL but within ``stale_ttl`` are served stale while the client refreshes them in the
+    background. The cache is thread-safe and can be shared between sync and async clients.
+    """
+
+    def __init__(self, ttls: Optional[Dict[str, float]] = None, default_ttl: Optional[float] = None,
+                 maxsize: int = 1024, stale_ttl: float = 0.0,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize the cache.
+        :param ttls: Seconds to keep responses for, keyed by endpoint template.
+        :param default_ttl: TTL for endpoint templates not listed in ``ttls`` (None disables them).
+        :param maxsize: Maximum number of cached responses; least recently used ones are evicted.
+        :param stale_ttl: Seconds an expired response may still be served while it is refreshed.
+        :param clock: Monotonic clock, mainly for tests.
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self._ttls = {_template_key(template): ttl for template, ttl in (ttls or {}).items()}
+        self._default_ttl = default_ttl
+        self._maxsize = maxsize
+        self._stale_ttl = stale_ttl
+        self._clock = clock
+        self._entries: 'OrderedDict[tuple, Tuple[Any, float, str]]' = OrderedDict()
+        self._refreshing = set()
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'stale_hits': 0, 'misses': 0, 'evictions': 0,
+                       'refreshes': 0, 'invalidations': 0}
+
+    def ttl_for(self, endpoint_template: str) -> Optional[float]:
+        """
+        TTL configured for an endpoint template.
+        :param endpoint_template: The endpoint template of the request.
+        :return: The TTL in seconds, or None when responses of this endpoint are not cached.
+        """
+        return self._ttls.get(_template_key(endpoint_template), self._default_ttl)
+
+    @staticmethod
+    def make_key(endpoint_template: str, endpoint: str, params: Optional[dict],
+                 variant: Hashable = None) -> tuple:
+        """
+        Build the cache key of a request from its endpoint and built params.
+        :param endpoint_template: The endpoint template of the request.
+        :param endpoint: The full endpoint URL.
+        :param params: The params built for the request.
+        :param variant: Distinguishes decodings of the same request (e.g. the response model).
+        :return: A hashable cache key.
+        """
+        return _template_key(endpoint_template), endpoint, freeze(params or {}), variant
+
+    def lookup(self, key: tuple) -> Tuple[Optional[str], Any]:
+        """
+        Look up a cached response.
+        :param key: The cache key from ``make_key``.
+        :return: Tuple of the entry state (FRESH, STALE or None on a miss) and the cached value.
+        """
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires_at, _ = entry
+                if now < expires_at:
+                    self._entries.move_to_end(key)
+                    self._stats['hits'] += 1
+                    return FRESH, value
+                if now < expires_at + self._stale_ttl:
+                    self._entries.move_to_end(key)
+                    self._stats['stale_hits'] += 1
+                    return STALE, value
+                del self._entries[key]
+            self._stats['misses'] += 1
+            return None, None
+
+    def store(self, key: tuple, value: Any) -> None:
+        """
+        Cache a response, evicting the least recently used entries beyond ``maxsize``.
+        :param key: The cache key from ``make_key``.
+        :param value: The response to cache, a tuple of data and http status code.
+        """
+        ttl = self.ttl_for(key[0])
+        if ttl is None:
+            return
+        with self._lock:
+            self._entries[key] = (value, self._clock() + ttl, key[0])
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+                self._stats['evictions'] += 1
+
+    def begin_refresh(self, key: tuple) -> bool:
+        """
+        Claim the background refresh of a stale entry.
+        :param key: The cache key from ``make_key``.
+        :return: True if the caller should refresh the entry, False if a refresh is running.
+        """
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            self._stats['refreshes'] += 1
+            return True
+
+    def end_refresh(self, key: tuple) -> None:
+        """
+        Release the refresh claimed with ``begin_refresh``.
+        :param key: The cache key from ``make_key``.
+        """
+        with self._lock:
+            self._refreshing.discard(key)
+
+    def invalidate(self, endpoint_template: Optional[str] = None) -> int:
+        """
+        Drop cached responses.
+        :param endpoint_template: Only drop responses of this endpoint template (all when None).
+        :return: The number of dropped responses.
+        """
+        template = _template_key(endpoint_template) if endpoint_template is not None else None
+        with self._lock:
+            if template is None:
+                dropped = len(self._entries)
+                self._entries.clear()
+            else:
+                keys = [key for key, entry in self._entries.items() if entry[2] == template]
+                for key in keys:
+                    del self._entries[key]
+                dropped = len(keys)
+            self._stats['invalidations'] += dropped
+            return dropped
+
+    def clear(self) -> None:
+        """
+        Drop every cached response.
+        """
+        self.invalidate()
+
+    def stats(self) -> dict:
+        """
+        Snapshot of the cache counters.
+        :return: Dict with hits, stale hits, misses, evictions, refreshes, invalidations and size.
+        """
+        with self._lock:
+            return {**self._stats, 'size': len(self._entries), 'maxsize': self._maxsize}
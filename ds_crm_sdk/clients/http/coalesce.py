@@ -0,0 +1,114 @@
+"""
+Single-flight coalescing of identical in-flight CRM reads.
+"""
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+from ds_crm_sdk.utils import freeze
+
+
+class _Call:
+    """
+    An in-flight call shared by the threads that asked for the same key.
+    """
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class RequestCoalescer:
+    """
+    Collapse identical concurrent GET requests into one call to the transport.
+
+    The first caller for a key (the leader) sends the request; callers arriving while it is in
+    flight wait for and share its result instead of sending their own. Nothing is kept once the
+    call completes, so this only flattens concurrent bursts (e.g. after a cache entry expires).
+    ``do`` serves sync clients (threads), ``ado`` async clients; both share the same counters.
+    """
+
+    def __init__(self):
+        self._calls: Dict[tuple, _Call] = {}
+        self._tasks: Dict[tuple, asyncio.Future] = {}
+        self._lock = threading.Lock()
+        self._stats = {'calls': 0, 'collapsed': 0}
+
+    @staticmethod
+    def make_key(endpoint: str, params: Optional[dict], headers: Optional[dict],
+                 variant: Hashable = None) -> tuple:
+        """
+        Build the key of a request from its endpoint, params and headers (client origin).
+        :param endpoint: The full endpoint URL.
+        :param params: The params built for the request.
+        :param headers: The custom headers of the request.
+        :param variant: Distinguishes decodings of the same request (e.g. the response model).
+        :return: A hashable key.
+        """
+        return endpoint, freeze(params or {}), freeze(headers or {}), variant
+
+    def do(self, key: tuple, call: Callable[[], Any]) -> Any:
+        """
+        Run ``call`` unless an identical call is already in flight, in which case wait for it.
+        :param key: The request key from ``make_key``.
+        :param call: Callable sending the request.
+        :return: The result of the (shared) call.
+        :raises Exception: Whatever the shared call raised.
+        """
+        with self._lock:
+            shared = self._calls.get(key)
+            if shared is None:
+                shared = self._calls[key] = _Call()
+                self._stats['calls'] += 1
+                leader = True
+            else:
+                self._stats['collapsed'] += 1
+                leader = False
+        if not leader:
+            shared.done.wait()
+            if shared.error is not None:
+                raise shared.error
+            return shared.result
+        try:
+            shared.result = call()
+            return shared.result
+        except BaseException as e:
+            shared.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            shared.done.set()
+
+    async def ado(self, key: tuple, call: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Await ``call`` unless an identical call is already in flight, in which case await it.
+        The shared call keeps running if one of its waiters is cancelled.
+        :param key: The request key from ``make_key``.
+        :param call: Coroutine function sending the request.
+        :return: The result of the (shared) call.
+        :raises Exception: Whatever the shared call raised.
+        """
+        task_key = (id(asyncio.get_running_loop()), key)
+        with self._lock:
+            task = self._tasks.get(task_key)
+            if task is None:
+                task = self._tasks[task_key] = asyncio.ensure_future(call())
+                task.add_done_callback(lambda _: self._forget(task_key))
+                self._stats['calls'] += 1
+            else:
+                self._stats['collapsed'] += 1
+        return await asyncio.shield(task)
+
+    def _forget(self, task_key: tuple) -> None:
+        with self._lock:
+            self._tasks.pop(task_key, None)
+
+    def stats(self) -> dict:
+        """
+        Snapshot of the coalescing counters.
+        :return: Dict with calls sent, calls collapsed into an in-flight one and calls in flight.
+        """
+        with self._lock:
+            return {**self._stats, 'in_flight': len(self._calls) + len(self._tasks)}
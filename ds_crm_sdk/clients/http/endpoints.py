@@ -29,3 +29,10 @@ class AccountTypesEndpoint(str, Enum):
     ACCOUNT_TYPE = "/api/crm/account_types/{type_id}"
 
 
+class ResultKey(str, Enum):
+    """
+    Keys holding the list of records in paginated responses.
+    """
+    ACCOUNTS = "accounts"
+    ADDRESSES = "addresses"
+    ACCOUNT_TYPES = "account_types"
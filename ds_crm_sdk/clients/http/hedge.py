@@ -0,0 +1,237 @@
+"""
+Hedged requests: a duplicate of a slow idempotent read is sent and the first response wins.
+"""
+import asyncio
+import contextvars
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple
+from ds_crm_sdk.transports.http.retry import RetryBudget
+
+Response = Tuple[Any, int]
+
+
+def _settled(response: Response) -> bool:
+    """
+    Whether a response can win the race; server errors and throttling leave the other request
+    a chance to succeed.
+    """
+    status_code = int(response[1])
+    return status_code < 500 and status_code != 429
+
+
+class _LatencyWindow:
+    """
+    Latencies of the latest responses of a route, with a cached percentile; only updated under
+    the hedger lock.
+    """
+    __slots__ = ('samples', 'value', 'stale')
+
+    def __init__(self, size: int):
+        self.samples: Deque[float] = deque(maxlen=size)
+        self.value: Optional[float] = None
+        self.stale = 0
+
+    def record(self, latency: float, percentile: float, min_samples: int) -> None:
+        """
+        Add a latency, refreshing the cached percentile every few samples.
+        """
+        self.samples.append(latency)
+        self.stale += 1
+        # Sorting the window on every response would cost more than the hedges save
+        if len(self.samples) >= min_samples and (self.value is None
+                                                 or self.stale >= _RECOMPUTE_EVERY):
+            ordered = sorted(self.samples)
+            self.value = ordered[min(int(len(ordered) * percentile), len(ordered) - 1)]
+            self.stale = 0
+
+
+_RECOMPUTE_EVERY = 16
+
+
+def _start_thread(call: Callable[[], Response]) -> Future:
+    """
+    Run ``call`` on a new daemon thread, in a copy of the current context.
+    :return: A future of the response.
+    """
+    future: Future = Future()
+    context = contextvars.copy_context()
+
+    def run() -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(context.run(call))
+        except BaseException as e:  # pylint: disable=broad-exception-caught
+            future.set_exception(e)
+
+    threading.Thread(target=run, name='ds-crm-hedge-request', daemon=True).start()
+    return future
+
+
+class RequestHedger:
+    """
+    Send a second copy of a GET request that is slower than usual and keep the first response.
+
+    The hedge is sent after a fixed ``delay`` or, by default, once the request has taken longer
+    than the observed ``percentile`` of the latest responses of its endpoint template (no hedge
+    is sent until ``min_samples`` responses were seen). A response with a 5xx or 429 status only
+    wins if the other request fails as well. Hedges are capped by a RetryBudget, so they add at
+    most ``budget`` extra load. Use it for idempotent reads only; clients apply it to GETs.
+
+    ``ado`` serves async clients: the losing request is cancelled. ``do`` serves sync clients:
+    the request runs on a thread of its own, so it never queues behind other requests, and the
+    hedge on a thread pool owned by the hedger. A running request cannot be interrupted there,
+    so the loser completes in the background and its response is dropped.
+    """
+
+    def __init__(self, delay: Optional[float] = None, percentile: float = 0.95,
+                 min_samples: int = 20, window: int = 1000, budget: float = 0.05,
+                 max_workers: int = 10):
+        """
+        Initialize the hedger.
+        :param delay: Seconds after which a hedge is sent; the observed percentile when None.
+        :param percentile: Latency percentile (0-1) of a route after which a hedge is sent.
+        :param min_samples: Responses of a route to observe before hedging on its percentile.
+        :param window: Number of latest responses per route the percentile is computed over.
+        :param budget: Hedges allowed per request, e.g. 0.05 caps the extra load at 5%.
+        :param max_workers: Threads running the hedges of sync clients, created on first use.
+        """
+        if delay is not None and delay < 0:
+            raise ValueError("delay must be non-negative")
+        if not 0 < percentile < 1:
+            raise ValueError("percentile must be between 0 and 1")
+        self._delay = delay
+        self._percentile = percentile
+        self._min_samples = min_samples
+        self._window = window
+        self._budget = RetryBudget(ratio=budget, min_tokens=1, max_tokens=max(1.0, budget * 100))
+        self._max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._latencies: Dict[str, _LatencyWindow] = {}
+        self._lock = threading.Lock()
+        self._stats = {'requests': 0, 'hedged': 0, 'hedge_wins': 0, 'rejected': 0}
+
+    def delay_for(self, route: Any) -> Optional[float]:
+        """
+        Seconds after which a request to a route is hedged.
+        :param route: The endpoint template of the request.
+        :return: The delay, or None while too few responses of the route were observed.
+        """
+        if self._delay is not None:
+            return self._delay
+        latencies = self._latencies.get(getattr(route, 'value', route))
+        return latencies.value if latencies is not None else None
+
+    def do(self, route: Any, call: Callable[[], Response]) -> Response:
+        """
+        Run ``call``, sending a second one on the hedger's threads if the first is slow.
+        :param route: The endpoint template of the request, keying the observed latencies.
+        :param call: Callable sending the request and returning (data, status_code).
+        :return: The winning (data, status_code).
+        """
+        started = self._begin()
+        delay = self.delay_for(route)
+        if delay is None:
+            # Nothing can be hedged yet, so the request is sent from the calling thread
+            return self._finish(route, started, call(), hedge=False)
+        primary = _start_thread(call)
+        racing: List[Future] = [primary]
+        try:
+            if wait(racing, timeout=delay)[0] or not self._withdraw():
+                return self._finish(route, started, primary.result(), hedge=False)
+            racing.append(self._get_executor().submit(contextvars.copy_context().run, call))
+            while True:
+                done, _ = wait(racing, return_when=FIRST_COMPLETED)
+                winner = next(iter(done))
+                racing.remove(winner)
+                response = winner.result()
+                if not racing or _settled(response):
+                    return self._finish(route, started, response, hedge=winner is not primary)
+        finally:
+            for future in racing:
+                future.cancel()
+
+    async def ado(self, route: Any, call: Callable[[], Awaitable[Response]]) -> Response:
+        """
+        Await ``call``, sending a second one if the first is slow and cancelling the loser.
+        :param route: The endpoint template of the request, keying the observed latencies.
+        :param call: Coroutine function sending the request and returning (data, status_code).
+        :return: The winning (data, status_code).
+        """
+        started = self._begin()
+        delay = self.delay_for(route)
+        primary = asyncio.ensure_future(call())
+        racing = {primary}
+        try:
+            if (await asyncio.wait(racing, timeout=delay))[0] or not self._withdraw():
+                return self._finish(route, started, await primary, hedge=False)
+            racing.add(asyncio.ensure_future(call()))
+            while True:
+                done, _ = await asyncio.wait(racing, return_when=asyncio.FIRST_COMPLETED)
+                winner = done.pop()
+                racing.discard(winner)
+                response = winner.result()
+                if not racing or _settled(response):
+                    return self._finish(route, started, response, hedge=winner is not primary)
+        finally:
+            for task in racing:
+                task.cancel()
+            if racing:
+                await asyncio.gather(*racing, return_exceptions=True)
+
+    def stats(self) -> dict:
+        """
+        Snapshot of the hedging counters.
+        :return: Dict with requests, hedges sent, hedges whose response won, hedges rejected by
+                 the budget and the current hedge delay per route.
+        """
+        with self._lock:
+            return {**self._stats, 'delays': {route: {'delay': latencies.value}
+                                              for route, latencies in self._latencies.items()
+                                              if latencies.value is not None}}
+
+    def close(self) -> None:
+        """
+        Shut down the threads of sync clients once their requests are done.
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def _begin(self) -> float:
+        self._budget.deposit()
+        with self._lock:
+            self._stats['requests'] += 1
+        return time.perf_counter()
+
+    def _withdraw(self) -> bool:
+        allowed = self._budget.withdraw()
+        with self._lock:
+            self._stats['hedged' if allowed else 'rejected'] += 1
+        return allowed
+
+    def _finish(self, route: Any, started: float, response: Response, hedge: bool) -> Response:
+        latency = time.perf_counter() - started
+        key = getattr(route, 'value', route)
+        with self._lock:
+            latencies = self._latencies.get(key)
+            if latencies is None:
+                latencies = self._latencies[key] = _LatencyWindow(self._window)
+            latencies.record(latency, self._percentile, self._min_samples)
+            if hedge:
+                self._stats['hedge_wins'] += 1
+        return response
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        executor = self._executor
+        if executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=self._max_workers,
+                                                        thread_name_prefix='ds-crm-hedge')
+                executor = self._executor
+        return executor
@@ -0,0 +1,187 @@
+"""
+DataLoader-style batching of single-account lookups of the async client.
+"""
+import asyncio
+from http import HTTPStatus
+from typing import Any, Dict, Iterable, List, Optional, TYPE_CHECKING
+from ds_crm_sdk.dtos.responses import AccountResponse
+
+if TYPE_CHECKING:
+    from .async_crm_client import AsyncCRMClient
+
+
+class AccountLoader:
+    """
+    Collect the ``load(account_id)`` calls issued within the same event loop tick (or within
+    ``window`` seconds) and send them as one ``get_accounts`` call filtered on their IDs.
+    Every caller gets the same ``(data, status_code)`` as from ``get_account``; IDs missing from
+    the batch response are looked up one by one, and a failed batch is returned to all of its
+    callers.
+
+    Successful lookups are cached for the lifetime of the loader, so create one per unit of work
+    (e.g. per web request or task) with ``AsyncCRMClient.account_loader()``.
+    """
+
+    def __init__(self, client: 'AsyncCRMClient', max_batch_size: int = 100, window: float = 0.0,
+                 id_filter: str = 'ids', separator: Optional[str] = ',', cache: bool = True,
+                 typed: bool = False):
+        """
+        Initialize the loader.
+        :param client: The client sending the batched ``get_accounts`` calls.
+        :param max_batch_size: Maximum number of IDs per call; a full batch is sent at once.
+        :param window: Seconds to wait for more lookups before sending a batch; 0 sends it at
+                       the end of the current event loop tick.
+        :param id_filter: Name of the ``get_accounts`` filter taking the list of account IDs.
+        :param separator: Joins the IDs into one filter value; None sends them as a list
+                          (a repeated query parameter).
+        :param cache: Remember successful lookups for the lifetime of the loader.
+        :param typed: Whether the client returns response models instead of dictionaries.
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        if window < 0:
+            raise ValueError("window must be non-negative")
+        self._client = client
+        self._max_batch_size = max_batch_size
+        self._window = window
+        self._id_filter = id_filter
+        self._separator = separator
+        self._typed = typed
+        self._cache: Optional[Dict[str, asyncio.Future]] = {} if cache else None
+        self._batch: Dict[str, asyncio.Future] = {}
+        self._timer: Optional[asyncio.Handle] = None
+        self._tasks = set()
+        self._stats = {'loads': 0, 'cache_hits': 0, 'batches': 0, 'fallbacks': 0}
+
+    async def load(self, account_id: Any) -> tuple:
+        """
+        Get an account, batched with the other lookups of the same tick or window.
+        :param account_id: The ID of the account to retrieve.
+        :return: Account details with http status code, as returned by ``get_account``.
+        """
+        key = str(account_id)
+        self._stats['loads'] += 1
+        future = self._cache.get(key) if self._cache is not None else None
+        if future is not None:
+            self._stats['cache_hits'] += 1
+        else:
+            future = self._batch.get(key)
+            if future is None:
+                future = self._enqueue(key)
+        # A cancelled caller must not cancel the lookup shared with the others
+        return await asyncio.shield(future)
+
+    async def load_many(self, account_ids: Iterable[Any]) -> List[tuple]:
+        """
+        Get many accounts, batched together.
+        :param account_ids: The IDs of the accounts to retrieve.
+        :return: One (data, status_code) per ID, in input order.
+        """
+        return list(await asyncio.gather(*(self.load(account_id) for account_id in account_ids)))
+
+    def prime(self, account_id: Any, response: tuple) -> None:
+        """
+        Put a known response in the cache, e.g. an account just created or listed.
+        :param account_id: The ID of the account.
+        :param response: Tuple of data and http status code.
+        """
+        if self._cache is not None:
+            future = asyncio.get_running_loop().create_future()
+            future.set_result(response)
+            self._cache[str(account_id)] = future
+
+    def clear(self, account_id: Any = None) -> None:
+        """
+        Forget cached lookups.
+        :param account_id: The account to forget; every account when None.
+        """
+        if self._cache is None:
+            return
+        if account_id is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(str(account_id), None)
+
+    def stats(self) -> dict:
+        """
+        Snapshot of the loader counters.
+        :return: Dict with lookups, lookups served from the cache, batches sent, IDs looked up
+                 one by one because the batch did not return them, and lookups waiting.
+        """
+        return {**self._stats, 'pending': len(self._batch)}
+
+    def _enqueue(self, key: str) -> asyncio.Future:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._batch[key] = future
+        if self._cache is not None:
+            self._cache[key] = future
+        if len(self._batch) >= self._max_batch_size:
+            self._dispatch()
+        elif self._timer is None:
+            self._timer = (loop.call_later(self._window, self._dispatch) if self._window
+                           else loop.call_soon(self._dispatch))
+        return future
+
+    def _dispatch(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._batch = self._batch, {}
+        if batch:
+            task = asyncio.ensure_future(self._fetch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _fetch(self, batch: Dict[str, asyncio.Future]) -> None:
+        self._stats['batches'] += 1
+        ids = list(batch)
+        value = self._separator.join(ids) if self._separator is not None else ids
+        try:
+            data, status_code = await self._client.get_accounts(
+                filters={self._id_filter: value}, offset=0, limit=len(ids))
+            if not 200 <= int(status_code) < 300:
+                for key, future in batch.items():
+                    self._resolve(key, future, (data, status_code))
+                return
+            records = data.accounts if hasattr(data, 'accounts') else data.get('accounts') or []
+            found = {str(_record_id(record)): record for record in records}
+            missing = [key for key in ids if key not in found]
+            for key in ids:
+                if key in found:
+                    self._resolve(key, batch[key], self._response(found[key]))
+            if missing:
+                self._stats['fallbacks'] += len(missing)
+                responses = await asyncio.gather(
+                    *(self._client.get_account(account_id=key) for key in missing))
+                for key, response in zip(missing, responses):
+                    self._resolve(key, batch[key], response)
+        except BaseException as e:
+            for key, future in batch.items():
+                if not future.done():
+                    self._forget(key, future)
+                    if isinstance(e, Exception):
+                        future.set_exception(e)
+                    else:
+                        future.cancel()
+            if not isinstance(e, Exception):
+                raise
+
+    def _response(self, record: Any) -> tuple:
+        if self._typed:
+            return AccountResponse(account=record), HTTPStatus.OK
+        return {'account': record}, HTTPStatus.OK
+
+    def _resolve(self, key: str, future: asyncio.Future, response: tuple) -> None:
+        if not 200 <= int(response[1]) < 300:
+            self._forget(key, future)
+        if not future.done():
+            future.set_result(response)
+
+    def _forget(self, key: str, future: asyncio.Future) -> None:
+        if self._cache is not None and self._cache.get(key) is future:
+            del self._cache[key]
+
+
+def _record_id(record: Any) -> Any:
+    return record.get('id') if isinstance(record, dict) else getattr(record, 'id', None)
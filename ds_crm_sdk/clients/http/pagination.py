@@ -0,0 +1,159 @@
+"""
+Auto-paginating iterators over offset/limit list endpoints.
+
+Both helpers request the next page(s) in the background while the current page is being
+consumed, so callers do not wait a full round trip between pages.
+"""
+import asyncio
+from collections import deque
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator, Optional, Tuple
+from pydantic import BaseModel
+from ds_crm_sdk.exceptions import CRMRequestError
+
+PageFetcher = Callable[[int, int], Tuple[Optional[dict], int]]
+AsyncPageFetcher = Callable[[int, int], Awaitable[Tuple[Optional[dict], int]]]
+
+
+def _page_records(page: Tuple[Optional[dict], int], result_key: str) -> list:
+    """
+    Extract the records from a page response, raising on a non-successful status.
+    :param page: Tuple of response data (dict or response model) and http status code.
+    :param result_key: Key in the response data that holds the records.
+    :return: The list of records (empty when the key is missing).
+    """
+    data, status_code = page
+    if not 200 <= int(status_code) < 300:
+        raise CRMRequestError(status_code=status_code, data=data)
+    if isinstance(data, BaseModel):
+        return getattr(data, result_key, None) or []
+    return (data or {}).get(result_key) or []
+
+
+def _validate(page_size: int, prefetch: int, max_items: Optional[int]) -> None:
+    if page_size < 1:
+        raise ValueError("page_size must be at least 1")
+    if prefetch < 0:
+        raise ValueError("prefetch must not be negative")
+    if max_items is not None and max_items < 0:
+        raise ValueError("max_items must not be negative")
+
+
+def iter_pages(fetch_page: PageFetcher, result_key: str, page_size: int = 100,
+               prefetch: int = 1, max_items: Optional[int] = None,
+               executor: Optional[Executor] = None) -> Iterator[Any]:
+    """
+    Lazily yield records from an offset/limit endpoint, prefetching pages on worker threads.
+    :param fetch_page: Callable taking (offset, limit) and returning (data, status_code).
+    :param result_key: Key in the response data that holds the records.
+    :param page_size: Number of records requested per page.
+    :param prefetch: Number of pages fetched ahead of the one being consumed (0 disables it).
+    :param max_items: Stop after yielding this many records (None for no cap).
+    :param executor: Executor fetching the pages ahead, e.g. the client's thread pool; a pool
+                     of ``prefetch`` threads is created for the iteration when None.
+    :return: An iterator over the records.
+    :raises ValueError: If the arguments are invalid (when called, not when iterated).
+    :raises CRMRequestError: If a page comes back with a non-successful status code.
+    """
+    _validate(page_size, prefetch, max_items)
+    if max_items == 0:
+        return iter(())
+    if not prefetch:
+        return _iter_pages_serial(fetch_page, result_key, page_size, max_items)
+    return _iter_pages_prefetched(fetch_page, result_key, page_size, prefetch, max_items,
+                                  executor)
+
+
+def _iter_pages_prefetched(fetch_page: PageFetcher, result_key: str, page_size: int,
+                           prefetch: int, max_items: Optional[int],
+                           executor: Optional[Executor]) -> Iterator[Any]:
+    owned = None
+    if executor is None:
+        executor = owned = ThreadPoolExecutor(max_workers=prefetch,
+                                              thread_name_prefix='ds-crm-prefetch')
+    pending = deque()
+    next_offset = 0
+    yielded = 0
+    try:
+        while True:
+            while len(pending) <= prefetch and (max_items is None or next_offset < max_items):
+                pending.append((next_offset, executor.submit(fetch_page, next_offset, page_size)))
+                next_offset += page_size
+            if not pending:
+                return
+            offset, future = pending.popleft()
+            # A page still queued behind a busy shared pool is fetched here instead of waiting
+            page = fetch_page(offset, page_size) if future.cancel() else future.result()
+            records = _page_records(page, result_key)
+            for record in records:
+                yield record
+                yielded += 1
+                if max_items is not None and yielded >= max_items:
+                    return
+            if len(records) < page_size:
+                return
+    finally:
+        for _, future in pending:
+            future.cancel()
+        if owned is not None:
+            owned.shutdown(wait=False)
+
+
+def _iter_pages_serial(fetch_page: PageFetcher, result_key: str, page_size: int,
+                       max_items: Optional[int]) -> Iterator[Any]:
+    offset = 0
+    yielded = 0
+    while True:
+        records = _page_records(fetch_page(offset, page_size), result_key)
+        offset += page_size
+        for record in records:
+            yield record
+            yielded += 1
+            if max_items is not None and yielded >= max_items:
+                return
+        if len(records) < page_size:
+            return
+
+
+def aiter_pages(fetch_page: AsyncPageFetcher, result_key: str, page_size: int = 100,
+                prefetch: int = 1, max_items: Optional[int] = None) -> AsyncIterator[Any]:
+    """
+    Lazily yield records from an offset/limit endpoint, prefetching pages as asyncio tasks.
+    :param fetch_page: Coroutine function taking (offset, limit) and returning (data, status_code).
+    :param result_key: Key in the response data that holds the records.
+    :param page_size: Number of records requested per page.
+    :param prefetch: Number of pages fetched ahead of the one being consumed (0 disables it).
+    :param max_items: Stop after yielding this many records (None for no cap).
+    :return: An async iterator over the records.
+    :raises ValueError: If the arguments are invalid (when called, not when iterated).
+    :raises CRMRequestError: If a page comes back with a non-successful status code.
+    """
+    _validate(page_size, prefetch, max_items)
+    return _aiter_pages(fetch_page, result_key, page_size, prefetch, max_items)
+
+
+async def _aiter_pages(fetch_page: AsyncPageFetcher, result_key: str, page_size: int,
+                       prefetch: int, max_items: Optional[int]) -> AsyncIterator[Any]:
+    if max_items == 0:
+        return
+    pending = deque()
+    next_offset = 0
+    yielded = 0
+    try:
+        while True:
+            while len(pending) <= prefetch and (max_items is None or next_offset < max_items):
+                pending.append(asyncio.ensure_future(fetch_page(next_offset, page_size)))
+                next_offset += page_size
+            if not pending:
+                return
+            records = _page_records(await pending.popleft(), result_key)
+            for record in records:
+                yield record
+                yielded += 1
+                if max_items is not None and yielded >= max_items:
+                    return
+            if len(records) < page_size:
+                return
+    finally:
+        for task in pending:
+            task.cancel()
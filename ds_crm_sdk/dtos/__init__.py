@@ -1,3 +1,18 @@
-from .account import AccountRequestDTO
+from typing import TYPE_CHECKING
+from ds_crm_sdk.utils import lazy_attributes
 
-__all__ = ['AccountRequestDTO']
+if TYPE_CHECKING:
+    from .account import AccountRequestDTO
+    from .responses import (AccountDTO, AccountResponse, AccountsPage, AccountTypeDTO,
+                            AccountTypeResponse, AccountTypesPage, AddressDTO, AddressesPage,
+                            AddressResponse)
+
+__getattr__, __dir__ = lazy_attributes(__name__, {
+    'AccountRequestDTO': '.account', 'AccountDTO': '.responses', 'AccountResponse': '.responses',
+    'AccountsPage': '.responses', 'AccountTypeDTO': '.responses',
+    'AccountTypeResponse': '.responses', 'AccountTypesPage': '.responses',
+    'AddressDTO': '.responses', 'AddressesPage': '.responses', 'AddressResponse': '.responses'})
+
+__all__ = ['AccountRequestDTO', 'AccountDTO', 'AccountResponse', 'AccountsPage', 'AccountTypeDTO',
+           'AccountTypeResponse', 'AccountTypesPage', 'AddressDTO', 'AddressesPage',
+           'AddressResponse']
@@ -0,0 +1,102 @@
+"""
+Typed response models of the CRM read endpoints.
+
+Clients created with ``response_models=True`` validate successful responses straight from the
+raw response bytes into these models (no intermediate dict). Only the commonly used fields are
+declared; any other field returned by the CRM is kept as an extra attribute.
+"""
+from typing import List, Optional
+from pydantic import BaseModel, ConfigDict
+
+
+class CRMResponseModel(BaseModel):
+    """
+    Base class of the CRM response models; unknown fields are kept.
+    """
+    model_config = ConfigDict(extra='allow')
+
+
+class AccountDTO(CRMResponseModel):
+    """
+    An account as returned by the CRM.
+    """
+    id: int
+    name: Optional[str] = None
+    description: Optional[str] = None
+    email_address: Optional[str] = None
+    phone_number: Optional[str] = None
+    account_type: Optional[int] = None
+    parent_account: Optional[int] = None
+    is_active: Optional[bool] = None
+    external_id: Optional[str] = None
+    created: Optional[str] = None
+    created_by: Optional[str] = None
+    modified: Optional[str] = None
+    modified_by: Optional[str] = None
+
+
+class AddressDTO(CRMResponseModel):
+    """
+    An account address as returned by the CRM.
+    """
+    id: int
+    account_id: Optional[int] = None
+    address_type: Optional[str] = None
+    is_default: Optional[bool] = None
+    created: Optional[str] = None
+    modified: Optional[str] = None
+
+
+class AccountTypeDTO(CRMResponseModel):
+    """
+    An account type as returned by the CRM.
+    """
+    id: int
+    name: Optional[str] = None
+    description: Optional[str] = None
+    commission_rate: Optional[float] = None
+    is_partner: Optional[bool] = None
+    created: Optional[str] = None
+    modified: Optional[str] = None
+
+
+class AccountResponse(CRMResponseModel):
+    """
+    Response of the get account endpoint.
+    """
+    account: AccountDTO
+
+
+class AccountsPage(CRMResponseModel):
+    """
+    A page of the list accounts endpoint.
+    """
+    accounts: List[AccountDTO] = []
+
+
+class AddressResponse(CRMResponseModel):
+    """
+    Response of the get account address endpoint.
+    """
+    address: AddressDTO
+
+
+class AddressesPage(CRMResponseModel):
+    """
+    A page of the list account addresses endpoint.
+    """
+    addresses: List[AddressDTO] = []
+
+
+class AccountTypeResponse(CRMResponseModel):
+    """
+    Response of the get account type endpoint.
+    """
+    account_type: AccountTypeDTO
+
+
+class AccountTypesPage(CRMResponseModel):
+    """
+    A page of the list account types endpoint.
+    """
+    account_types: List[AccountTypeDTO] = []
@@ -0,0 +1,54 @@
+"""
+Exceptions raised by the CRM SDK.
+"""
+from typing import Any, List, Optional
+
+
+class CRMSDKError(Exception):
+    """
+    Base class for all errors raised by the CRM SDK.
+    """
+
+
+class CRMRequestError(CRMSDKError):
+    """
+    Raised when a CRM call returns a non-successful status where a value is required,
+    e.g. while iterating over pages.
+    """
+    def __init__(self, status_code: int, data: Any = None):
+        self.status_code = status_code
+        self.data = data
+        super().__init__(f"CRM request failed with status code {status_code}: {data}")
+
+
+class CRMResponseTooLargeError(CRMSDKError):
+    """
+    Raised when a streamed response body exceeds the configured maximum size.
+    """
+    def __init__(self, max_body_size: int):
+        self.max_body_size = max_body_size
+        super().__init__(f"CRM response body exceeds the maximum size of {max_body_size} bytes")
+
+
+class CRMBulkOperationError(CRMSDKError):
+    """
+    Raised when a bulk operation is aborted because one of its items failed fatally
+    (e.g. the CRM rejected the credentials). Outstanding work is cancelled before raising;
+    ``completed`` holds the results of the items that had already finished.
+    """
+    def __init__(self, result: Any, completed: Optional[List[Any]] = None):
+        self.result = result
+        self.completed = completed or []
+        super().__init__(f"Bulk operation aborted by item {result.index} ({result.key!r}) "
+                         f"with status code {result.status_code}: {result.data}")
+
+
+class CRMBulkCancelledError(CRMSDKError):
+    """
+    Raised when a bulk operation is cancelled before all of its items were processed.
+    Calls not started yet are cancelled; ``completed`` holds the results of the items that had
+    already finished, in input order.
+    """
+    def __init__(self, completed: Optional[List[Any]] = None):
+        self.completed = completed or []
+        super().__init__(f"Bulk operation cancelled after {len(self.completed)} items")
@@ -0,0 +1,17 @@
+"""
+Load testing tools: a local stub of the CRM service and a load generator for the clients.
+
+Run ``python -m ds_crm_sdk.loadtest --help`` for the command line interface.
+"""
+from typing import TYPE_CHECKING
+from ds_crm_sdk.utils import lazy_attributes
+
+if TYPE_CHECKING:
+    from .runner import MIXED, OPERATIONS, LoadReport, run_async, run_sync
+    from .server import StubCRMServer
+
+__getattr__, __dir__ = lazy_attributes(__name__, {
+    'MIXED': '.runner', 'OPERATIONS': '.runner', 'LoadReport': '.runner', 'run_async': '.runner',
+    'run_sync': '.runner', 'StubCRMServer': '.server'})
+
+__all__ = ["StubCRMServer", "LoadReport", "run_sync", "run_async", "OPERATIONS", "MIXED"]
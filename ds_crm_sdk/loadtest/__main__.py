@@ -0,0 +1,123 @@
+"""
+Load test the CRM clients against a local stub server (or an existing deployment).
+
+Examples:
+    python -m ds_crm_sdk.loadtest --mode both --concurrency 32 --duration 10
+    python -m ds_crm_sdk.loadtest --operation mixed --rps 200 --latency 0.02 --error-rate 0.01
+    python -m ds_crm_sdk.loadtest --url https://crm.staging.example --requests 1000 --json
+"""
+import argparse
+import asyncio
+import json
+import sys
+from typing import List
+import httpx
+from ds_crm_sdk.clients.http.async_crm_client import AsyncCRMClient
+from ds_crm_sdk.clients.http.crm_client import CRMClient
+from ds_crm_sdk.constants import ClientOrigin
+from ds_crm_sdk.logging import set_logger_level
+from ds_crm_sdk.transports.http import DSAsyncHTTPTransport, DSHTTPTransport
+from .runner import MIXED, OPERATIONS, LoadReport, run_async, run_sync
+from .server import StubCRMServer
+
+
+def _token() -> str:
+    return 'Bearer loadtest'
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='python -m ds_crm_sdk.loadtest',
+                                     description=__doc__.strip().splitlines()[0],
+                                     formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+    load = parser.add_argument_group('load')
+    load.add_argument('--mode', choices=('sync', 'async', 'both'), default='both')
+    load.add_argument('--operation', choices=sorted(OPERATIONS) + [MIXED], default='get_account')
+    load.add_argument('--concurrency', type=int, default=10, help='Requests in flight at most')
+    load.add_argument('--duration', type=float, default=None, help='Seconds to run each mode')
+    load.add_argument('--requests', type=int, default=None, help='Requests to send per mode')
+    load.add_argument('--rps', type=float, default=None,
+                      help='Target requests per second (default: as fast as possible)')
+    load.add_argument('--warmup', type=int, default=1,
+                      help='Untimed requests sent before each mode')
+    load.add_argument('--client-origin', default=ClientOrigin.WEB.value,
+                      choices=[origin.value for origin in ClientOrigin])
+    server = parser.add_argument_group('stub server')
+    server.add_argument('--url', default=None,
+                        help='Target this base URL instead of starting the stub server')
+    server.add_argument('--latency', type=float, default=0.0, help='Response delay in seconds')
+    server.add_argument('--jitter', type=float, default=0.0, help='Extra random delay, seconds')
+    server.add_argument('--error-rate', type=float, default=0.0,
+                        help='Fraction of requests answered with a 5xx status')
+    server.add_argument('--page-size', type=int, default=100,
+                        help='Maximum records returned by list endpoints')
+    server.add_argument('--record-size', type=int, default=200,
+                        help='Bytes of padding in every returned record')
+    server.add_argument('--seed', type=int, default=None)
+    output = parser.add_argument_group('output')
+    output.add_argument('--json', action='store_true', help='Print the reports as JSON')
+    output.add_argument('--log-level', default='WARNING', help='SDK log level during the run')
+    return parser
+
+
+def _run_sync(args: argparse.Namespace, base_url: str) -> LoadReport:
+    with DSHTTPTransport(_token, pool_maxsize=args.concurrency, pool_block=True) as transport:
+        client = CRMClient(base_url=base_url, client_origin=ClientOrigin(args.client_origin),
+                           transport=transport)
+        return run_sync(client, operation=args.operation, concurrency=args.concurrency,
+                        duration=args.duration, requests=args.requests, rps=args.rps,
+                        warmup=args.warmup)
+
+
+async def _run_async(args: argparse.Namespace, base_url: str) -> LoadReport:
+    limits = httpx.Limits(max_connections=args.concurrency,
+                          max_keepalive_connections=args.concurrency)
+    async with DSAsyncHTTPTransport(_token, limits=limits) as transport:
+        client = AsyncCRMClient(base_url=base_url, client_origin=ClientOrigin(args.client_origin),
+                                transport=transport)
+        return await run_async(client, operation=args.operation, concurrency=args.concurrency,
+                               duration=args.duration, requests=args.requests, rps=args.rps,
+                               warmup=args.warmup)
+
+
+def run(args: argparse.Namespace, base_url: str) -> List[LoadReport]:
+    """
+    Run the selected modes one after the other against a base URL.
+    :param args: The parsed command line arguments.
+    :param base_url: Base URL of the CRM service.
+    :return: One report per mode.
+    """
+    reports = []
+    if args.mode in ('sync', 'both'):
+        reports.append(_run_sync(args, base_url))
+    if args.mode in ('async', 'both'):
+        reports.append(asyncio.run(_run_async(args, base_url)))
+    return reports
+
+
+def main(argv: List[str] = None) -> int:
+    """
+    Command line entry point.
+    :param argv: Command line arguments (defaults to ``sys.argv``).
+    :return: Process exit code.
+    """
+    parser = _parser()
+    args = parser.parse_args(argv)
+    if args.duration is None and args.requests is None:
+        args.duration = 10.0
+    set_logger_level(args.log_level)
+    if args.url:
+        reports = run(args, args.url)
+    else:
+        with StubCRMServer(latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+                           page_size=args.page_size, record_size=args.record_size,
+                           seed=args.seed) as server:
+            reports = run(args, server.url)
+    if args.json:
+        print(json.dumps([report.summary() for report in reports], indent=2))
+    else:
+        print('\n'.join(report.format() for report in reports))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
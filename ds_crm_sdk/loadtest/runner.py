@@ -0,0 +1,238 @@
+"""
+Closed-loop load generation against the CRM clients, with latency and error reporting.
+"""
+import asyncio
+import itertools
+import math
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+from ds_crm_sdk.dtos import AccountRequestDTO
+from ds_crm_sdk.transports.http.ratelimit import GLOBAL, RateLimiter
+
+ACCOUNT = AccountRequestDTO(account_type_id=1, name='Load Test', email_address='load@example.test',
+                            phone_number='6505559004', created_by='loadtest', user_id='loadtest',
+                            first_name='Load', last_name='Test')
+
+# Every operation takes the client and the request index and returns the client call, i.e. a
+# (data, status) tuple for CRMClient and an awaitable of one for AsyncCRMClient.
+OPERATIONS: Dict[str, Callable[[Any, int], Any]] = {
+    'get_account': lambda client, index: client.get_account(account_id=str(index % 1000 + 1)),
+    'get_accounts': lambda client, index: client.get_accounts(offset=index % 10 * 10, limit=10),
+    'get_account_addresses': lambda client, index: client.get_account_addresses(
+        account_id=str(index % 1000 + 1)),
+    'get_account_types': lambda client, index: client.get_account_types(),
+    'create_account': lambda client, index: client.create_account(ACCOUNT),
+}
+MIXED = 'mixed'
+
+
+def _operation(name: str) -> Callable[[Any, int], Any]:
+    """
+    Resolve an operation name; ``mixed`` cycles through every operation.
+    :param name: Key of ``OPERATIONS`` or ``mixed``.
+    :return: Callable taking the client and the request index.
+    """
+    if name == MIXED:
+        operations = list(OPERATIONS.values())
+        return lambda client, index: operations[index % len(operations)](client, index)
+    if name not in OPERATIONS:
+        raise ValueError(f"Unknown operation: {name}")
+    return OPERATIONS[name]
+
+
+@dataclass
+class LoadReport:
+    """
+    Outcome of a load test run: per-request latencies and the errors by status or exception.
+    """
+    mode: str
+    operation: str
+    concurrency: int
+    latencies: List[float] = field(default_factory=list)
+    errors: Counter = field(default_factory=Counter)
+    elapsed: float = 0.0
+
+    @property
+    def requests(self) -> int:
+        """
+        Number of requests completed, successfully or not.
+        """
+        return len(self.latencies)
+
+    @property
+    def failed(self) -> int:
+        """
+        Number of requests that returned an error status or raised.
+        """
+        return sum(self.errors.values())
+
+    @property
+    def throughput(self) -> float:
+        """
+        Requests completed per second of wall-clock time.
+        """
+        return self.requests / self.elapsed if self.elapsed else 0.0
+
+    def percentile(self, percent: float) -> float:
+        """
+        Latency percentile (nearest rank) over every completed request.
+        :param percent: The percentile, e.g. 99.
+        :return: The latency in seconds, 0 when no request completed.
+        """
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        return ordered[max(0, math.ceil(percent / 100 * len(ordered)) - 1)]
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        JSON-serialisable summary of the run; latencies are in milliseconds.
+        """
+        return {'mode': self.mode, 'operation': self.operation, 'concurrency': self.concurrency,
+                'requests': self.requests, 'failed': self.failed,
+                'elapsed': round(self.elapsed, 3), 'throughput': round(self.throughput, 1),
+                'latency_ms': {f'p{percent}': round(self.percentile(percent) * 1000, 3)
+                               for percent in (50, 95, 99)},
+                'errors': dict(self.errors)}
+
+    def format(self) -> str:
+        """
+        Human readable summary of the run.
+        """
+        summary = self.summary()
+        latency = summary['latency_ms']
+        lines = [f"[{self.mode}] {self.operation} x{self.concurrency}: {self.requests} requests "
+                 f"in {self.elapsed:.2f}s ({self.throughput:,.1f} req/s), {self.failed} failed",
+                 f"  latency p50 {latency['p50']:.2f} ms  p95 {latency['p95']:.2f} ms  "
+                 f"p99 {latency['p99']:.2f} ms"]
+        lines.extend(f"  error {error}: {count}" for error, count in self.errors.most_common())
+        return '\n'.join(lines)
+
+    def record(self, latency: float, status_code: Optional[int] = None,
+               error: Optional[BaseException] = None) -> None:
+        """
+        Record one completed request; only called under the runner's lock or from the loop.
+        :param latency: Seconds the request took.
+        :param status_code: The returned status code, if the call returned.
+        :param error: The exception the call raised, if any.
+        """
+        self.latencies.append(latency)
+        if error is not None:
+            self.errors[type(error).__name__] += 1
+        elif not 200 <= int(status_code) < 300:
+            self.errors[str(int(status_code))] += 1
+
+
+def _pacer(rps: Optional[float]) -> Optional[RateLimiter]:
+    return RateLimiter(rate=rps, burst=1, scope=GLOBAL) if rps else None
+
+
+def _check_bounds(concurrency: int, duration: Optional[float], requests: Optional[int]) -> None:
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    if duration is None and requests is None:
+        raise ValueError("Either duration or requests must be given")
+
+
+def run_sync(client: Any, operation: str = 'get_account', concurrency: int = 10,
+             duration: Optional[float] = None, requests: Optional[int] = None,
+             rps: Optional[float] = None, warmup: int = 0) -> LoadReport:
+    """
+    Drive a CRMClient from ``concurrency`` threads until the duration or request count is reached.
+    :param client: The CRMClient under test.
+    :param operation: Key of ``OPERATIONS`` or ``mixed``.
+    :param concurrency: Number of worker threads, i.e. requests in flight at most.
+    :param duration: Seconds to run for (optional if ``requests`` is given).
+    :param requests: Number of requests to send (optional if ``duration`` is given).
+    :param rps: Target request rate across all workers (None sends as fast as possible).
+    :param warmup: Requests sent before the run and left out of the report, to open the
+                   connection pool and fill lazy caches first.
+    :return: The load report.
+    """
+    _check_bounds(concurrency, duration, requests)
+    call = _operation(operation)
+    report = LoadReport(mode='sync', operation=operation, concurrency=concurrency)
+    for index in range(warmup):
+        call(client, index)
+    pacer = _pacer(rps)
+    counter = itertools.count()
+    lock = threading.Lock()
+    started = time.perf_counter()
+    deadline = None if duration is None else started + duration
+
+    def worker() -> None:
+        while True:
+            if pacer is not None:
+                pacer.acquire()
+            with lock:
+                index = next(counter)
+            if (requests is not None and index >= requests) or \
+                    (deadline is not None and time.perf_counter() >= deadline):
+                return
+            sent = time.perf_counter()
+            try:
+                _, status_code = call(client, index)
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                with lock:
+                    report.record(time.perf_counter() - sent, error=error)
+            else:
+                with lock:
+                    report.record(time.perf_counter() - sent, status_code=status_code)
+
+    threads = [threading.Thread(target=worker, daemon=True) for _ in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    report.elapsed = time.perf_counter() - started
+    return report
+
+
+async def run_async(client: Any, operation: str = 'get_account', concurrency: int = 10,
+                    duration: Optional[float] = None, requests: Optional[int] = None,
+                    rps: Optional[float] = None, warmup: int = 0) -> LoadReport:
+    """
+    Drive an AsyncCRMClient from ``concurrency`` tasks until the duration or request count is
+    reached.
+    :param client: The AsyncCRMClient under test.
+    :param operation: Key of ``OPERATIONS`` or ``mixed``.
+    :param concurrency: Number of worker tasks, i.e. requests in flight at most.
+    :param duration: Seconds to run for (optional if ``requests`` is given).
+    :param requests: Number of requests to send (optional if ``duration`` is given).
+    :param rps: Target request rate across all workers (None sends as fast as possible).
+    :param warmup: Requests sent before the run and left out of the report, to open the
+                   connection pool and fill lazy caches first.
+    :return: The load report.
+    """
+    _check_bounds(concurrency, duration, requests)
+    call = _operation(operation)
+    report = LoadReport(mode='async', operation=operation, concurrency=concurrency)
+    for index in range(warmup):
+        await call(client, index)
+    pacer = _pacer(rps)
+    counter = itertools.count()
+    started = time.perf_counter()
+    deadline = None if duration is None else started + duration
+
+    async def worker() -> None:
+        while True:
+            if pacer is not None:
+                await pacer.aacquire()
+            index = next(counter)
+            if (requests is not None and index >= requests) or \
+                    (deadline is not None and time.perf_counter() >= deadline):
+                return
+            sent = time.perf_counter()
+            try:
+                _, status_code = await call(client, index)
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                report.record(time.perf_counter() - sent, error=error)
+            else:
+                report.record(time.perf_counter() - sent, status_code=status_code)
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    report.elapsed = time.perf_counter() - started
+    return report
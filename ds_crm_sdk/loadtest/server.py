@@ -0,0 +1,229 @@
+"""
+In-process stub of the CRM service, serving the routes of the SDK endpoints.
+"""
+import json
+import random
+import re
+import threading
+import time
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Pattern, Sequence, Tuple
+from urllib.parse import parse_qs, urlsplit
+from ds_crm_sdk.clients.http.endpoints import (AccountAddressEndpoint, AccountEndpoint,
+                                               AccountTypesEndpoint)
+
+DEFAULT_ERROR_STATUSES = (HTTPStatus.INTERNAL_SERVER_ERROR, HTTPStatus.SERVICE_UNAVAILABLE)
+
+
+def _route_pattern(template: str) -> Pattern:
+    """
+    Compile an endpoint template into a regex capturing its placeholders.
+    :param template: The endpoint template, e.g. '/api/crm/accounts/{account_id}'.
+    :return: The compiled pattern.
+    """
+    return re.compile('^' + re.sub(r'\\{(\w+)\\}', r'(?P<\1>[^/]+)', re.escape(template)) + '$')
+
+
+class StubCRMServer:
+    """
+    Threaded HTTP server answering the CRM endpoints with generated records.
+
+    Every response is delayed by ``latency`` seconds (plus up to ``jitter``), a fraction
+    ``error_rate`` of the requests fails with one of ``error_statuses``, list endpoints return
+    ``min(limit, page_size)`` records and every record carries ``record_size`` bytes of
+    description. Use it as a context manager or call ``start()``/``stop()``.
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, latency: float = 0.0,
+                 jitter: float = 0.0, error_rate: float = 0.0,
+                 error_statuses: Sequence[int] = DEFAULT_ERROR_STATUSES,
+                 page_size: int = 100, record_size: int = 200, seed: Optional[int] = None):
+        """
+        Initialize the server; nothing is bound until ``start()``.
+        :param host: Interface to listen on.
+        :param port: Port to listen on, 0 picks a free one.
+        :param latency: Seconds every response is delayed by.
+        :param jitter: Maximum extra random delay in seconds.
+        :param error_rate: Fraction (0-1) of the requests answered with an error status.
+        :param error_statuses: Statuses the failing requests are answered with.
+        :param page_size: Maximum number of records returned by list endpoints.
+        :param record_size: Bytes of description text in every record.
+        :param seed: Seed of the random generator, for reproducible error patterns.
+        """
+        if not 0 <= error_rate <= 1:
+            raise ValueError("error_rate must be between 0 and 1")
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_statuses = tuple(error_statuses)
+        self.page_size = page_size
+        self.record_size = record_size
+        self._address = (host, port)
+        self._random = random.Random(seed)
+        self._random_lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self._routes: List[Tuple[str, Pattern, str]] = [
+            ('GET', _route_pattern(AccountEndpoint.ACCOUNTS.value), 'accounts'),
+            ('POST', _route_pattern(AccountEndpoint.ACCOUNTS.value), 'create_account'),
+            ('GET', _route_pattern(AccountEndpoint.SPECIFIC_ACCOUNT.value), 'account'),
+            ('GET', _route_pattern(AccountAddressEndpoint.ACCOUNT_ADDRESSES.value), 'addresses'),
+            ('GET', _route_pattern(AccountAddressEndpoint.ACCOUNT_ADDRESS.value), 'address'),
+            ('GET', _route_pattern(AccountTypesEndpoint.ACCOUNT_TYPES.value), 'account_types'),
+            ('GET', _route_pattern(AccountTypesEndpoint.ACCOUNT_TYPE.value), 'account_type'),
+        ]
+
+    def __enter__(self) -> 'StubCRMServer':
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+
+    @property
+    def url(self) -> str:
+        """
+        Base URL of the running server, to pass as the clients' ``base_url``.
+        """
+        if self._server is None:
+            raise RuntimeError("The stub server is not running")
+        host, port = self._server.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def start(self) -> 'StubCRMServer':
+        """
+        Bind the server and serve requests on a background thread.
+        :return: The server itself.
+        """
+        if self._server is None:
+            self._server = ThreadingHTTPServer(self._address, self._handler_class())
+            self._server.daemon_threads = True
+            self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """
+        Stop serving and close the listening socket.
+        """
+        server, self._server = self._server, None
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+            self._thread.join()
+
+    def respond(self, method: str, path: str, query: Dict[str, List[str]],
+                body: Optional[dict]) -> Tuple[int, Any]:
+        """
+        Build the response to a request; called by the request handler threads.
+        :param method: The HTTP method.
+        :param path: The URL path.
+        :param query: The parsed query string.
+        :param body: The decoded JSON body, if any.
+        :return: Tuple of status code and JSON-serialisable body.
+        """
+        delay = self.latency + (self._uniform(0, self.jitter) if self.jitter else 0.0)
+        if delay:
+            time.sleep(delay)
+        if self.error_rate and self._uniform(0, 1) < self.error_rate:
+            with self._random_lock:
+                status = self._random.choice(self.error_statuses)
+            return status, {'error': 'Injected failure'}
+        for route_method, pattern, name in self._routes:
+            match = pattern.match(path)
+            if match is not None and route_method == method:
+                return getattr(self, f'_route_{name}')(query, body, **match.groupdict())
+        return HTTPStatus.NOT_FOUND, {'error': f'No route for {method} {path}'}
+
+    def _uniform(self, low: float, high: float) -> float:
+        with self._random_lock:
+            return self._random.uniform(low, high)
+
+    def _page(self, query: Dict[str, List[str]], make: Any) -> List[dict]:
+        offset = int(query.get('offset', ['0'])[0])
+        limit = min(int(query.get('limit', ['10'])[0]), self.page_size)
+        return [make(offset + index + 1) for index in range(max(0, limit))]
+
+    def _account_record(self, account_id: Any) -> dict:
+        return {'id': int(account_id) if str(account_id).isdigit() else account_id,
+                'name': f'Account {account_id}', 'description': 'x' * self.record_size,
+                'email_address': f'account{account_id}@example.test',
+                'phone_number': '6505559004', 'account_type': 1, 'is_active': True,
+                'created': 'Thu, 19 Jun 2025 07:53:22 GMT', 'created_by': 'loadtest'}
+
+    def _address_record(self, account_id: Any, address_id: Any) -> dict:
+        return {'id': int(address_id) if str(address_id).isdigit() else address_id,
+                'account_id': account_id, 'address_type': 'billing', 'is_default': True,
+                'street': 'x' * self.record_size, 'created': 'Thu, 19 Jun 2025 07:53:22 GMT'}
+
+    def _account_type_record(self, type_id: Any) -> dict:
+        return {'id': int(type_id) if str(type_id).isdigit() else type_id,
+                'name': f'Type {type_id}', 'description': 'x' * self.record_size,
+                'commission_rate': 0, 'is_partner': False}
+
+    def _route_accounts(self, query, _body) -> Tuple[int, dict]:
+        if 'ids' in query:
+            ids = [account_id for value in query['ids'] for account_id in value.split(',')]
+            return HTTPStatus.OK, {'accounts': [self._account_record(account_id)
+                                                for account_id in ids]}
+        return HTTPStatus.OK, {'accounts': self._page(query, self._account_record)}
+
+    def _route_create_account(self, _query, body) -> Tuple[int, dict]:
+        with self._random_lock:
+            account_id = self._random.randint(1, 10 ** 6)
+        account = dict(self._account_record(account_id),
+                       name=((body or {}).get('account_data') or {}).get('name'))
+        return HTTPStatus.CREATED, {'account': account}
+
+    def _route_account(self, _query, _body, account_id) -> Tuple[int, dict]:
+        return HTTPStatus.OK, {'account': self._account_record(account_id)}
+
+    def _route_addresses(self, query, _body, account_id) -> Tuple[int, dict]:
+        return HTTPStatus.OK, {'addresses': self._page(
+            query, lambda address_id: self._address_record(account_id, address_id))}
+
+    def _route_address(self, _query, _body, account_id, address_id) -> Tuple[int, dict]:
+        return HTTPStatus.OK, {'address': self._address_record(account_id, address_id)}
+
+    def _route_account_types(self, query, _body) -> Tuple[int, dict]:
+        return HTTPStatus.OK, {'account_types': self._page(query, self._account_type_record)}
+
+    def _route_account_type(self, _query, _body, type_id) -> Tuple[int, dict]:
+        return HTTPStatus.OK, {'account_type': self._account_type_record(type_id)}
+
+    def _handler_class(self) -> type:
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            """
+            Keep-alive request handler delegating to the stub.
+            """
+            protocol_version = 'HTTP/1.1'
+            # Headers and body are written separately; without TCP_NODELAY every keep-alive
+            # response would wait for the client's delayed ACK.
+            disable_nagle_algorithm = True
+
+            def do_GET(self):  # pylint: disable=invalid-name
+                """Answer a GET request."""
+                self._handle()
+
+            def do_POST(self):  # pylint: disable=invalid-name
+                """Answer a POST request."""
+                self._handle()
+
+            def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+                """Keep the load test output quiet."""
+
+            def _handle(self):
+                url = urlsplit(self.path)
+                length = int(self.headers.get('Content-Length') or 0)
+                body = json.loads(self.rfile.read(length)) if length else None
+                status, data = stub.respond(self.command, url.path, parse_qs(url.query), body)
+                payload = json.dumps(data).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+        return Handler
@@ -1,7 +1,39 @@
-from loguru import logger
+"""
+Logging of the CRM SDK: a loguru logger plus lazy, sampled and redacted logging of request and
+response bodies and of slow requests.
+
+Messages use loguru's brace formatting with keyword fields, never f-strings: fields are only
+rendered when a handler accepts the level, and they are kept in ``record['extra']`` for
+structured sinks. Bodies are wrapped so that their redaction and rendering also happen only then.
+"""
+import random
 import sys
+from dataclasses import dataclass, field, replace
+from typing import Any, Callable, FrozenSet, Iterable, Optional
+from loguru import logger
+
 logger = logger.bind(name='ds_crm_sdk')
 
+REDACTED = '***'
+DEFAULT_REDACTED_FIELDS = frozenset({
+    'authorization', 'password', 'token', 'access_token', 'refresh_token', 'email',
+    'email_address', 'existing_account_email', 'phone', 'phone_number', 'first_name', 'last_name',
+})
+
+
+@dataclass(frozen=True)
+class LogPolicy:
+    """
+    What the SDK logs about the requests it sends; set with ``configure_logging``.
+    """
+    body_sample_rate: float = 1.0
+    slow_request_threshold: Optional[float] = None
+    redacted_fields: FrozenSet[str] = DEFAULT_REDACTED_FIELDS
+    sample: Callable[[], float] = field(default=random.random, repr=False, compare=False)
+
+
+_policy = LogPolicy()
+
 
 def set_logger_level(level: str):
     """
@@ -10,4 +42,122 @@ def set_logger_level(level: str):
     """
     logger.remove()
     logger.add(sys.stderr, level=level.upper())
-    logger.info(f"[ds-crm-sdk] Logger level set to {level}")
+    logger.info("[ds-crm-sdk] Logger level set to {level}", level=level)
+
+
+def configure_logging(body_sample_rate: Optional[float] = None,
+                      slow_request_threshold: Optional[float] = None,
+                      redacted_fields: Optional[Iterable[str]] = None) -> LogPolicy:
+    """
+    Configure what the SDK logs about its requests; arguments left to None keep their value.
+    :param body_sample_rate: Fraction (0-1) of the calls whose request and response bodies are
+                             logged at DEBUG (1 by default, 0 disables body logging).
+    :param slow_request_threshold: Seconds above which a request is logged at WARNING with its
+                                   route, status and duration (never by default).
+    :param redacted_fields: Names of the body and header fields whose values are replaced by
+                            '***' (case-insensitive), replacing the default set.
+    :return: The policy in effect.
+    """
+    global _policy  # pylint: disable=global-statement
+    if body_sample_rate is not None and not 0 <= body_sample_rate <= 1:
+        raise ValueError("body_sample_rate must be between 0 and 1")
+    changes = {}
+    if body_sample_rate is not None:
+        changes['body_sample_rate'] = body_sample_rate
+    if slow_request_threshold is not None:
+        changes['slow_request_threshold'] = slow_request_threshold
+    if redacted_fields is not None:
+        changes['redacted_fields'] = frozenset(name.lower() for name in redacted_fields)
+    _policy = replace(_policy, **changes)
+    return _policy
+
+
+def get_log_policy() -> LogPolicy:
+    """
+    The logging policy in effect.
+    """
+    return _policy
+
+
+def redact(value: Any, fields: FrozenSet[str] = DEFAULT_REDACTED_FIELDS) -> Any:
+    """
+    Copy of a body with the values of sensitive fields replaced, at any depth.
+    :param value: The body: dicts, lists, scalars or Pydantic models.
+    :param fields: Lower-case names of the fields to redact.
+    :return: The redacted copy.
+    """
+    if hasattr(value, 'model_dump'):
+        value = value.model_dump()
+    if isinstance(value, dict):
+        return {key: REDACTED if str(key).lower() in fields else redact(item, fields)
+                for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [redact(item, fields) for item in value]
+    return value
+
+
+class _Body:
+    """
+    A body passed to the logger, redacted and rendered only if the message is emitted.
+    """
+    __slots__ = ('_value', '_fields')
+
+    def __init__(self, value: Any, fields: FrozenSet[str]):
+        self._value = value
+        self._fields = fields
+
+    def __str__(self) -> str:
+        return str(redact(self._value, self._fields))
+
+    def __format__(self, spec: str) -> str:
+        return format(str(self), spec)
+
+    __repr__ = __str__
+
+
+def sample_bodies() -> bool:
+    """
+    Decide whether the bodies of a call are logged, according to the body sample rate.
+    :return: True if the call's bodies should be logged.
+    """
+    rate = _policy.body_sample_rate
+    return rate >= 1 or (rate > 0 and _policy.sample() < rate)
+
+
+def log_request(operation: str, route: Any, payload: Any) -> None:
+    """
+    Log the (redacted) body of a request at DEBUG; call it only for sampled calls.
+    :param operation: The client operation, e.g. 'create_account'.
+    :param route: The endpoint template of the request.
+    :param payload: The request body.
+    """
+    logger.debug("[{operation}] Sending request to {route} with data: {body}",
+                 operation=operation, route=getattr(route, 'value', route),
+                 body=_Body(payload, _policy.redacted_fields))
+
+
+def log_response(operation: str, route: Any, status_code: int, elapsed: float,
+                 data: Any = None, sampled: bool = False) -> None:
+    """
+    Log a response: its (redacted) body at DEBUG for sampled calls, and a WARNING when the
+    request took longer than the slow request threshold.
+    :param operation: The client operation, e.g. 'create_account'.
+    :param route: The endpoint template of the request.
+    :param status_code: The status code of the response.
+    :param elapsed: Seconds the request took.
+    :param data: The response body.
+    :param sampled: Whether the call's bodies are logged (see ``sample_bodies``).
+    """
+    policy = _policy
+    if sampled:
+        logger.debug("[{operation}] Received response from {route}: {body} "
+                     "with status code: {status_code}",
+                     operation=operation, route=getattr(route, 'value', route),
+                     status_code=int(status_code), elapsed=elapsed,
+                     body=_Body(data, policy.redacted_fields))
+    threshold = policy.slow_request_threshold
+    if threshold is not None and elapsed >= threshold:
+        logger.warning("[{operation}] Slow request to {route}: status {status_code} "
+                       "in {elapsed:.3f}s", operation=operation,
+                       route=getattr(route, 'value', route), status_code=int(status_code),
+                       elapsed=elapsed)
@@ -0,0 +1,273 @@
+"""
+Built-in request metrics of the CRM SDK, with Prometheus text exposition.
+"""
+import math
+import threading
+from bisect import bisect_left
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+from ds_crm_sdk.transports.http.hooks import RequestEvent, RequestHooks
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+PREFIX = 'ds_crm_sdk'
+
+
+class _RouteMetrics:
+    """
+    Counters of one method and endpoint template; only updated under the registry lock.
+    """
+    __slots__ = ('statuses', 'errors', 'retries', 'in_flight', 'buckets', 'count', 'sum',
+                 'phases')
+
+    def __init__(self, bucket_count: int):
+        self.statuses: Dict[int, int] = {}
+        self.errors: Dict[str, int] = {}
+        self.retries = 0
+        self.in_flight = 0
+        self.buckets = [0] * (bucket_count + 1)  # the last one is +Inf
+        self.count = 0
+        self.sum = 0.0
+        self.phases: Dict[str, float] = {}
+
+
+class MetricsRegistry:
+    """
+    Request counts per endpoint template and status, latency histograms, in-flight gauges and
+    the stats of tracked components (connection pools, caches, rate limiters...).
+
+    The registry is fed by lifecycle hooks: pass ``registry.hooks`` to a transport or a client,
+    or add its ``on_*`` methods to your own RequestHooks. Every update takes one short lock
+    with no allocation once a route has been seen, so it is cheap enough for the hot path.
+    Read it with ``snapshot()`` or ``render_prometheus()``.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS, prefix: str = PREFIX):
+        """
+        Initialize an empty registry.
+        :param buckets: Upper bounds of the latency histogram buckets, in seconds.
+        :param prefix: Prefix of the exported metric names.
+        """
+        self._bounds = tuple(sorted(buckets))
+        self._prefix = prefix
+        self._routes: Dict[Tuple[str, str], _RouteMetrics] = {}
+        self._components: Dict[str, Callable[[], dict]] = {}
+        self._lock = threading.Lock()
+        self.hooks = RequestHooks(on_request_start=self.on_request_start,
+                                  on_response=self.on_response, on_error=self.on_error,
+                                  on_retry=self.on_retry)
+
+    def track(self, name: str, component: Any) -> None:
+        """
+        Export the stats of a component as gauges named ``<prefix>_<name>_<stat>``.
+        :param name: Name of the component in the metric names, e.g. 'pool' or 'cache'.
+        :param component: An object with ``pool_stats()`` (transports) or ``stats()`` (caches,
+                          coalescers, rate limiters, circuit breakers, retry budgets, token
+                          providers), or a callable returning a dict.
+        """
+        for attribute in ('pool_stats', 'stats'):
+            if hasattr(component, attribute):
+                component = getattr(component, attribute)
+                break
+        if not callable(component):
+            raise TypeError(f"Cannot collect stats from {component!r}")
+        self._components[name] = component
+
+    def on_request_start(self, event: RequestEvent) -> None:
+        """
+        Hook counting a request in flight.
+        :param event: The request event.
+        """
+        metrics = self._route(event)
+        with self._lock:
+            metrics.in_flight += 1
+
+    def on_response(self, event: RequestEvent) -> None:
+        """
+        Hook recording a completed request.
+        :param event: The request event.
+        """
+        self._finish(event, None)
+
+    def on_error(self, event: RequestEvent) -> None:
+        """
+        Hook recording a request that raised.
+        :param event: The request event.
+        """
+        self._finish(event, type(event.error).__name__)
+
+    def on_retry(self, event: RequestEvent) -> None:
+        """
+        Hook counting a retry.
+        :param event: The request event.
+        """
+        metrics = self._route(event)
+        with self._lock:
+            metrics.retries += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Snapshot of every metric.
+        :return: Dict with ``routes``, keyed by '<method> <endpoint template>', holding the
+                 request counts by status, errors by exception type, retries, requests in
+                 flight, latency (count, sum and cumulative counts per bucket bound) and
+                 seconds spent per phase; and ``components`` with the stats of tracked
+                 components.
+        """
+        routes = {}
+        with self._lock:
+            for (method, route), metrics in self._routes.items():
+                cumulative, total = {}, 0
+                for bound, count in zip(self._bounds + (math.inf,), metrics.buckets):
+                    total += count
+                    cumulative[bound] = total
+                routes[f'{method} {route}'] = {
+                    'requests': dict(metrics.statuses), 'errors': dict(metrics.errors),
+                    'retries': metrics.retries, 'in_flight': metrics.in_flight,
+                    'latency': {'count': metrics.count, 'sum': metrics.sum,
+                                'buckets': cumulative},
+                    'phases': dict(metrics.phases)}
+        components = {name: collect() for name, collect in self._components.items()}
+        return {'routes': routes, 'components': components}
+
+    def render_prometheus(self) -> str:
+        """
+        Render every metric in the Prometheus text exposition format (version 0.0.4).
+        :return: The exposition text, e.g. to serve on a ``/metrics`` endpoint.
+        """
+        prefix = self._prefix
+        requests, errors, retries, in_flight, phases, latency = [], [], [], [], [], []
+        with self._lock:
+            for (method, route), metrics in sorted(self._routes.items()):
+                labels = {'method': method, 'route': route}
+                requests.extend((dict(labels, status=str(status)), count)
+                                for status, count in sorted(metrics.statuses.items()))
+                errors.extend((dict(labels, error=error), count)
+                              for error, count in sorted(metrics.errors.items()))
+                retries.append((labels, metrics.retries))
+                in_flight.append((labels, metrics.in_flight))
+                phases.extend((dict(labels, phase=phase), seconds)
+                              for phase, seconds in sorted(metrics.phases.items()))
+                total = 0
+                for bound, count in zip(self._bounds + (math.inf,), metrics.buckets):
+                    total += count
+                    latency.append((f'{prefix}_request_duration_seconds_bucket',
+                                    dict(labels, le=_number(bound)), total))
+                latency.append((f'{prefix}_request_duration_seconds_sum', labels, metrics.sum))
+                latency.append((f'{prefix}_request_duration_seconds_count', labels,
+                                metrics.count))
+        lines: List[str] = []
+        _family(lines, f'{prefix}_requests_total', 'counter',
+                'CRM requests by endpoint template and status code.', requests)
+        _family(lines, f'{prefix}_request_errors_total', 'counter',
+                'CRM requests that raised, by exception type.', errors)
+        _family(lines, f'{prefix}_request_retries_total', 'counter',
+                'Retried CRM request attempts.', retries)
+        _family(lines, f'{prefix}_requests_in_flight', 'gauge',
+                'CRM requests currently in flight.', in_flight)
+        _family(lines, f'{prefix}_request_phase_seconds_total', 'counter',
+                'Seconds spent per phase of CRM requests.', phases)
+        lines.append(f'# HELP {prefix}_request_duration_seconds Duration of CRM requests.')
+        lines.append(f'# TYPE {prefix}_request_duration_seconds histogram')
+        lines.extend(_sample(name, labels, value) for name, labels, value in latency)
+        for name, collect in self._components.items():
+            for stat, samples in _component_samples(collect()):
+                _family(lines, f'{prefix}_{_metric_name(name)}_{_metric_name(stat)}', 'gauge',
+                        f'{name} {stat}.', samples)
+        return '\n'.join(lines) + '\n'
+
+    def reset(self) -> None:
+        """
+        Clear the request metrics; tracked components are kept.
+        """
+        with self._lock:
+            self._routes.clear()
+
+    def _route(self, event: RequestEvent) -> _RouteMetrics:
+        key = (event.method, event.route or '')
+        metrics = self._routes.get(key)
+        if metrics is None:
+            with self._lock:
+                metrics = self._routes.setdefault(key, _RouteMetrics(len(self._bounds)))
+        return metrics
+
+    def _finish(self, event: RequestEvent, error: Optional[str]) -> None:
+        metrics = self._route(event)
+        timings = event.timings
+        duration = timings.get('total', 0.0)
+        bucket = bisect_left(self._bounds, duration)
+        with self._lock:
+            metrics.in_flight -= 1
+            metrics.statuses[event.status_code] = metrics.statuses.get(event.status_code, 0) + 1
+            if error is not None:
+                metrics.errors[error] = metrics.errors.get(error, 0) + 1
+            metrics.buckets[bucket] += 1
+            metrics.count += 1
+            metrics.sum += duration
+            phases = metrics.phases
+            for phase, seconds in timings.items():
+                if phase != 'total':
+                    phases[phase] = phases.get(phase, 0.0) + seconds
+
+
+def _component_samples(stats: dict) -> Iterator[Tuple[str, list]]:
+    """
+    Flatten the stats of a component into samples per stat.
+    Nested dicts (e.g. per route or per bucket) become a ``key`` label, and string values
+    (e.g. circuit states) a label of a sample with value 1. A dict nested in a stat (e.g. the
+    hedge delay per route) is flattened the same way, its own keys becoming the ``key`` label.
+    """
+    samples: Dict[str, list] = {}
+    for key, value in stats.items():
+        if isinstance(value, dict):
+            for stat, item in value.items():
+                if isinstance(item, dict):
+                    for inner, inner_value in item.items():
+                        _add_sample(samples, inner, {'key': _label(stat)}, inner_value)
+                else:
+                    _add_sample(samples, stat, {'key': _label(key)}, item)
+        else:
+            _add_sample(samples, key, {}, value)
+    return iter(samples.items())
+
+
+def _label(key: Any) -> str:
+    return str(getattr(key, 'value', key))
+
+
+def _add_sample(samples: Dict[str, list], stat: str, labels: Dict[str, str], value: Any) -> None:
+    if isinstance(value, bool):
+        value = int(value)
+    if isinstance(value, str):
+        samples.setdefault(stat, []).append((dict(labels, **{stat: value}), 1))
+    elif isinstance(value, (int, float)):
+        samples.setdefault(stat, []).append((labels, value))
+
+
+def _family(lines: List[str], name: str, kind: str, description: str, samples: list) -> None:
+    if not samples:
+        return
+    lines.append(f'# HELP {name} {description}')
+    lines.append(f'# TYPE {name} {kind}')
+    lines.extend(_sample(name, labels, value) for labels, value in samples)
+
+
+def _sample(name: str, labels: Dict[str, str], value: float) -> str:
+    if not labels:
+        return f'{name} {_number(value)}'
+    rendered = ','.join(f'{key}="{_escape(str(item))}"' for key, item in labels.items())
+    return f'{name}{{{rendered}}} {_number(value)}'
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _number(value: float) -> str:
+    if value == math.inf:
+        return '+Inf'
+    if isinstance(value, float) and value.is_integer():
+        return repr(value)
+    return str(value)
+
+
+def _metric_name(name: str) -> str:
+    return ''.join(char if char.isalnum() else '_' for char in str(name))
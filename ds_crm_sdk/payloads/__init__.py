@@ -1,5 +1,12 @@
-from .builders import MainPayloadBuilder
-from .base_builder import PayloadBuilder
+from typing import TYPE_CHECKING
+from ds_crm_sdk.utils import lazy_attributes
+
+if TYPE_CHECKING:
+    from .builders import MainPayloadBuilder
+    from .base_builder import PayloadBuilder
+
+__getattr__, __dir__ = lazy_attributes(__name__, {'MainPayloadBuilder': '.builders',
+                                                  'PayloadBuilder': '.base_builder'})
 
 __all__ = ['PayloadBuilder']
 
@@ -1,10 +1,69 @@
 """
 MainPayloadBuilder is responsible for constructing the main payload
 """
+from enum import Enum
+from functools import lru_cache
+from typing import Any, FrozenSet, NamedTuple, Tuple
+from pydantic_core import to_jsonable_python
 from ds_crm_sdk.constants import ClientOrigin
 from .base_builder import PayloadBuilder
 from .factory import get_main_payload_builder
 
+_JSON_SCALARS = (str, int, bool, type(None))
+
+try:
+    # model_dump(mode='json') serialises non-finite floats as None
+    to_jsonable_python(0.0, inf_nan_mode='null')
+    _JSONABLE_OPTIONS = {'inf_nan_mode': 'null'}
+except TypeError:  # pragma: no cover - older pydantic-core
+    _JSONABLE_OPTIONS = {}
+
+
+class _PayloadTemplate(NamedTuple):
+    """
+    Precompiled payload layout of a client origin: the payload model fields in declaration order
+    with their JSON-serialised defaults, and the set of keys accepted by the model.
+    """
+    model_name: str
+    fields: Tuple[Tuple[str, Any], ...]
+    allowed_keys: FrozenSet[str]
+
+
+@lru_cache(maxsize=None)
+def _compile_template(client_origin: str) -> _PayloadTemplate:
+    """
+    Compile the payload template of a client origin from its pydantic payload model.
+    :param client_origin: The client origin value.
+    :return: The compiled template.
+    :raises ValueError: If the client origin is not supported.
+    """
+    model = get_main_payload_builder(client_origin=client_origin)
+    defaults = model.model_dump(mode='json')
+    return _PayloadTemplate(
+        model_name=model.__class__.__name__,
+        fields=tuple((name, defaults[name]) for name in type(model).model_fields),
+        allowed_keys=frozenset(type(model).model_fields),
+    )
+
+
+def _to_json(value: Any) -> Any:
+    """
+    Serialise a payload value the way ``model_dump(mode='json')`` does.
+    Plain scalars, enums and str-keyed dicts/lists are converted inline (exact types only,
+    so subclasses keep pydantic's handling); anything else goes through pydantic-core.
+    """
+    # pylint: disable=unidiomatic-typecheck
+    value_type = type(value)
+    if value_type in _JSON_SCALARS:
+        return value
+    if isinstance(value, Enum):
+        return value.value
+    if value_type is dict and all(type(key) is str for key in value):
+        return {key: _to_json(item) for key, item in value.items()}
+    if value_type is list:
+        return [_to_json(item) for item in value]
+    return to_jsonable_python(value, **_JSONABLE_OPTIONS)
+
 
 class MainPayloadBuilder(PayloadBuilder):
     """
@@ -19,20 +78,54 @@ class MainPayloadBuilder(PayloadBuilder):
 
     def build_main_payload(self, **extra) -> dict:
         """
-        Build and return the payload as a Pydantic model based on the client type.
+        Build and return the main payload for the client type.
+        Uses the payload template compiled once per client origin, producing the same dict as
+        dumping the pydantic payload model (None values excluded, filters merged to the top level)
+        without instantiating a model per request.
+        :param extra: Additional parameters that may be needed for the payload.
+        :return: The payload as a JSON-compatible dictionary.
+        """
+        origin = self.client_origin
+        template = _compile_template(origin.value if isinstance(origin, Enum) else origin)
+        for key in extra:
+            if key not in template.allowed_keys:
+                raise ValueError(f"Invalid key '{key}' for payload model {template.model_name}")
+        payload = {}
+        filters = None
+        for name, default in template.fields:
+            value = extra.get(name)
+            if value is None:
+                if default is None:
+                    continue
+                value = default
+            else:
+                value = _to_json(value)
+            if name == 'filters' and isinstance(value, dict):
+                filters = value
+                continue
+            payload[name] = value
+        if filters:
+            payload.update(filters)
+        return payload
+
+    def _build_with_model(self, **extra) -> dict:
+        """
+        Build the main payload by populating and dumping a pydantic payload model.
+        Reference implementation of ``build_main_payload``.
         :param extra: Additional parameters that may be needed for the payload.
-        :return: An instance of the appropriate payload model (pydantic basemodel)
+        :return: The payload as a JSON-compatible dictionary.
         """
         payload_container = get_main_payload_builder(client_origin=self.client_origin)
         if extra:
             for key, value in extra.items():
                 if not hasattr(payload_container, key):
                     # If the key exists in the payload model, set its value
-                    raise ValueError(f"Invalid key '{key}' for payload model {payload_container.__class__.__name__}")
+                    raise ValueError(f"Invalid key '{key}' for payload model "
+                                     f"{payload_container.__class__.__name__}")
                 if value is None:
                     continue
                 setattr(payload_container, key, value)
-        payload = payload_container.model_dump(exclude_none=True, mode='json')  # Exclude None values from the payload
+        payload = payload_container.model_dump(exclude_none=True, mode='json')
         if 'filters' in payload and isinstance(payload['filters'], dict):
             payload.update({**payload.pop('filters')})
         return payload
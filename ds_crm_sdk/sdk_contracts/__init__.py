@@ -1,3 +1,9 @@
-from .crm import CRMClientAPI
+from typing import TYPE_CHECKING
+from ds_crm_sdk.utils import lazy_attributes
+
+if TYPE_CHECKING:
+    from .crm import CRMClientAPI
+
+__getattr__, __dir__ = lazy_attributes(__name__, {'CRMClientAPI': '.crm'})
 
 __all__ = ['CRMClientAPI']
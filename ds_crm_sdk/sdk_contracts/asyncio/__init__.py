@@ -1,3 +1,9 @@
-from .crm import AsyncCRMClientAPI
+from typing import TYPE_CHECKING
+from ds_crm_sdk.utils import lazy_attributes
+
+if TYPE_CHECKING:
+    from .crm import AsyncCRMClientAPI
+
+__getattr__, __dir__ = lazy_attributes(__name__, {'AsyncCRMClientAPI': '.crm'})
 
 __all__ = ['AsyncCRMClientAPI']
\ No newline at end of file
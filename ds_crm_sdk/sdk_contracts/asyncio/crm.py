@@ -1,4 +1,6 @@
 from abc import ABC, abstractmethod
+from typing import AsyncIterator, Collection, Iterable
+from ds_crm_sdk.dtos import AccountRequestDTO
 
 
 class AsyncCRMClientAPI(ABC):
@@ -79,3 +81,135 @@ class AsyncCRMClientAPI(ABC):
         """
         ...
 
+    @abstractmethod
+    def aiter_accounts(self, filters: dict = None, page_size: int = 100,
+                       sort_by: str = 'name', sort_order: str = 'DESC',
+                       prefetch: int = 1, max_items: int = None) -> AsyncIterator:
+        """
+        Asynchronously iterate over all accounts matching the filters, page by page.
+        :param filters: A dictionary containing the filters to apply (optional).
+        :param page_size: The number of accounts requested per page.
+        :param sort_by: The field to sort by, default is 'name'.
+        :param sort_order: The order of sorting, default is descending (DESC).
+        :param prefetch: The number of pages fetched ahead of the one being consumed.
+        :param max_items: Maximum number of accounts to yield (optional).
+        :return: An async iterator over account records.
+        """
+        ...
+
+    @abstractmethod
+    def aiter_account_addresses(self, account_id: str, filters: dict = None,
+                                page_size: int = 100, sort_by: str = 'created',
+                                sort_order: str = 'DESC', prefetch: int = 1,
+                                max_items: int = None) -> AsyncIterator:
+        """
+        Asynchronously iterate over all addresses of an account, page by page.
+        :param account_id: The ID of the account whose addresses are to be retrieved.
+        :param filters: A dictionary containing the filters to apply (optional).
+        :param page_size: The number of addresses requested per page.
+        :param sort_by: The field to sort by, default is 'created'.
+        :param sort_order: The order of sorting, default is descending (DESC).
+        :param prefetch: The number of pages fetched ahead of the one being consumed.
+        :param max_items: Maximum number of addresses to yield (optional).
+        :return: An async iterator over address records.
+        """
+        ...
+
+    @abstractmethod
+    def aiter_account_types(self, filters: dict = None, page_size: int = 100,
+                            sort_by: str = 'created', sort_order: str = 'DESC',
+                            prefetch: int = 1, max_items: int = None) -> AsyncIterator:
+        """
+        Asynchronously iterate over all account types matching the filters, page by page.
+        :param filters: A dictionary containing the filters to apply (optional).
+        :param page_size: The number of account types requested per page.
+        :param sort_by: The field to sort by, default is 'created'.
+        :param sort_order: The order of sorting, default is descending (DESC).
+        :param prefetch: The number of pages fetched ahead of the one being consumed.
+        :param max_items: Maximum number of account types to yield (optional).
+        :return: An async iterator over account type records.
+        """
+        ...
+
+    @abstractmethod
+    def astream_accounts(self, filters: dict = None, offset=0, limit=1000,
+                         sort_by: str = 'name', sort_order: str = 'DESC',
+                         max_body_size: int = None) -> AsyncIterator:
+        """
+        Asynchronously stream the accounts of one (large) page, decoding them as they arrive.
+        :param filters: A dictionary containing the filters to apply (optional).
+        :param offset: Starting point for pagination, default is 0.
+        :param limit: The number of accounts requested.
+        :param sort_by: The field to sort by, default is 'name'.
+        :param sort_order: The order of sorting, default is descending (DESC).
+        :param max_body_size: Maximum response size in bytes (optional).
+        :return: An async iterator over account records.
+        """
+        ...
+
+    @abstractmethod
+    def astream_account_addresses(self, account_id: str, filters: dict = None, offset=0,
+                                  limit=1000, sort_by: str = 'created', sort_order: str = 'DESC',
+                                  max_body_size: int = None) -> AsyncIterator:
+        """
+        Asynchronously stream the addresses of an account from one (large) page.
+        :param account_id: The ID of the account whose addresses are to be retrieved.
+        :param filters: A dictionary containing the filters to apply (optional).
+        :param offset: Starting point for pagination, default is 0.
+        :param limit: The number of addresses requested.
+        :param sort_by: The field to sort by, default is 'created'.
+        :param sort_order: The order of sorting, default is descending (DESC).
+        :param max_body_size: Maximum response size in bytes (optional).
+        :return: An async iterator over address records.
+        """
+        ...
+
+    @abstractmethod
+    async def get_accounts_by_ids(self, account_ids: Iterable[str], concurrency: int = 10,
+                                  fatal_statuses: Collection[int] = (401, 403)) -> list:
+        """
+        Get many accounts by ID with bounded concurrency.
+        :param account_ids: The IDs of the accounts to retrieve.
+        :param concurrency: Maximum number of concurrent requests.
+        :param fatal_statuses: Status codes that cancel the outstanding lookups and raise.
+        :return: One result (data and http status code) per ID, in input order.
+        """
+        ...
+
+    @abstractmethod
+    async def get_account_addresses_by_ids(self, account_id: str, address_ids: Iterable[str],
+                                           concurrency: int = 10,
+                                           fatal_statuses: Collection[int] = (401, 403)) -> list:
+        """
+        Get many addresses of an account by ID with bounded concurrency.
+        :param account_id: The ID of the account the addresses belong to.
+        :param address_ids: The IDs of the addresses to retrieve.
+        :param concurrency: Maximum number of concurrent requests.
+        :param fatal_statuses: Status codes that cancel the outstanding lookups and raise.
+        :return: One result (data and http status code) per ID, in input order.
+        """
+        ...
+
+    @abstractmethod
+    async def get_account_types_by_ids(self, type_ids: Iterable[str], concurrency: int = 10,
+                                       fatal_statuses: Collection[int] = (401, 403)) -> list:
+        """
+        Get many account types by ID with bounded concurrency.
+        :param type_ids: The IDs of the account types to retrieve.
+        :param concurrency: Maximum number of concurrent requests.
+        :param fatal_statuses: Status codes that cancel the outstanding lookups and raise.
+        :return: One result (data and http status code) per ID, in input order.
+        """
+        ...
+
+    @abstractmethod
+    async def create_accounts(self, accounts: Iterable[AccountRequestDTO], concurrency: int = 10,
+                              fatal_statuses: Collection[int] = (401, 403)):
+        """
+        Create many accounts concurrently.
+        :param accounts: The account data to create, one item per account.
+        :param concurrency: Maximum number of concurrent create requests.
+        :param fatal_statuses: Status codes that cancel the outstanding requests and raise.
+        :return: A report of the successes and failures keyed by input index.
+        """
+        ...
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Collection, Iterable, Iterator
 from ds_crm_sdk.dtos import AccountRequestDTO
 
 
@@ -80,6 +81,88 @@ class CRMClientAPI(ABC):
         """
         ...
 
+    @abstractmethod
+    def iter_accounts(self, filters: dict = None, page_size: int = 100,
+                      sort_by: str = 'name', sort_order: str = 'DESC',
+                      prefetch: int = 1, max_items: int = None) -> Iterator:
+        """
+        Iterate over all accounts matching the filters, page by page.
+        :param filters: A dictionary containing the filters to apply (optional).
+        :param page_size: The number of accounts requested per page.
+        :param sort_by: The field to sort by, default is 'name'.
+        :param sort_order: The order of sorting, default is descending (DESC).
+        :param prefetch: The number of pages fetched ahead of the one being consumed.
+        :param max_items: Maximum number of accounts to yield (optional).
+        :return: An iterator over account records.
+        """
+        ...
+
+    @abstractmethod
+    def iter_account_addresses(self, account_id: str, filters: dict = None, page_size: int = 100,
+                               sort_by: str = 'created', sort_order: str = 'DESC',
+                               prefetch: int = 1, max_items: int = None) -> Iterator:
+        """
+        Iterate over all addresses of an account, page by page.
+        :param account_id: The ID of the account whose addresses are to be retrieved.
+        :param filters: A dictionary containing the filters to apply (optional).
+        :param page_size: The number of addresses requested per page.
+        :param sort_by: The field to sort by, default is 'created'.
+        :param sort_order: The order of sorting, default is descending (DESC).
+        :param prefetch: The number of pages fetched ahead of the one being consumed.
+        :param max_items: Maximum number of addresses to yield (optional).
+        :return: An iterator over address records.
+        """
+        ...
+
+    @abstractmethod
+    def iter_account_types(self, filters: dict = None, page_size: int = 100,
+                           sort_by: str = 'created', sort_order: str = 'DESC',
+                           prefetch: int = 1, max_items: int = None) -> Iterator:
+        """
+        Iterate over all account types matching the filters, page by page.
+        :param filters: A dictionary containing the filters to apply (optional).
+        :param page_size: The number of account types requested per page.
+        :param sort_by: The field to sort by, default is 'created'.
+        :param sort_order: The order of sorting, default is descending (DESC).
+        :param prefetch: The number of pages fetched ahead of the one being consumed.
+        :param max_items: Maximum number of account types to yield (optional).
+        :return: An iterator over account type records.
+        """
+        ...
+
+    @abstractmethod
+    def stream_accounts(self, filters: dict = None, offset=0, limit=1000,
+                        sort_by: str = 'name', sort_order: str = 'DESC',
+                        max_body_size: int = None) -> Iterator:
+        """
+        Stream the accounts of one (large) page, decoding them one by one as they arrive.
+        :param filters: A dictionary containing the filters to apply (optional).
+        :param offset: Starting point for pagination, default is 0.
+        :param limit: The number of accounts requested.
+        :param sort_by: The field to sort by, default is 'name'.
+        :param sort_order: The order of sorting, default is descending (DESC).
+        :param max_body_size: Maximum response size in bytes (optional).
+        :return: An iterator over account records.
+        """
+        ...
+
+    @abstractmethod
+    def stream_account_addresses(self, account_id: str, filters: dict = None, offset=0,
+                                 limit=1000, sort_by: str = 'created', sort_order: str = 'DESC',
+                                 max_body_size: int = None) -> Iterator:
+        """
+        Stream the addresses of an account from one (large) page, decoding them one by one.
+        :param account_id: The ID of the account whose addresses are to be retrieved.
+        :param filters: A dictionary containing the filters to apply (optional).
+        :param offset: Starting point for pagination, default is 0.
+        :param limit: The number of addresses requested.
+        :param sort_by: The field to sort by, default is 'created'.
+        :param sort_order: The order of sorting, default is descending (DESC).
+        :param max_body_size: Maximum response size in bytes (optional).
+        :return: An iterator over address records.
+        """
+        ...
+
     @abstractmethod
     def create_account(self, account_data: AccountRequestDTO) -> tuple:
         """
@@ -89,3 +172,14 @@ class CRMClientAPI(ABC):
         """
         ...
 
+    @abstractmethod
+    def create_accounts(self, accounts: Iterable[AccountRequestDTO], concurrency: int = 10,
+                        fatal_statuses: Collection[int] = (401, 403)):
+        """
+        Create many accounts concurrently.
+        :param accounts: The account data to create, one item per account.
+        :param concurrency: Maximum number of concurrent create requests.
+        :param fatal_statuses: Status codes that cancel the outstanding requests and raise.
+        :return: A report of the successes and failures keyed by input index.
+        """
+        ...
@@ -0,0 +1,10 @@
+from typing import TYPE_CHECKING
+from ds_crm_sdk.utils import lazy_attributes
+
+if TYPE_CHECKING:
+    from .http import DSAsyncHTTPTransport, DSHTTPTransport
+
+__getattr__, __dir__ = lazy_attributes(__name__, {'DSHTTPTransport': '.http',
+                                                  'DSAsyncHTTPTransport': '.http'})
+
+__all__ = ["DSHTTPTransport", "DSAsyncHTTPTransport"]
@@ -1,4 +1,23 @@
-from .http_async import DSAsyncHTTPTransport
-from .http_sync import DSHTTPTransport
+from typing import TYPE_CHECKING
+from ds_crm_sdk.utils import lazy_attributes
 
-__all__ = ["DSHTTPTransport", "DSAsyncHTTPTransport"]
+if TYPE_CHECKING:
+    from .circuit import CircuitBreakerRegistry
+    from .codec import JSONCodec, get_codec
+    from .hooks import RequestEvent, RequestHooks
+    from .http_async import DSAsyncHTTPTransport
+    from .http_sync import DSHTTPTransport
+    from .ratelimit import RateLimiter
+    from .retry import RetryBudget, RetryPolicy
+    from .tokens import CachedTokenProvider
+
+# Only the transport in use is imported, with its HTTP library (requests or httpx)
+__getattr__, __dir__ = lazy_attributes(__name__, {
+    'CircuitBreakerRegistry': '.circuit', 'JSONCodec': '.codec', 'get_codec': '.codec',
+    'RequestEvent': '.hooks', 'RequestHooks': '.hooks', 'DSAsyncHTTPTransport': '.http_async',
+    'DSHTTPTransport': '.http_sync', 'RateLimiter': '.ratelimit', 'RetryBudget': '.retry',
+    'RetryPolicy': '.retry', 'CachedTokenProvider': '.tokens'})
+
+__all__ = ["DSHTTPTransport", "DSAsyncHTTPTransport", "CachedTokenProvider", "RetryPolicy",
+           "RetryBudget", "CircuitBreakerRegistry", "RateLimiter", "JSONCodec", "get_codec",
+           "RequestHooks", "RequestEvent"]
@@ -1,9 +1,10 @@
 """
 Base classes for HTTP transport layer
 """
+import inspect
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import Optional, Dict, Tuple, Callable
+from typing import Any, AsyncIterator, Iterator, Optional, Dict, Tuple, Callable, Type
 from pydantic import BaseModel
 
 
@@ -27,7 +28,9 @@ class HTTPTransport(ABC):
     @abstractmethod
     def send(self, method: HTTPMethod, endpoint: str,
              payload: dict = None, params: dict = None,
-             headers: Optional[Dict[str, str]] = None) -> Tuple[Optional[dict], int]:
+             headers: Optional[Dict[str, str]] = None, *,
+             route: Optional[str] = None,
+             response_model: Optional[Type[BaseModel]] = None) -> Tuple[Any, int]:
         """
         Abstract method that can be used by sync http concreate classes to send requests
         :param method: HTTPMethod Enum
@@ -35,9 +38,30 @@ class HTTPTransport(ABC):
         :param payload: payload of the request
         :param params: params, if the request needs params
         :param headers: headers used for the request
+        :param route: The endpoint template of the request (e.g. for per-route circuit breaking)
+        :param response_model: Pydantic model to validate successful responses into,
+                               directly from the response bytes, instead of returning a dict
         :return: Tuple with data and status code
         """
 
+    def stream(self, endpoint: str, result_key: str, params: dict = None,
+               headers: Optional[Dict[str, str]] = None, *,
+               route: Optional[str] = None, item_model: Optional[Type[BaseModel]] = None,
+               max_body_size: Optional[int] = None) -> Iterator[Any]:
+        """
+        Send a GET request and yield the records under ``result_key`` as they are received.
+        Transports that cannot stream responses do not implement it.
+        :param endpoint: CRM service endpoint
+        :param result_key: Top-level key of the records array in the response
+        :param params: params, if the request needs params
+        :param headers: headers used for the request
+        :param route: The endpoint template of the request (e.g. for per-route circuit breaking)
+        :param item_model: Pydantic model to validate every record into
+        :param max_body_size: Maximum number of body bytes to accept
+        :return: Iterator over the records
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support streaming")
+
 
 class AsyncHTTPTransport(ABC):
     """
@@ -46,7 +70,9 @@ class AsyncHTTPTransport(ABC):
     @abstractmethod
     async def send(self, method: HTTPMethod, endpoint: str,
                    payload: dict = None, params: dict = None,
-                   headers: Optional[Dict[str, str]] = None) -> Tuple[Optional[dict], int]:
+                   headers: Optional[Dict[str, str]] = None, *,
+                   route: Optional[str] = None,
+                   response_model: Optional[Type[BaseModel]] = None) -> Tuple[Any, int]:
         """
         Abstract method that can be used by async http concreate classes to send requests
         :param method: HTTPMethod Enum
@@ -54,9 +80,30 @@ class AsyncHTTPTransport(ABC):
         :param payload: payload of the request
         :param params: params, if the request needs params
         :param headers: headers used for the request
+        :param route: The endpoint template of the request (e.g. for per-route circuit breaking)
+        :param response_model: Pydantic model to validate successful responses into,
+                               directly from the response bytes, instead of returning a dict
         :return: Tuple with data and status code
         """
 
+    def stream(self, endpoint: str, result_key: str, params: dict = None,
+               headers: Optional[Dict[str, str]] = None, *,
+               route: Optional[str] = None, item_model: Optional[Type[BaseModel]] = None,
+               max_body_size: Optional[int] = None) -> AsyncIterator[Any]:
+        """
+        Send a GET request and asynchronously yield the records under ``result_key`` as they
+        are received. Transports that cannot stream responses do not implement it.
+        :param endpoint: CRM service endpoint
+        :param result_key: Top-level key of the records array in the response
+        :param params: params, if the request needs params
+        :param headers: headers used for the request
+        :param route: The endpoint template of the request (e.g. for per-route circuit breaking)
+        :param item_model: Pydantic model to validate every record into
+        :param max_body_size: Maximum number of body bytes to accept
+        :return: Async iterator over the records
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support streaming")
+
 
 class HTTPHeaderTokenProvider:
     """
@@ -82,3 +129,22 @@ class HTTPHeaderTokenProvider:
             headers["Authorization"] = f"{self.token_provider()}"
         return headers
 
+    async def aset_headers(self, extra: dict = None) -> Dict[str, str]:
+        """
+        Async variant of ``set_headers`` for async transports.
+        Providers exposing ``aget`` (e.g. CachedTokenProvider) are awaited through it, and
+        providers returning an awaitable are awaited, so token fetches don't block the loop.
+        :param extra: Additional header fields, if needed
+        :return: Dict of header fields and values
+        """
+        headers = extra.copy() if extra else {}
+        if self.token_provider and callable(self.token_provider):
+            if hasattr(self.token_provider, 'aget'):
+                token = self.token_provider.aget()
+            else:
+                token = self.token_provider()
+            if inspect.isawaitable(token):
+                token = await token
+            headers["Authorization"] = f"{token}"
+        return headers
+
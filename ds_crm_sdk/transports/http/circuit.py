@@ -0,0 +1,202 @@
+"""
+Per-route circuit breakers for the HTTP transports.
+"""
+import threading
+import time
+from collections import deque
+from enum import Enum
+from typing import Callable, Deque, Dict, Optional
+from ds_crm_sdk.logging import logger
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+StateChangeHook = Callable[[str, str, str], None]
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker of a single route.
+
+    The outcomes of the last ``window_size`` calls are tracked; once at least ``minimum_calls``
+    were recorded and the failure rate reaches ``failure_rate_threshold`` the circuit opens and
+    calls fail fast. After ``open_timeout`` seconds up to ``half_open_max_calls`` probe calls are
+    let through: if all succeed the circuit closes, a single failure opens it again.
+    """
+
+    def __init__(self, route: str, failure_rate_threshold: float = 0.5, minimum_calls: int = 10,
+                 window_size: int = 20, open_timeout: float = 30.0, half_open_max_calls: int = 1,
+                 on_state_change: Optional[StateChangeHook] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize the breaker.
+        :param route: The route (endpoint template) guarded by the breaker.
+        :param failure_rate_threshold: Failure rate (0-1] at which the circuit opens.
+        :param minimum_calls: Calls needed in the window before the failure rate is evaluated.
+        :param window_size: Number of most recent calls the failure rate is computed over.
+        :param open_timeout: Seconds the circuit stays open before probing the route again.
+        :param half_open_max_calls: Probe calls allowed (and needed to close) while half-open.
+        :param on_state_change: Callable receiving the route, the old and the new state.
+        :param clock: Monotonic clock, mainly for tests.
+        """
+        if not 0 < failure_rate_threshold <= 1:
+            raise ValueError("failure_rate_threshold must be in (0, 1]")
+        if minimum_calls < 1 or window_size < minimum_calls or half_open_max_calls < 1:
+            raise ValueError("minimum_calls and half_open_max_calls must be at least 1 "
+                             "and window_size at least minimum_calls")
+        self.route = route
+        self._failure_rate_threshold = failure_rate_threshold
+        self._minimum_calls = minimum_calls
+        self._open_timeout = open_timeout
+        self._half_open_max_calls = half_open_max_calls
+        self._on_state_change = on_state_change
+        self._clock = clock
+        self._outcomes: Deque[bool] = deque(maxlen=window_size)
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._probes = 0
+        self._probe_successes = 0
+        # Bumped on every state change; starts at 1 so that tickets are truthy
+        self._generation = 1
+        self._rejected = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """
+        The current state: CLOSED, OPEN or HALF_OPEN.
+        """
+        with self._lock:
+            return self._state
+
+    def allow(self) -> Optional[int]:
+        """
+        Check whether a call may go through, claiming a probe slot when half-open.
+        Every allowed call must be followed by ``record`` with the returned ticket.
+        :return: A ticket of the current state if the call may be sent, None if it should
+                 fail fast.
+        """
+        with self._lock:
+            old_state = self._state
+            if self._state == OPEN and self._clock() - self._opened_at >= self._open_timeout:
+                self._transition(HALF_OPEN)
+            if self._state == CLOSED:
+                ticket = self._generation
+            elif self._state == HALF_OPEN and self._probes < self._half_open_max_calls:
+                self._probes += 1
+                ticket = self._generation
+            else:
+                self._rejected += 1
+                ticket = None
+            new_state = self._state
+        self._notify(old_state, new_state)
+        return ticket
+
+    def record(self, ticket: int, success: Optional[bool]) -> None:
+        """
+        Record the outcome of an allowed call. Outcomes of calls allowed before the last state
+        change are ignored, so a slow call admitted while closed cannot count as a probe.
+        :param ticket: The ticket returned by ``allow`` for the call.
+        :param success: Whether the call succeeded; None releases the call without an outcome
+                        (e.g. when it was cancelled).
+        """
+        with self._lock:
+            if ticket != self._generation:
+                return
+            old_state = self._state
+            if self._state == HALF_OPEN:
+                self._probes -= 1
+                if success is False:
+                    self._transition(OPEN)
+                elif success:
+                    self._probe_successes += 1
+                    if self._probe_successes >= self._half_open_max_calls:
+                        self._transition(CLOSED)
+            elif self._state == CLOSED and success is not None:
+                self._outcomes.append(success)
+                failures = self._outcomes.count(False)
+                if (len(self._outcomes) >= self._minimum_calls
+                        and failures / len(self._outcomes) >= self._failure_rate_threshold):
+                    self._transition(OPEN)
+            new_state = self._state
+        self._notify(old_state, new_state)
+
+    def stats(self) -> dict:
+        """
+        Snapshot of the breaker.
+        :return: Dict with the state, calls and failures in the window and fast-failed calls.
+        """
+        with self._lock:
+            return {'state': self._state, 'calls': len(self._outcomes),
+                    'failures': self._outcomes.count(False), 'rejected': self._rejected}
+
+    def _transition(self, state: str) -> None:
+        self._state = state
+        self._generation += 1
+        self._outcomes.clear()
+        self._probes = 0
+        self._probe_successes = 0
+        if state == OPEN:
+            self._opened_at = self._clock()
+
+    def _notify(self, old_state: str, new_state: str) -> None:
+        if old_state == new_state:
+            return
+        logger.warning("[circuit_breaker] {route}: {old_state} -> {new_state}", route=self.route,
+                       old_state=old_state, new_state=new_state)
+        if self._on_state_change is not None:
+            try:
+                self._on_state_change(self.route, old_state, new_state)
+            except Exception:  # pylint: disable=broad-exception-caught
+                logger.exception("[circuit_breaker] {route}: on_state_change callback failed",
+                                 route=self.route)
+
+
+class CircuitBreakerRegistry:
+    """
+    Circuit breakers keyed by route (endpoint template), created on first use with shared
+    settings. Pass one to a transport to fail fast on routes that are failing.
+    """
+
+    def __init__(self, failure_rate_threshold: float = 0.5, minimum_calls: int = 10,
+                 window_size: int = 20, open_timeout: float = 30.0, half_open_max_calls: int = 1,
+                 on_state_change: Optional[StateChangeHook] = None,
+                 is_failure: Callable[[int], bool] = lambda status_code: int(status_code) >= 500,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize the registry; the settings are applied to every breaker (see CircuitBreaker).
+        :param is_failure: Callable deciding whether a response status code counts as a failure,
+                           by default any 5xx (including transport errors and timeouts).
+        """
+        self._settings = {'failure_rate_threshold': failure_rate_threshold,
+                          'minimum_calls': minimum_calls, 'window_size': window_size,
+                          'open_timeout': open_timeout, 'half_open_max_calls': half_open_max_calls,
+                          'on_state_change': on_state_change, 'clock': clock}
+        self.is_failure = is_failure
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+        CircuitBreaker(route='', **self._settings)  # validate the settings eagerly
+
+    def get(self, route: str) -> CircuitBreaker:
+        """
+        Return the breaker of a route, creating it on first use.
+        :param route: The route (endpoint template string or endpoint Enum member).
+        :return: The route's CircuitBreaker.
+        """
+        route = route.value if isinstance(route, Enum) else route
+        breaker = self._breakers.get(route)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.setdefault(route, CircuitBreaker(route=route,
+                                                                          **self._settings))
+        return breaker
+
+    def stats(self) -> Dict[str, dict]:
+        """
+        Snapshot of every breaker.
+        :return: Dict of breaker stats keyed by route.
+        """
+        with self._lock:
+            breakers = list(self._breakers.values())
+        return {breaker.route: breaker.stats() for breaker in breakers}
@@ -0,0 +1,114 @@
+"""
+JSON codecs used by the HTTP transports to encode request bodies and decode responses.
+
+orjson and msgspec are optional dependencies (``pip install ds_crm_sdk[orjson]`` or
+``ds_crm_sdk[msgspec]``); ``get_codec`` picks the fastest one installed and falls back to the
+standard library ``json`` module. A library is only imported once a codec using it is created.
+"""
+import importlib
+import json
+from importlib.util import find_spec
+from typing import Any, Dict, Optional, Type
+
+
+def _import(module: str) -> Any:
+    library = module.partition('.')[0]
+    try:
+        return importlib.import_module(module)
+    except ImportError as e:
+        raise ImportError(f"{library} is not installed; pip install ds_crm_sdk[{library}]") from e
+
+
+class JSONCodec:
+    """
+    Standard library JSON codec, the fallback when no faster library is installed.
+    Subclass it to plug another JSON library into the transports.
+    """
+    name = 'json'
+    library = 'json'
+    content_type = 'application/json'
+
+    def dumps(self, obj: Any) -> bytes:
+        """
+        Encode an object to UTF-8 JSON bytes.
+        :param obj: The object to encode (dicts, lists, str, numbers, bools and None).
+        :return: The encoded JSON document.
+        """
+        return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+    def loads(self, data: bytes) -> Any:
+        """
+        Decode a JSON document.
+        :param data: The raw JSON bytes (or str).
+        :return: The decoded object.
+        """
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """
+    JSON codec backed by orjson.
+    """
+    name = 'orjson'
+    library = 'orjson'
+
+    def __init__(self):
+        orjson = _import(self.library)
+        self._dumps = orjson.dumps
+        self._loads = orjson.loads
+        self._option = orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._dumps(obj, option=self._option)
+
+    def loads(self, data: bytes) -> Any:
+        return self._loads(data)
+
+
+class MsgspecCodec(JSONCodec):
+    """
+    JSON codec backed by msgspec, reusing one encoder and decoder.
+    """
+    name = 'msgspec'
+    library = 'msgspec'
+
+    def __init__(self):
+        msgspec_json = _import(f'{self.library}.json')
+        self._encoder = msgspec_json.Encoder()
+        self._decoder = msgspec_json.Decoder()
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj)
+
+    def loads(self, data: bytes) -> Any:
+        return self._decoder.decode(data)
+
+
+CODECS: Dict[str, Type[JSONCodec]] = {
+    OrjsonCodec.name: OrjsonCodec,
+    MsgspecCodec.name: MsgspecCodec,
+    JSONCodec.name: JSONCodec,
+}
+
+
+def available_codecs() -> Dict[str, Type[JSONCodec]]:
+    """
+    The codecs whose library is installed, fastest first.
+    :return: Dict of codec classes keyed by name.
+    """
+    return {name: codec for name, codec in CODECS.items() if find_spec(codec.library) is not None}
+
+
+def get_codec(name: Optional[str] = None) -> JSONCodec:
+    """
+    Create a JSON codec.
+    :param name: 'orjson', 'msgspec' or 'json'; None picks the fastest installed one.
+    :return: The codec instance.
+    :raises ValueError: If the codec name is unknown.
+    :raises ImportError: If the library of the requested codec is not installed.
+    """
+    if name is None:
+        return next(iter(available_codecs().values()))()
+    if name not in CODECS:
+        raise ValueError(f"Unsupported JSON codec: {name}")
+    return CODECS[name]()
@@ -0,0 +1,127 @@
+"""
+Validator store for conditional (ETag / Last-Modified) GET requests.
+"""
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, NamedTuple, Optional, Tuple
+from ds_crm_sdk.utils import freeze
+
+
+class ValidatedResponse(NamedTuple):
+    """
+    Validators and decoded body remembered for a URL + params and caller.
+    """
+    etag: Optional[str]
+    last_modified: Optional[str]
+    data: Any
+
+
+class ConditionalRequestCache:
+    """
+    Thread-safe LRU store of response validators used by the HTTP transports to send
+    ``If-None-Match`` / ``If-Modified-Since`` headers. When the server answers
+    ``304 Not Modified`` the transport returns the remembered decoded body instead of
+    downloading and parsing it again.
+
+    Responses are remembered per client origin (``X-Client-Origin`` header) and, when the
+    transport sends requests on behalf of several users, per the caller ``identity``. The
+    remembered bodies are shared between callers, so treat them as read-only.
+    """
+
+    def __init__(self, maxsize: int = 1024, identity: Optional[Callable[[], Hashable]] = None):
+        """
+        Initialize the store.
+        :param maxsize: Maximum number of URLs to remember; least recently used ones are dropped.
+        :param identity: Callable returning the identity of the caller of the current request
+                         (e.g. a user or tenant ID), when callers may see different bodies for
+                         the same URL. It should not be the token, which changes on refresh.
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self._maxsize = maxsize
+        self._identity = identity
+        self._entries: 'OrderedDict[tuple, ValidatedResponse]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {'conditional_requests': 0, 'not_modified': 0, 'stores': 0, 'evictions': 0}
+
+    def make_key(self, url: str, params: Optional[dict], headers: Optional[Dict[str, str]],
+                 variant: Hashable = None) -> tuple:
+        """
+        Build the key of a request from its URL, params, client origin and caller identity.
+        :param url: The full request URL.
+        :param params: The query params of the request.
+        :param headers: The request headers holding the client origin.
+        :param variant: Distinguishes decodings of the same URL (e.g. the response model).
+        :return: A hashable key.
+        """
+        return (url, freeze(params or {}), variant, (headers or {}).get('X-Client-Origin'),
+                self._identity() if self._identity is not None else None)
+
+    def prepare(self, url: str, params: Optional[dict], headers: Dict[str, str],
+                variant: Hashable = None) -> Tuple[tuple, Optional[ValidatedResponse]]:
+        """
+        Look up the validators of a GET request and add the conditional headers for them.
+        :param url: The full request URL.
+        :param params: The query params of the request.
+        :param headers: The request headers, updated in place.
+        :param variant: Distinguishes decodings of the same URL (e.g. the response model).
+        :return: Tuple of the request key and the remembered response (None if unknown).
+        """
+        key = self.make_key(url, params, headers, variant)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return key, None
+            self._entries.move_to_end(key)
+            self._stats['conditional_requests'] += 1
+        if entry.etag:
+            headers['If-None-Match'] = entry.etag
+        if entry.last_modified:
+            headers['If-Modified-Since'] = entry.last_modified
+        return key, entry
+
+    def not_modified(self, entry: ValidatedResponse) -> Any:
+        """
+        Record a ``304 Not Modified`` answer.
+        :param entry: The remembered response returned by ``prepare``.
+        :return: The remembered decoded body.
+        """
+        with self._lock:
+            self._stats['not_modified'] += 1
+        return entry.data
+
+    def store(self, key: tuple, response_headers: Any, data: Any) -> None:
+        """
+        Remember the validators and decoded body of a successful response.
+        Responses without an ETag or Last-Modified header are not stored.
+        :param key: The request key returned by ``prepare``.
+        :param response_headers: The response headers (case-insensitive mapping).
+        :param data: The decoded response body.
+        """
+        etag = response_headers.get('ETag')
+        last_modified = response_headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return
+        entry = ValidatedResponse(etag=etag, last_modified=last_modified, data=data)
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            self._stats['stores'] += 1
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+                self._stats['evictions'] += 1
+
+    def clear(self) -> None:
+        """
+        Forget every remembered response.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        """
+        Snapshot of the store counters.
+        :return: Dict with conditional requests sent, 304 answers, stores, evictions and size.
+        """
+        with self._lock:
+            return {**self._stats, 'size': len(self._entries)}
@@ -0,0 +1,327 @@
+"""
+Request lifecycle hooks with a per-phase timing breakdown and W3C trace context propagation.
+"""
+import os
+import re
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, Iterator, Optional, Tuple, Union
+from ds_crm_sdk.logging import logger
+
+Hook = Callable[['RequestEvent'], None]
+HookArg = Union[None, Hook, Iterable[Hook]]
+
+TRACEPARENT_HEADER = 'traceparent'
+_TRACEPARENT = re.compile(r'^([0-9a-f]{2})-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$')
+
+# Phases reported by httpx trace events, folded into the phases of a RequestEvent
+_HTTPX_PHASES = {
+    'connection.connect_tcp': 'connect', 'connection.connect_unix_socket': 'connect',
+    'connection.start_tls': 'connect',
+    'http11.send_request_headers': 'ttfb', 'http11.send_request_body': 'ttfb',
+    'http11.receive_response_headers': 'ttfb', 'http11.receive_response_body': 'download',
+    'http2.send_request_headers': 'ttfb', 'http2.send_request_body': 'ttfb',
+    'http2.receive_response_headers': 'ttfb', 'http2.receive_response_body': 'download',
+}
+
+
+@dataclass
+class RequestEvent:
+    """
+    One CRM request as seen by the hooks.
+
+    ``route`` is the endpoint template (e.g. '/api/crm/accounts/{account_id}'), never the
+    expanded URL, so events can be aggregated per endpoint without leaking identifiers.
+    ``timings`` holds the seconds spent per phase:
+
+    * ``build``: building the URL, params, headers and body in the client
+    * ``rate_limit``: waiting for the transport's rate limiter
+    * ``token``: fetching the token and building the request headers
+    * ``encode``: encoding the request body
+    * ``connect``: setting up the connection pool and opening connections, TLS included (the
+      sync transport cannot time connections separately and reports them as part of ``ttfb``)
+    * ``ttfb``: sending the request until the response headers are received
+    * ``download``: reading the response body
+    * ``retry_wait``: sleeping between retries
+    * ``decode``: decoding (or validating) the response body
+    * ``total``: the whole request, from the start of ``build`` or ``send``
+    """
+    method: str
+    route: Optional[str]
+    origin: Optional[str]
+    attempt: int = 1
+    status_code: Optional[int] = None
+    error: Optional[BaseException] = None
+    retry_delay: Optional[float] = None
+    traceparent: Optional[str] = None
+    timings: Dict[str, float] = field(default_factory=dict)
+
+
+class RequestHooks:
+    """
+    Callbacks invoked over the lifecycle of every request:
+
+    * ``on_request_start``: before the request is rate limited, built and sent
+    * ``on_response``: when a status code is known, including 429/503 rejections by the
+      rate limiter and circuit breakers
+    * ``on_error``: when sending failed with an exception; the call returns a 500 then
+    * ``on_retry``: before sleeping for a retry, with the attempt that failed
+
+    Each accepts a callable or a list of callables receiving the RequestEvent. Exceptions
+    raised by callbacks are logged and never affect the request. With ``traceparent`` a W3C
+    ``traceparent`` header is added to every request that has none: True starts a new trace
+    per request, a callable returning the current ``traceparent`` (or None) continues the
+    caller's trace with a new span id.
+    """
+
+    def __init__(self, on_request_start: HookArg = None, on_response: HookArg = None,
+                 on_error: HookArg = None, on_retry: HookArg = None,
+                 traceparent: Union[bool, Callable[[], Optional[str]]] = False):
+        """
+        Initialize the hooks.
+        :param on_request_start: Callback(s) invoked when a request starts.
+        :param on_response: Callback(s) invoked when a request returned a status code.
+        :param on_error: Callback(s) invoked when a request raised.
+        :param on_retry: Callback(s) invoked before a request is retried.
+        :param traceparent: Inject a W3C ``traceparent`` header: True for a new trace per
+                            request, or a callable returning the parent ``traceparent``.
+        """
+        self.on_request_start = _callbacks(on_request_start)
+        self.on_response = _callbacks(on_response)
+        self.on_error = _callbacks(on_error)
+        self.on_retry = _callbacks(on_retry)
+        self.traceparent = traceparent
+
+
+def _callbacks(hooks: HookArg) -> Tuple[Hook, ...]:
+    if hooks is None:
+        return ()
+    if callable(hooks):
+        return (hooks,)
+    return tuple(hooks)
+
+
+def make_traceparent(parent: Optional[str] = None) -> str:
+    """
+    Build a W3C ``traceparent`` header value for a new span.
+    :param parent: The parent ``traceparent``; its trace id and flags are kept when it is valid.
+    :return: The header value, e.g. '00-<32 hex trace id>-<16 hex span id>-01'.
+    """
+    match = _TRACEPARENT.match(parent) if parent else None
+    if match is not None and match.group(2) != '0' * 32:
+        trace_id, flags = match.group(2), match.group(4)
+    else:
+        trace_id, flags = os.urandom(16).hex(), '01'
+    return f'00-{trace_id}-{os.urandom(8).hex()}-{flags}'
+
+
+class _ClientScope:
+    """
+    Hooks and timings contributed by the client to the requests it sends.
+    """
+    __slots__ = ('hooks', 'timings', 'started')
+
+    def __init__(self, hooks: RequestHooks, started: float, build: float):
+        self.hooks = hooks
+        self.started = started
+        self.timings = {'build': build}
+
+
+_client_scope: ContextVar[Optional[_ClientScope]] = ContextVar('ds_crm_sdk_hooks', default=None)
+
+
+@contextmanager
+def client_hooks(hooks: RequestHooks, started: float) -> Iterator[None]:
+    """
+    Let the transport report the requests sent in this block to the client's hooks as well,
+    with the time spent building them since ``started``.
+    :param hooks: The client's hooks.
+    :param started: ``time.perf_counter()`` when the client call started.
+    """
+    token = _client_scope.set(_ClientScope(hooks, started, time.perf_counter() - started))
+    try:
+        yield
+    finally:
+        _client_scope.reset(token)
+
+
+class RequestTrace:
+    """
+    Collects the phase timings of one request and dispatches its events to the hooks.
+    """
+    __slots__ = ('_hooks', 'event', '_started', '_mark', '_opened')
+
+    def __init__(self, hooks: Tuple[RequestHooks, ...], event: RequestEvent, started: float):
+        self._hooks = hooks
+        self.event = event
+        self._started = started
+        self._mark = time.perf_counter()
+        self._opened: Dict[str, float] = {}
+
+    def start(self) -> None:
+        """
+        Dispatch ``on_request_start``.
+        """
+        self._dispatch('on_request_start')
+
+    def mark(self, phase: str) -> None:
+        """
+        Attribute the time since the previous mark to a phase.
+        :param phase: The phase name, e.g. 'token'.
+        """
+        now = time.perf_counter()
+        timings = self.event.timings
+        timings[phase] = timings.get(phase, 0.0) + now - self._mark
+        self._mark = now
+
+    def add(self, phase: str, seconds: float) -> None:
+        """
+        Add measured time to a phase; the time is not attributed to the next mark.
+        :param phase: The phase name, e.g. 'ttfb'.
+        :param seconds: The time spent in the phase.
+        """
+        self.event.timings[phase] = self.event.timings.get(phase, 0.0) + seconds
+        self._mark += seconds
+
+    def inject(self, headers: Dict[str, str]) -> None:
+        """
+        Add a ``traceparent`` header if a hook asks for one and the request has none.
+        :param headers: The request headers, updated in place.
+        """
+        traceparent = headers.get(TRACEPARENT_HEADER)
+        if traceparent is None:
+            option = next((hooks.traceparent for hooks in self._hooks if hooks.traceparent), None)
+            if option is None:
+                return
+            traceparent = make_traceparent(option() if callable(option) else None)
+            headers[TRACEPARENT_HEADER] = traceparent
+        self.event.traceparent = traceparent
+
+    async def httpx_trace(self, name: str, _info: dict) -> None:
+        """
+        httpx ``trace`` extension, splitting the connection phases out of the request time.
+        """
+        base, _, stage = name.rpartition('.')
+        phase = _HTTPX_PHASES.get(base)
+        if phase is None:
+            return
+        now = time.perf_counter()
+        if stage == 'started':
+            self._opened[base] = now
+        elif base in self._opened:
+            self.add(phase, now - self._opened.pop(base))
+
+    def retry(self, delay: float, status_code: Optional[int] = None,
+              error: Optional[BaseException] = None) -> None:
+        """
+        Dispatch ``on_retry`` for the attempt that failed, then count the next attempt.
+        :param delay: Seconds before the next attempt.
+        :param status_code: Status code of the failed attempt, if it returned.
+        :param error: Exception of the failed attempt, if it raised.
+        """
+        self.mark('ttfb')
+        event = self.event
+        event.status_code, event.error, event.retry_delay = status_code, error, delay
+        self._dispatch('on_retry')
+        event.attempt += 1
+        event.status_code = event.error = event.retry_delay = None
+        self.add('retry_wait', delay)
+
+    def response(self, status_code: int, phase: Optional[str] = None) -> None:
+        """
+        Dispatch ``on_response``.
+        :param status_code: The status code returned to the caller.
+        :param phase: Phase the time since the previous mark is attributed to (optional).
+        """
+        if phase is not None:
+            self.mark(phase)
+        self.event.status_code = int(status_code)
+        self.event.timings['total'] = time.perf_counter() - self._started
+        self._dispatch('on_response')
+
+    def error(self, error: BaseException, status_code: int) -> None:
+        """
+        Dispatch ``on_error``.
+        :param error: The exception raised while sending.
+        :param status_code: The status code returned to the caller instead.
+        """
+        self.event.error = error
+        self.event.status_code = int(status_code)
+        self.event.timings['total'] = time.perf_counter() - self._started
+        self._dispatch('on_error')
+
+    def _dispatch(self, name: str) -> None:
+        for hooks in self._hooks:
+            for callback in getattr(hooks, name):
+                try:
+                    callback(self.event)
+                except Exception:  # pylint: disable=broad-exception-caught
+                    logger.exception("[hooks] {hook} callback {callback!r} failed", hook=name,
+                                     callback=callback)
+
+
+class _NullTrace:
+    """
+    Stand-in for RequestTrace when no hooks are configured; every method is a no-op.
+    """
+    __slots__ = ()
+    event = None
+    httpx_trace = None
+
+    def start(self) -> None:
+        """No-op."""
+
+    def mark(self, phase: str) -> None:
+        """No-op."""
+
+    def add(self, phase: str, seconds: float) -> None:
+        """No-op."""
+
+    def inject(self, headers: Dict[str, str]) -> None:
+        """No-op."""
+
+    def retry(self, delay: float, status_code: Optional[int] = None,
+              error: Optional[BaseException] = None) -> None:
+        """No-op."""
+
+    def response(self, status_code: int, phase: Optional[str] = None) -> None:
+        """No-op."""
+
+    def error(self, error: BaseException, status_code: int) -> None:
+        """No-op."""
+
+    def __bool__(self) -> bool:
+        return False
+
+
+NULL_TRACE = _NullTrace()
+
+
+def begin_trace(hooks: Optional[RequestHooks], method: str, route: Optional[str],
+                headers: Optional[Dict[str, str]]) -> Union[RequestTrace, _NullTrace]:
+    """
+    Start tracing a request with the transport's hooks and those of the calling client.
+    :param hooks: The transport's hooks (optional).
+    :param method: The HTTP method.
+    :param route: The endpoint template of the request.
+    :param headers: The request headers, for the client origin.
+    :return: The trace, or NULL_TRACE when nobody listens.
+    """
+    scope = _client_scope.get()
+    if scope is None:
+        if hooks is None:
+            return NULL_TRACE
+        active, started, timings = (hooks,), time.perf_counter(), {}
+    else:
+        active = (hooks, scope.hooks) if hooks is not None and hooks is not scope.hooks \
+            else (scope.hooks,)
+        started, timings = scope.started, dict(scope.timings)
+    origin = (headers or {}).get('X-Client-Origin')
+    event = RequestEvent(method=getattr(method, 'value', method),
+                         route=getattr(route, 'value', route),
+                         origin=getattr(origin, 'value', origin), timings=timings)
+    trace = RequestTrace(active, event, started)
+    trace.start()
+    return trace
@@ -1,22 +1,170 @@
 """
 Async HTTP Transport for DS CRM SDK
 """
+import asyncio
 from http import HTTPStatus
-from typing import Optional, Callable, Dict, Tuple
+from typing import Any, AsyncIterator, Awaitable, Optional, Callable, Dict, Tuple, Type, Union
 import httpx
+from pydantic import BaseModel
+from ds_crm_sdk.exceptions import CRMRequestError
 from .base import HTTPMethod, AsyncHTTPTransport, HTTPHeaderTokenProvider
+from .circuit import CircuitBreakerRegistry
+from .codec import JSONCodec, get_codec
+from .conditional import ConditionalRequestCache
+from .hooks import NULL_TRACE, RequestHooks, begin_trace
+from .ratelimit import RATE_LIMITED_ERROR, RateLimiter
+from .retry import RetryPolicy
+from .streaming import (DEFAULT_CHUNK_SIZE, JSONArrayStream, check_content_length,
+                        decode_error_body)
+
+# Reported to hooks for cancelled requests, as nginx logs requests closed by the client
+CANCELLED_STATUS = 499
 
 
 class DSAsyncHTTPTransport(HTTPHeaderTokenProvider, AsyncHTTPTransport):
     """
     Async HTTP Transport for DS CRM SDK.
+
+    A single ``httpx.AsyncClient`` is created lazily on the first request and shared by every
+    subsequent call, so concurrent requests reuse pooled (optionally HTTP/2) connections.
+    Use it as an async context manager or call ``aclose()`` to drain and release the pool; a
+    closed transport cannot be used again.
     """
-    def __init__(self, token_provider: Callable[[], str]):
+    def __init__(self, token_provider: Callable[[], Union[str, Awaitable[str]]],
+                 limits: Optional[httpx.Limits] = None, http2: bool = False,
+                 timeout: float = 30.0, client: Optional[httpx.AsyncClient] = None,
+                 conditional_cache: Optional[ConditionalRequestCache] = None,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 circuit_breakers: Optional[CircuitBreakerRegistry] = None,
+                 rate_limiter: Optional[RateLimiter] = None,
+                 codec: Optional[JSONCodec] = None,
+                 hooks: Optional[RequestHooks] = None):
+        """
+        Initializes the transport and its connection pool settings.
+        :param token_provider: A callable returning a string token (or an awaitable of one),
+                               e.g. a CachedTokenProvider.
+        :param limits: Connection pool limits; httpx defaults are used when not given.
+        :param http2: Enable HTTP/2 multiplexing (requires the ``http2`` extra).
+        :param timeout: Default timeout for requests in seconds.
+        :param client: An existing AsyncClient to use; the transport takes ownership of closing it.
+        :param conditional_cache: Remember ETag/Last-Modified validators of GET responses and
+                                  send conditional requests; on ``304 Not Modified`` the
+                                  remembered body is returned with status 200.
+        :param retry_policy: Retry transient failures (connection errors, timeouts, 429/5xx)
+                             with backoff; requests are sent once when not given.
+        :param circuit_breakers: Fail fast (503) on routes whose circuit is open; only requests
+                                 sent with a ``route`` are guarded.
+        :param rate_limiter: Limit the request rate per client origin or route; rejected
+                             requests return 429 without being sent.
+        :param codec: JSON codec encoding request bodies and decoding responses; defaults to
+                      the fastest installed one (orjson, msgspec, then the stdlib json module).
+        :param hooks: Lifecycle hooks receiving every request with its per-phase timings,
+                      including connection setup (from httpx trace events).
+        """
         super().__init__(token_provider)
+        self._limits = limits or httpx.Limits()
+        self._http2 = http2
+        self._timeout = timeout
+        self._client = client
+        self._in_flight = 0
+        self._drained: Optional[asyncio.Event] = None
+        self._closing = False
+        self._closed = False
+        self._conditional_cache = conditional_cache
+        self._retry_policy = retry_policy
+        self._circuit_breakers = circuit_breakers
+        self._rate_limiter = rate_limiter
+        self._codec = codec or get_codec()
+        self._hooks = hooks
+
+    async def __aenter__(self) -> 'DSAsyncHTTPTransport':
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.aclose()
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """
+        Return the shared AsyncClient, creating it on first use.
+        :return: The pooled httpx.AsyncClient.
+        :raises RuntimeError: If the transport is closed.
+        """
+        if self._client is None:
+            if self._closed:
+                raise RuntimeError("The transport is closed")
+            self._client = httpx.AsyncClient(limits=self._limits, http2=self._http2,
+                                             timeout=self._timeout)
+        return self._client
+
+    def _begin_request(self) -> bool:
+        """
+        Count a request in flight from the moment it reaches the transport.
+        :return: False if the transport is closing and the request must be rejected.
+        :raises RuntimeError: If the transport is closed.
+        """
+        if self._closed:
+            raise RuntimeError("The transport is closed")
+        if self._closing:
+            return False
+        if self._drained is None:
+            self._drained = asyncio.Event()
+        self._in_flight += 1
+        self._drained.clear()
+        return True
+
+    def _end_request(self) -> None:
+        self._in_flight -= 1
+        if not self._in_flight:
+            self._drained.set()
+
+    @property
+    def in_flight(self) -> int:
+        """
+        Number of requests currently being sent through the transport, including the ones
+        waiting for the rate limiter.
+        """
+        return self._in_flight
+
+    def pool_stats(self) -> dict:
+        """
+        Snapshot of the connection pool usage.
+        :return: Dict with the connections open, idle connections available for reuse and
+                 requests in flight.
+        """
+        stats = {'connections_open': 0, 'idle_connections': 0, 'in_flight': self._in_flight}
+        # httpx does not expose its pool publicly; count through httpcore when it is there
+        pool = getattr(getattr(self._client, '_transport', None), '_pool', None)
+        for connection in getattr(pool, 'connections', ()):
+            stats['connections_open'] += 1
+            stats['idle_connections'] += connection.is_idle()
+        return stats
+
+    async def aclose(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop accepting new requests, wait for in-flight requests to finish and close the pool.
+        Requests sent afterwards raise RuntimeError.
+        :param timeout: Maximum seconds to wait for in-flight requests (None waits indefinitely).
+        """
+        if self._closed:
+            return
+        self._closing = True
+        try:
+            if self._in_flight:
+                await asyncio.wait_for(self._drained.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            client, self._client = self._client, None
+            self._closed = True
+            self._closing = False
+            if client is not None:
+                await client.aclose()
 
     async def send(self, method: HTTPMethod, endpoint: str,
                    payload: dict = None, params: dict = None,
-                   headers: Optional[Dict[str, str]] = None) -> Tuple[Optional[dict], int]:
+                   headers: Optional[Dict[str, str]] = None, *,
+                   route: Optional[str] = None,
+                   response_model: Optional[Type[BaseModel]] = None) -> Tuple[Any, int]:
         """
         Sends the http request based on the given arguments
         :param method: HTTPMethod Enum
@@ -24,22 +172,193 @@ class DSAsyncHTTPTransport(HTTPHeaderTokenProvider, AsyncHTTPTransport):
         :param payload: payload of the request: Expects pydantic models
         :param params: params, if the request needs params
         :param headers: headers used for the request
+        :param route: The endpoint template of the request, used to key circuit breakers
+        :param response_model: Pydantic model to validate successful responses into,
+                               directly from the response bytes, instead of returning a dict
         :return: Tuple with data and status code
         """
-        async with httpx.AsyncClient() as client:
+        if not self._begin_request():
+            return {'error': 'Transport is closing'}, HTTPStatus.SERVICE_UNAVAILABLE
+        try:
+            trace = begin_trace(self._hooks, method, route, headers)
+            if self._rate_limiter is not None:
+                try:
+                    acquired = await self._rate_limiter.aacquire(
+                        origin=(headers or {}).get('X-Client-Origin'), route=route)
+                except asyncio.CancelledError as e:
+                    trace.error(e, CANCELLED_STATUS)
+                    raise
+                if not acquired:
+                    trace.response(HTTPStatus.TOO_MANY_REQUESTS, phase='rate_limit')
+                    return {'error': RATE_LIMITED_ERROR}, HTTPStatus.TOO_MANY_REQUESTS
+                trace.mark('rate_limit')
+            breaker = (self._circuit_breakers.get(route)
+                       if self._circuit_breakers is not None and route is not None else None)
+            if breaker is None:
+                return await self._send(method, endpoint, payload, params, headers,
+                                        response_model, trace)
+            ticket = breaker.allow()
+            if ticket is None:
+                trace.response(HTTPStatus.SERVICE_UNAVAILABLE)
+                return ({'error': f'Circuit open for {breaker.route}'},
+                        HTTPStatus.SERVICE_UNAVAILABLE)
+            outcome = None
+            try:
+                data, status_code = await self._send(method, endpoint, payload, params, headers,
+                                                     response_model, trace)
+                outcome = not self._circuit_breakers.is_failure(status_code)
+                return data, status_code
+            finally:
+                breaker.record(ticket, outcome)
+        finally:
+            self._end_request()
+
+    # pylint: disable-next=invalid-overridden-method
+    async def stream(self, endpoint: str, result_key: str, params: dict = None,
+                     headers: Optional[Dict[str, str]] = None, *,
+                     route: Optional[str] = None, item_model: Optional[Type[BaseModel]] = None,
+                     max_body_size: Optional[int] = None,
+                     chunk_size: int = DEFAULT_CHUNK_SIZE) -> AsyncIterator[Any]:
+        """
+        Sends a GET request and yields the records of a list response while it is downloaded;
+        only one record is decoded and kept in memory at a time.
+        :param endpoint: CRM service endpoint
+        :param result_key: Top-level key of the records array in the response
+        :param params: params, if the request needs params
+        :param headers: headers used for the request
+        :param route: The endpoint template of the request, used to key circuit breakers
+        :param item_model: Pydantic model to validate every record into (dicts by default)
+        :param max_body_size: Maximum number of body bytes to accept (None is unbounded)
+        :param chunk_size: Number of bytes read from the connection at a time
+        :return: Async iterator over the records
+        :raises CRMRequestError: If the request is rejected, fails or returns a non-2xx status
+        :raises CRMResponseTooLargeError: If the body exceeds ``max_body_size``
+        """
+        if not self._begin_request():
+            raise CRMRequestError(HTTPStatus.SERVICE_UNAVAILABLE, {'error': 'Transport is closing'})
+        breaker, ticket, outcome = None, None, None
+        try:
+            if self._rate_limiter is not None and not await self._rate_limiter.aacquire(
+                    origin=(headers or {}).get('X-Client-Origin'), route=route):
+                raise CRMRequestError(HTTPStatus.TOO_MANY_REQUESTS, {'error': RATE_LIMITED_ERROR})
+            if self._circuit_breakers is not None and route is not None:
+                breaker = self._circuit_breakers.get(route)
+                ticket = breaker.allow()
+                if ticket is None:
+                    raise CRMRequestError(HTTPStatus.SERVICE_UNAVAILABLE,
+                                          {'error': f'Circuit open for {breaker.route}'})
+            decode = (item_model.model_validate_json if item_model is not None
+                      else self._codec.loads)
+            response = await self._request(self._get_client(), method=HTTPMethod.GET,
+                                           stream=True, url=endpoint, params=params,
+                                           headers=await self.aset_headers(headers))
             try:
-                response = await client.request(
-                    method=method,
-                    url=endpoint,
-                    json=payload if payload else None,
-                    params=params,
-                    headers=self.set_headers(headers)
-                )
-                return await response.json(), response.status_code
-            except httpx.HTTPStatusError as e:
-                status = e.response.status_code if e.response else HTTPStatus.INTERNAL_SERVER_ERROR
-                return {'error': str(e)}, status
-            except Exception as e:
-                return {'error': str(e)}, HTTPStatus.INTERNAL_SERVER_ERROR
+                if breaker is not None:
+                    outcome = not self._circuit_breakers.is_failure(response.status_code)
+                if not 200 <= response.status_code < 300:
+                    raise CRMRequestError(response.status_code,
+                                          decode_error_body(self._codec.loads,
+                                                            await response.aread()))
+                check_content_length(response.headers, max_body_size)
+                parser = JSONArrayStream(result_key, decode=decode, max_body_size=max_body_size)
+                async for chunk in response.aiter_bytes(chunk_size=chunk_size):
+                    for record in parser.feed(chunk):
+                        yield record
+                parser.close()
+            finally:
+                await response.aclose()
+        except httpx.HTTPError as e:
+            outcome = False if breaker is not None else None
+            raise CRMRequestError(HTTPStatus.INTERNAL_SERVER_ERROR, {'error': str(e)}) from e
+        finally:
+            if ticket is not None:
+                breaker.record(ticket, outcome)
+            self._end_request()
 
+    async def _send(self, method: HTTPMethod, endpoint: str, payload: Optional[dict],
+                    params: Optional[dict],
+                    headers: Optional[Dict[str, str]],
+                    response_model: Optional[Type[BaseModel]],
+                    trace=NULL_TRACE) -> Tuple[Any, int]:
+        """
+        Send the request, without circuit breaking; see ``send``.
+        """
+        client = self._get_client()
+        try:
+            request_headers = await self.aset_headers(headers)
+            trace.mark('token')
+            trace.inject(request_headers)
+            body = None
+            if payload:
+                body = self._codec.dumps(payload)
+                request_headers.setdefault('Content-Type', self._codec.content_type)
+                trace.mark('encode')
+            key, validated = None, None
+            if self._conditional_cache is not None and method == HTTPMethod.GET:
+                key, validated = self._conditional_cache.prepare(
+                    endpoint, params, request_headers, variant=response_model)
+            extra = {'extensions': {'trace': trace.httpx_trace}} if trace else {}
+            response = await self._request(client, method=method, trace=trace, url=endpoint,
+                                           content=body, params=params,
+                                           headers=request_headers, **extra)
+            trace.mark('ttfb')
+            if validated is not None and response.status_code == HTTPStatus.NOT_MODIFIED:
+                trace.response(HTTPStatus.OK, phase='decode')
+                return self._conditional_cache.not_modified(validated), HTTPStatus.OK
+            if response_model is not None and 200 <= response.status_code < 300:
+                data = response_model.model_validate_json(response.content)
+            else:
+                data = self._codec.loads(response.content)
+            if key is not None and response.status_code == HTTPStatus.OK:
+                self._conditional_cache.store(key, response.headers, data)
+            trace.response(response.status_code, phase='decode')
+            return data, response.status_code
+        except httpx.HTTPStatusError as e:
+            status = e.response.status_code if e.response else HTTPStatus.INTERNAL_SERVER_ERROR
+            trace.error(e, status)
+            return {'error': str(e)}, status
+        except asyncio.CancelledError as e:
+            # e.g. the losing request of a hedge; hooks still see the request end
+            trace.error(e, CANCELLED_STATUS)
+            raise
+        except Exception as e:
+            trace.error(e, HTTPStatus.INTERNAL_SERVER_ERROR)
+            return {'error': str(e)}, HTTPStatus.INTERNAL_SERVER_ERROR
 
+    async def _request(self, client: httpx.AsyncClient, method: HTTPMethod,
+                       stream: bool = False, trace=NULL_TRACE, **request) -> httpx.Response:
+        """
+        Send a request, retrying transient failures according to the retry policy.
+        :param client: The pooled AsyncClient.
+        :param method: HTTPMethod Enum
+        :param stream: Return as soon as the headers are received, without reading the body.
+        :param trace: The request's trace, notified of retries.
+        :param request: Keyword arguments for ``client.request``.
+        :return: The final response.
+        """
+        def send() -> Awaitable[httpx.Response]:
+            if stream:
+                return client.send(client.build_request(method=method, **request), stream=True)
+            return client.request(method=method, **request)
+
+        policy = self._retry_policy
+        if policy is None:
+            return await send()
+        attempt = 1
+        while True:
+            try:
+                response = await send()
+            except httpx.TransportError as e:
+                delay = policy.next_delay(method, attempt, error=e)
+                if delay is None:
+                    raise
+                trace.retry(delay, error=e)
+            else:
+                delay = policy.next_delay(method, attempt, status_code=response.status_code,
+                                          retry_after=response.headers.get('Retry-After'))
+                if delay is None:
+                    return response
+                await response.aclose()
+                trace.retry(delay, status_code=response.status_code)
+            await asyncio.sleep(delay)
+            attempt += 1
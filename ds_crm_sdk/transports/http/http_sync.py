@@ -1,25 +1,181 @@
 """
 Deep Sentinel's HTTP Transport Module
 """
-from typing import Optional, Callable, Dict, Tuple
+import threading
+import time
+from typing import Any, Iterator, Optional, Callable, Dict, Tuple, Type
 from http import HTTPStatus
 import requests
+from requests.adapters import HTTPAdapter
 from pydantic import BaseModel
+from ds_crm_sdk.exceptions import CRMRequestError
 from .base import HTTPMethod, HTTPTransport, HTTPHeaderTokenProvider
+from .circuit import CircuitBreakerRegistry
+from .codec import JSONCodec, get_codec
+from .conditional import ConditionalRequestCache
+from .hooks import NULL_TRACE, RequestHooks, begin_trace
+from .ratelimit import RATE_LIMITED_ERROR, RateLimiter
+from .retry import RetryPolicy
+from .streaming import (DEFAULT_CHUNK_SIZE, JSONArrayStream, check_content_length,
+                        decode_error_body)
+
+RETRYABLE_ERRORS = (requests.ConnectionError, requests.Timeout)
 
 
 class DSHTTPTransport(HTTPHeaderTokenProvider, HTTPTransport):
     """
     DSHTTPTransport is a synchronous HTTP transport class for Deep Sentinel's CRM SDK.
+
+    The transport owns a pooled ``requests.Session`` so that connections (and TLS sessions)
+    are kept alive and reused across calls. A single instance is safe to share between
+    worker threads; use it as a context manager or call ``close()`` to release the pool.
     """
 
-    def __init__(self, token_provider: Callable[[], str]):
+    def __init__(self, token_provider: Callable[[], str],
+                 pool_connections: int = 10, pool_maxsize: int = 10,
+                 pool_block: bool = False, idle_timeout: Optional[float] = None,
+                 session: Optional[requests.Session] = None,
+                 conditional_cache: Optional[ConditionalRequestCache] = None,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 circuit_breakers: Optional[CircuitBreakerRegistry] = None,
+                 rate_limiter: Optional[RateLimiter] = None,
+                 codec: Optional[JSONCodec] = None,
+                 hooks: Optional[RequestHooks] = None):
+        """
+        Initializes the transport and its connection pool settings.
+        :param token_provider: A callable that returns a string token, e.g., a JWT token.
+        :param pool_connections: Number of per-host connection pools to keep cached.
+        :param pool_maxsize: Maximum number of connections kept alive per host.
+        :param pool_block: Whether threads should wait for a free connection when the pool
+                           is exhausted instead of opening throw-away connections.
+        :param idle_timeout: Seconds of inactivity after which pooled connections are dropped
+                             (None keeps them until the server closes them).
+        :param session: An existing session to use instead of creating one; the transport
+                        mounts its adapter on it and takes ownership of closing it.
+        :param conditional_cache: Remember ETag/Last-Modified validators of GET responses and
+                                  send conditional requests; on ``304 Not Modified`` the
+                                  remembered body is returned with status 200.
+        :param retry_policy: Retry transient failures (connection errors, timeouts, 429/5xx)
+                             with backoff; requests are sent once when not given.
+        :param circuit_breakers: Fail fast (503) on routes whose circuit is open; only requests
+                                 sent with a ``route`` are guarded.
+        :param rate_limiter: Limit the request rate per client origin or route; rejected
+                             requests return 429 without being sent.
+        :param codec: JSON codec encoding request bodies and decoding responses; defaults to
+                      the fastest installed one (orjson, msgspec, then the stdlib json module).
+        :param hooks: Lifecycle hooks receiving every request with its per-phase timings.
+        """
         super().__init__(token_provider)
+        self._pool_connections = pool_connections
+        self._pool_maxsize = pool_maxsize
+        self._pool_block = pool_block
+        self._idle_timeout = idle_timeout
+        self._session = session
+        self._session_configured = False
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._last_used = time.monotonic()
+        self._requests_sent = 0
+        self._idle_evictions = 0
+        self._conditional_cache = conditional_cache
+        self._retry_policy = retry_policy
+        self._circuit_breakers = circuit_breakers
+        self._rate_limiter = rate_limiter
+        self._codec = codec or get_codec()
+        self._hooks = hooks
+
+    def __enter__(self) -> 'DSHTTPTransport':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def _build_adapter(self) -> HTTPAdapter:
+        """
+        Build the HTTP adapter holding the connection pools.
+        Retries are disabled here; failures are reported back to the caller.
+        :return: A configured HTTPAdapter instance.
+        """
+        return HTTPAdapter(pool_connections=self._pool_connections,
+                           pool_maxsize=self._pool_maxsize,
+                           pool_block=self._pool_block,
+                           max_retries=0)
+
+    def _acquire_session(self) -> requests.Session:
+        """
+        Return the shared session, creating it on first use, and mark a request as in flight.
+        Idle pooled connections are evicted here when nothing else is using the pool.
+        :return: The pooled requests.Session.
+        """
+        with self._lock:
+            if self._session is None:
+                self._session = requests.Session()
+            if not self._session_configured:
+                adapter = self._build_adapter()
+                self._session.mount('https://', adapter)
+                self._session.mount('http://', adapter)
+                self._session_configured = True
+            now = time.monotonic()
+            if (self._idle_timeout is not None and self._in_flight == 0
+                    and now - self._last_used > self._idle_timeout):
+                for adapter in self._session.adapters.values():
+                    adapter.poolmanager.clear()
+                self._idle_evictions += 1
+            self._in_flight += 1
+            self._requests_sent += 1
+            return self._session
+
+    def _release_session(self) -> None:
+        """
+        Mark an in-flight request as finished.
+        """
+        with self._lock:
+            self._in_flight -= 1
+            self._last_used = time.monotonic()
+
+    def close(self) -> None:
+        """
+        Close the session and every pooled connection.
+        The transport can still be used afterwards; a fresh pool is created on the next request.
+        """
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+            self._session = None
+            self._session_configured = False
+
+    def pool_stats(self) -> dict:
+        """
+        Snapshot of the connection pool usage.
+        :return: Dict with the number of host pools, connections opened, idle connections
+                 available for reuse, requests in flight and requests sent.
+        """
+        with self._lock:
+            stats = {'pools': 0, 'connections_opened': 0, 'idle_connections': 0,
+                     'in_flight': self._in_flight, 'requests_sent': self._requests_sent,
+                     'idle_evictions': self._idle_evictions}
+            if self._session is None:
+                return stats
+            adapters = {id(adapter): adapter for adapter in self._session.adapters.values()}
+            for adapter in adapters.values():
+                pools = adapter.poolmanager.pools
+                for key in pools.keys():
+                    pool = pools.get(key)
+                    if pool is None:
+                        continue
+                    stats['pools'] += 1
+                    stats['connections_opened'] += pool.num_connections
+                    # The urllib3 queue is pre-filled with None placeholders for unopened slots
+                    idle = list(pool.pool.queue) if pool.pool else []
+                    stats['idle_connections'] += sum(1 for conn in idle if conn is not None)
+        return stats
 
     def send(self, method: HTTPMethod, endpoint: str,
              payload: dict = None, params: dict = None,
              headers: Optional[Dict[str, str]] = None,
-             timeout: float = 30.0) -> Tuple[Optional[dict], int]:
+             timeout: float = 30.0, *,
+             route: Optional[str] = None,
+             response_model: Optional[Type[BaseModel]] = None) -> Tuple[Any, int]:
         """
         Sends the http request based on the given arguments
         :param method: HTTPMethod Enum
@@ -28,22 +184,169 @@ class DSHTTPTransport(HTTPHeaderTokenProvider, HTTPTransport):
         :param params: params, if the request needs params
         :param headers: headers used for the request
         :param timeout: Timeout for the request in seconds
+        :param route: The endpoint template of the request, used to key circuit breakers
+        :param response_model: Pydantic model to validate successful responses into,
+                               directly from the response bytes, instead of returning a dict
         :return: Tuple with data and status code
         """
+        trace = begin_trace(self._hooks, method, route, headers)
+        if self._rate_limiter is not None:
+            if not self._rate_limiter.acquire(origin=(headers or {}).get('X-Client-Origin'),
+                                              route=route):
+                trace.response(HTTPStatus.TOO_MANY_REQUESTS, phase='rate_limit')
+                return {'error': RATE_LIMITED_ERROR}, HTTPStatus.TOO_MANY_REQUESTS
+            trace.mark('rate_limit')
+        breaker = (self._circuit_breakers.get(route)
+                   if self._circuit_breakers is not None and route is not None else None)
+        if breaker is None:
+            return self._send(method, endpoint, payload, params, headers, timeout,
+                              response_model, trace)
+        ticket = breaker.allow()
+        if ticket is None:
+            trace.response(HTTPStatus.SERVICE_UNAVAILABLE)
+            return {'error': f'Circuit open for {breaker.route}'}, HTTPStatus.SERVICE_UNAVAILABLE
+        outcome = None
+        try:
+            data, status_code = self._send(method, endpoint, payload, params, headers, timeout,
+                                           response_model, trace)
+            outcome = not self._circuit_breakers.is_failure(status_code)
+            return data, status_code
+        finally:
+            breaker.record(ticket, outcome)
+
+    def stream(self, endpoint: str, result_key: str, params: dict = None,
+               headers: Optional[Dict[str, str]] = None, timeout: float = 30.0, *,
+               route: Optional[str] = None, item_model: Optional[Type[BaseModel]] = None,
+               max_body_size: Optional[int] = None,
+               chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Any]:
+        """
+        Sends a GET request and yields the records of a list response while it is downloaded;
+        only one record is decoded and kept in memory at a time.
+        :param endpoint: CRM service endpoint
+        :param result_key: Top-level key of the records array in the response
+        :param params: params, if the request needs params
+        :param headers: headers used for the request
+        :param timeout: Timeout for the request in seconds
+        :param route: The endpoint template of the request, used to key circuit breakers
+        :param item_model: Pydantic model to validate every record into (dicts by default)
+        :param max_body_size: Maximum number of body bytes to accept (None is unbounded)
+        :param chunk_size: Number of bytes read from the connection at a time
+        :return: Iterator over the records
+        :raises CRMRequestError: If the request is rejected, fails or returns a non-2xx status
+        :raises CRMResponseTooLargeError: If the body exceeds ``max_body_size``
+        """
+        if self._rate_limiter is not None and not self._rate_limiter.acquire(
+                origin=(headers or {}).get('X-Client-Origin'), route=route):
+            raise CRMRequestError(HTTPStatus.TOO_MANY_REQUESTS, {'error': RATE_LIMITED_ERROR})
+        breaker = (self._circuit_breakers.get(route)
+                   if self._circuit_breakers is not None and route is not None else None)
+        ticket = breaker.allow() if breaker is not None else None
+        if breaker is not None and ticket is None:
+            raise CRMRequestError(HTTPStatus.SERVICE_UNAVAILABLE,
+                                  {'error': f'Circuit open for {breaker.route}'})
+        decode = item_model.model_validate_json if item_model is not None else self._codec.loads
+        outcome = None
+        session = self._acquire_session()
+        try:
+            response = self._request(session, method=HTTPMethod.GET, url=endpoint, params=params,
+                                     headers=self.set_headers(headers), timeout=timeout,
+                                     stream=True)
+            with response:
+                if breaker is not None:
+                    outcome = not self._circuit_breakers.is_failure(response.status_code)
+                if not 200 <= response.status_code < 300:
+                    raise CRMRequestError(response.status_code,
+                                          decode_error_body(self._codec.loads, response.content))
+                check_content_length(response.headers, max_body_size)
+                parser = JSONArrayStream(result_key, decode=decode, max_body_size=max_body_size)
+                for chunk in response.iter_content(chunk_size=chunk_size):
+                    yield from parser.feed(chunk)
+                parser.close()
+        except requests.RequestException as e:
+            outcome = False if breaker is not None else None
+            raise CRMRequestError(HTTPStatus.INTERNAL_SERVER_ERROR, {'error': str(e)}) from e
+        finally:
+            if breaker is not None:
+                breaker.record(ticket, outcome)
+            self._release_session()
+
+    def _send(self, method: HTTPMethod, endpoint: str, payload: Optional[dict],
+              params: Optional[dict], headers: Optional[Dict[str, str]],
+              timeout: float, response_model: Optional[Type[BaseModel]],
+              trace=NULL_TRACE) -> Tuple[Any, int]:
+        """
+        Send the request, without circuit breaking; see ``send``.
+        """
+        session = self._acquire_session()
         try:
-            response = requests.request(
-                method=method,
-                url=endpoint,
-                json=payload if payload else None,
-                params=params,
-                headers=self.set_headers(headers),
-                timeout=timeout
-            )
-            return response.json(), response.status_code
+            request_headers = self.set_headers(headers)
+            trace.mark('token')
+            trace.inject(request_headers)
+            body = None
+            if payload:
+                body = self._codec.dumps(payload)
+                request_headers.setdefault('Content-Type', self._codec.content_type)
+                trace.mark('encode')
+            key, validated = None, None
+            if self._conditional_cache is not None and method == HTTPMethod.GET:
+                key, validated = self._conditional_cache.prepare(
+                    endpoint, params, request_headers, variant=response_model)
+            response = self._request(session, method=method, trace=trace, url=endpoint,
+                                     data=body, params=params,
+                                     headers=request_headers, timeout=timeout)
+            if trace:
+                # requests measures up to the parsed headers; the rest is the body download
+                trace.add('ttfb', response.elapsed.total_seconds())
+                trace.mark('download')
+            if validated is not None and response.status_code == HTTPStatus.NOT_MODIFIED:
+                trace.response(HTTPStatus.OK, phase='decode')
+                return self._conditional_cache.not_modified(validated), HTTPStatus.OK
+            if response_model is not None and 200 <= response.status_code < 300:
+                data = response_model.model_validate_json(response.content)
+            else:
+                data = self._codec.loads(response.content)
+            if key is not None and response.status_code == HTTPStatus.OK:
+                self._conditional_cache.store(key, response.headers, data)
+            trace.response(response.status_code, phase='decode')
+            return data, response.status_code
         except requests.HTTPError as e:
             status = e.response.status_code if e.response else HTTPStatus.INTERNAL_SERVER_ERROR
+            trace.error(e, status)
             return {'error': str(e)}, status
         except Exception as e:
+            trace.error(e, HTTPStatus.INTERNAL_SERVER_ERROR)
             return {'error': str(e)}, HTTPStatus.INTERNAL_SERVER_ERROR
+        finally:
+            self._release_session()
 
-
+    def _request(self, session: requests.Session, method: HTTPMethod, trace=NULL_TRACE,
+                 **request) -> requests.Response:
+        """
+        Send a request, retrying transient failures according to the retry policy.
+        :param session: The pooled session.
+        :param method: HTTPMethod Enum
+        :param trace: The request's trace, notified of retries.
+        :param request: Keyword arguments for ``session.request``.
+        :return: The final response.
+        """
+        policy = self._retry_policy
+        if policy is None:
+            return session.request(method=method, **request)
+        attempt = 1
+        while True:
+            try:
+                response = session.request(method=method, **request)
+            except RETRYABLE_ERRORS as e:
+                delay = policy.next_delay(method, attempt, error=e)
+                if delay is None:
+                    raise
+                trace.retry(delay, error=e)
+            else:
+                delay = policy.next_delay(method, attempt, status_code=response.status_code,
+                                          retry_after=response.headers.get('Retry-After'))
+                if delay is None:
+                    return response
+                response.close()
+                trace.retry(delay, status_code=response.status_code)
+            time.sleep(delay)
+            attempt += 1
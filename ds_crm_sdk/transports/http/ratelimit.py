@@ -0,0 +1,155 @@
+"""
+Client-side token-bucket rate limiting, shared across threads and asyncio tasks.
+"""
+import asyncio
+import threading
+import time
+from enum import Enum
+from typing import Callable, Dict, Optional
+
+ORIGIN = 'origin'
+ROUTE = 'route'
+GLOBAL = 'global'
+
+RATE_LIMITED_ERROR = 'Rate limit exceeded'
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket refilled at ``rate`` tokens per second up to ``burst`` tokens.
+
+    Tokens are reserved up front: a caller that has to wait is told how long and already owns
+    its token, so waiters are served in arrival order and the bucket never exceeds ``rate``.
+    """
+
+    def __init__(self, rate: float, burst: float, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize a full bucket.
+        :param rate: Tokens added per second.
+        :param burst: Bucket capacity, i.e. the number of requests that may be sent at once.
+        :param clock: Monotonic clock, mainly for tests.
+        """
+        if rate <= 0 or burst < 1:
+            raise ValueError("rate must be positive and burst at least 1")
+        self.rate = rate
+        self.burst = burst
+        self._clock = clock
+        self._tokens = float(burst)
+        self._updated_at = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self, max_wait: Optional[float] = None) -> Optional[float]:
+        """
+        Reserve a token.
+        :param max_wait: Maximum seconds the caller is willing to wait (None waits indefinitely,
+                         0 only takes a token that is available right now).
+        :return: Seconds to wait before using the token, or None if it would exceed ``max_wait``
+                 (nothing is reserved then).
+        """
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            wait = max(0.0, (1 - self._tokens) / self.rate)
+            if max_wait is not None and wait > max_wait:
+                return None
+            self._tokens -= 1
+            return wait
+
+
+class RateLimiter:
+    """
+    Token buckets keyed per client origin (``ORIGIN``), per endpoint template (``ROUTE``) or
+    shared by every request (``GLOBAL``). Attach it to a client or a transport.
+
+    When a bucket is empty the caller either waits for its token (``block=True``, up to
+    ``max_wait`` seconds) or is rejected right away; rejected requests are not sent and
+    return ``({'error': 'Rate limit exceeded'}, 429)``. The same limiter can be shared by sync
+    and async clients: ``acquire`` sleeps the calling thread, ``aacquire`` the calling task.
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None, scope: str = ORIGIN,
+                 rates: Optional[Dict[str, float]] = None, block: bool = True,
+                 max_wait: Optional[float] = None, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize the limiter.
+        :param rate: Requests per second allowed per bucket.
+        :param burst: Requests that may be sent at once, defaults to ``rate`` (at least 1).
+        :param scope: How requests are grouped into buckets: ORIGIN, ROUTE or GLOBAL.
+        :param rates: Rates overriding ``rate`` for specific origins or endpoint templates.
+        :param block: Wait for a token when the bucket is empty instead of rejecting.
+        :param max_wait: Maximum seconds to wait for a token when blocking (None is unbounded).
+        :param clock: Monotonic clock, mainly for tests.
+        """
+        if scope not in (ORIGIN, ROUTE, GLOBAL):
+            raise ValueError(f"Unsupported rate limit scope: {scope}")
+        self._rate = rate
+        self._burst = burst
+        self._scope = scope
+        self._rates = {_key(key): value for key, value in (rates or {}).items()}
+        self._max_wait = max_wait if block else 0.0
+        self._clock = clock
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, float]] = {}
+        self._bucket(GLOBAL)  # validate the settings eagerly
+
+    def acquire(self, origin: Optional[str] = None, route: Optional[str] = None) -> bool:
+        """
+        Take a token for a request, sleeping the calling thread while the bucket refills.
+        :param origin: The client origin of the request.
+        :param route: The endpoint template of the request.
+        :return: True if the request may be sent, False if it was rejected.
+        """
+        wait = self._reserve(origin, route)
+        if wait:
+            time.sleep(wait)
+        return wait is not None
+
+    async def aacquire(self, origin: Optional[str] = None, route: Optional[str] = None) -> bool:
+        """
+        Take a token for a request, sleeping the calling task while the bucket refills.
+        :param origin: The client origin of the request.
+        :param route: The endpoint template of the request.
+        :return: True if the request may be sent, False if it was rejected.
+        """
+        wait = self._reserve(origin, route)
+        if wait:
+            await asyncio.sleep(wait)
+        return wait is not None
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Snapshot of the limiter counters.
+        :return: Dict keyed by bucket with allowed and rejected requests and seconds waited.
+        """
+        with self._lock:
+            return {key: dict(counters) for key, counters in self._stats.items()}
+
+    def _reserve(self, origin: Optional[str], route: Optional[str]) -> Optional[float]:
+        key = {ORIGIN: origin, ROUTE: route}.get(self._scope, GLOBAL)
+        key = GLOBAL if key is None else _key(key)
+        wait = self._bucket(key).reserve(self._max_wait)
+        with self._lock:
+            counters = self._stats.setdefault(key, {'allowed': 0, 'rejected': 0, 'waited': 0.0})
+            if wait is None:
+                counters['rejected'] += 1
+            else:
+                counters['allowed'] += 1
+                counters['waited'] += wait
+        return wait
+
+    def _bucket(self, key: str) -> TokenBucket:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.get(key)
+                if bucket is None:
+                    rate = self._rates.get(key, self._rate)
+                    burst = self._burst if self._burst is not None else max(1.0, rate)
+                    bucket = self._buckets[key] = TokenBucket(rate, burst, clock=self._clock)
+        return bucket
+
+
+def _key(value: str) -> str:
+    return value.value if isinstance(value, Enum) else value
@@ -0,0 +1,156 @@
+"""
+Retry policy shared by the sync and async HTTP transports.
+"""
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from http import HTTPStatus
+from typing import Callable, FrozenSet, Optional
+from .base import HTTPMethod
+
+IDEMPOTENT_METHODS = frozenset({HTTPMethod.GET, HTTPMethod.HEAD, HTTPMethod.OPTIONS,
+                                HTTPMethod.PUT, HTTPMethod.DELETE})
+DEFAULT_RETRY_STATUSES = frozenset({HTTPStatus.TOO_MANY_REQUESTS, HTTPStatus.BAD_GATEWAY,
+                                    HTTPStatus.SERVICE_UNAVAILABLE, HTTPStatus.GATEWAY_TIMEOUT})
+RETRY_AFTER_STATUSES = frozenset({HTTPStatus.TOO_MANY_REQUESTS, HTTPStatus.SERVICE_UNAVAILABLE})
+
+
+def parse_retry_after(value: Optional[str], now: Optional[float] = None) -> Optional[float]:
+    """
+    Parse a ``Retry-After`` header given either in seconds or as an HTTP date.
+    :param value: The header value.
+    :param now: Current unix time, defaults to ``time.time()``.
+    :return: Seconds to wait (never negative), or None if the header is missing or invalid.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError, IndexError):
+        return None
+    return max(0.0, retry_at - (time.time() if now is None else now))
+
+
+class RetryBudget:
+    """
+    Caps retries to a fraction of the traffic so they cannot amplify an outage.
+
+    Every first attempt deposits ``ratio`` tokens (up to ``max_tokens``) and every retry
+    withdraws one; ``min_tokens`` are available from the start so low-traffic clients can
+    still retry. Share one budget between transports talking to the same service.
+    """
+
+    def __init__(self, ratio: float = 0.2, min_tokens: float = 10.0, max_tokens: float = 100.0):
+        """
+        Initialize the budget.
+        :param ratio: Retries allowed per request sent, e.g. 0.2 allows 20% extra load.
+        :param min_tokens: Initial number of retries available.
+        :param max_tokens: Maximum number of retries that can be saved up.
+        """
+        if ratio < 0 or min_tokens < 0 or max_tokens < min_tokens:
+            raise ValueError("ratio and min_tokens must be non-negative, "
+                             "and max_tokens at least min_tokens")
+        self._ratio = ratio
+        self._max_tokens = max_tokens
+        self._tokens = float(min_tokens)
+        self._lock = threading.Lock()
+        self._stats = {'requests': 0, 'retries': 0, 'rejected': 0}
+
+    def deposit(self) -> None:
+        """
+        Record a first attempt of a request.
+        """
+        with self._lock:
+            self._stats['requests'] += 1
+            self._tokens = min(self._max_tokens, self._tokens + self._ratio)
+
+    def withdraw(self) -> bool:
+        """
+        Try to spend one retry.
+        :return: True if the retry is allowed, False when the budget is exhausted.
+        """
+        with self._lock:
+            if self._tokens < 1:
+                self._stats['rejected'] += 1
+                return False
+            self._tokens -= 1
+            self._stats['retries'] += 1
+            return True
+
+    def stats(self) -> dict:
+        """
+        Snapshot of the budget counters.
+        :return: Dict with requests, retries, rejected retries and the remaining tokens.
+        """
+        with self._lock:
+            return {**self._stats, 'tokens': self._tokens}
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    When and how long to wait before retrying a request.
+
+    Only methods in ``retry_methods`` (idempotent by default) are retried, on a status in
+    ``retry_statuses`` or on a transient transport error. The delay grows exponentially from
+    ``backoff_base`` up to ``backoff_max`` with full jitter; on 429/503 a ``Retry-After`` header
+    takes precedence, and a request asked to wait longer than ``max_retry_after`` is not retried.
+    """
+    max_attempts: int = 3
+    backoff_base: float = 0.1
+    backoff_max: float = 10.0
+    jitter: bool = True
+    retry_statuses: FrozenSet[int] = DEFAULT_RETRY_STATUSES
+    retry_methods: FrozenSet[str] = IDEMPOTENT_METHODS
+    respect_retry_after: bool = True
+    max_retry_after: float = 60.0
+    budget: Optional[RetryBudget] = None
+    uniform: Callable[[float, float], float] = field(default=random.uniform, repr=False,
+                                                     compare=False)
+
+    def __post_init__(self):
+        if self.max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Backoff delay after a failed attempt.
+        :param attempt: The number of the attempt that failed, starting at 1.
+        :return: Seconds to wait.
+        """
+        delay = min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1))
+        return self.uniform(0, delay) if self.jitter else delay
+
+    def next_delay(self, method: str, attempt: int, status_code: Optional[int] = None,
+                   retry_after: Optional[str] = None, error: Optional[Exception] = None
+                   ) -> Optional[float]:
+        """
+        Decide whether to retry after an attempt; called by the transports after every attempt.
+        :param method: The HTTP method of the request.
+        :param attempt: The number of the attempt that just finished, starting at 1.
+        :param status_code: The response status code (None when the attempt raised).
+        :param retry_after: The ``Retry-After`` header of the response, if any.
+        :param error: The transient transport error raised by the attempt, if any.
+        :return: Seconds to wait before the next attempt, or None to stop retrying.
+        """
+        if attempt == 1 and self.budget is not None:
+            self.budget.deposit()
+        if error is None and status_code not in self.retry_statuses:
+            return None
+        if method not in self.retry_methods or attempt >= self.max_attempts:
+            return None
+        delay = self.backoff(attempt)
+        if self.respect_retry_after and status_code in RETRY_AFTER_STATUSES:
+            requested = parse_retry_after(retry_after)
+            if requested is not None:
+                if requested > self.max_retry_after:
+                    return None
+                delay = requested
+        if self.budget is not None and not self.budget.withdraw():
+            return None
+        return delay
@@ -0,0 +1,188 @@
+"""
+Incremental decoding of the records array of large JSON list responses.
+"""
+import re
+from typing import Any, Callable, List, Mapping, Optional
+from ds_crm_sdk.exceptions import CRMResponseTooLargeError
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_STRUCTURAL = re.compile(rb'["\[\]{},]')
+# A complete object without nested objects or arrays, followed by a comma
+_FLAT_OBJECT = re.compile(rb'\s*(\{[^{}\[\]"]*(?:"[^"\\]*(?:\\.[^"\\]*)*"[^{}\[\]"]*)*\})\s*,')
+_STRING_SPECIAL = re.compile(rb'["\\]')
+_QUOTE, _BACKSLASH, _COMMA = ord('"'), ord('\\'), ord(',')
+_OPENING, _CLOSING = b'[{', b']}'
+
+
+class JSONArrayStream:
+    """
+    Push parser yielding the elements of one array of a JSON object as chunks arrive.
+
+    Only the array held by ``key`` at the top level of the document is decoded, one element at
+    a time; everything else is scanned and discarded. Memory use is therefore bounded by the
+    largest element rather than by the body. Each element is decoded with ``decode``, e.g. a
+    codec's ``loads`` or a Pydantic model's ``model_validate_json``.
+    """
+
+    def __init__(self, key: str, decode: Callable[[bytes], Any],
+                 max_body_size: Optional[int] = None):
+        """
+        Initialize the parser.
+        :param key: Top-level key of the array to stream (e.g. 'accounts').
+        :param decode: Callable decoding the raw JSON bytes of one element.
+        :param max_body_size: Maximum number of body bytes accepted (None is unbounded).
+        """
+        self._key = getattr(key, 'value', key).encode('utf-8')
+        self._decode = decode
+        self._max_body_size = max_body_size
+        self._received = 0
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._expect_key = False
+        self._key_buffer: Optional[bytearray] = None
+        self._current_key: Optional[bytes] = None
+        self._in_array = False
+        self._element = bytearray()
+        self.found = False
+
+    @property
+    def received(self) -> int:
+        """
+        Number of body bytes fed so far.
+        """
+        return self._received
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """
+        Parse the next chunk of the body.
+        :param chunk: The next bytes of the response body.
+        :return: The elements completed by this chunk, decoded.
+        :raises CRMResponseTooLargeError: If the body exceeds ``max_body_size``.
+        """
+        self._received += len(chunk)
+        if self._max_body_size is not None and self._received > self._max_body_size:
+            raise CRMResponseTooLargeError(self._max_body_size)
+        elements = []
+        start = 0 if self._in_array else None
+        pos, end = 0, len(chunk)
+        while pos < end:
+            if self._in_string:
+                pos = self._scan_string(chunk, pos)
+                continue
+            match = _STRUCTURAL.search(chunk, pos)
+            if match is None:
+                break
+            index = match.start()
+            char = chunk[index]
+            pos = index + 1
+            if char == _QUOTE:
+                self._in_string = True
+                if self._depth == 1 and self._expect_key:
+                    self._key_buffer = bytearray()
+            elif char in _OPENING:
+                if (self._depth == 1 and not self.found and char == _OPENING[0]
+                        and self._current_key == self._key):
+                    self._in_array = self.found = True
+                    pos = start = self._flat_objects(chunk, pos, elements)
+                self._depth += 1
+                self._expect_key = self._depth == 1 and char == _OPENING[1]
+            elif char in _CLOSING:
+                if self._in_array and self._depth == 2:
+                    self._flush(chunk[start:index], elements)
+                    self._in_array = False
+                    start = None
+                self._depth -= 1
+            elif char == _COMMA:
+                if self._in_array and self._depth == 2:
+                    self._flush(chunk[start:index], elements)
+                    pos = start = self._flat_objects(chunk, pos, elements)
+                elif self._depth == 1:
+                    self._expect_key = True
+        if start is not None:
+            self._element += chunk[start:]
+        return elements
+
+    def close(self) -> None:
+        """
+        Check that the whole document was received.
+        :raises ValueError: If the body ended in the middle of the document.
+        """
+        if self._depth or self._in_string:
+            raise ValueError("Truncated JSON response body")
+
+    def _flat_objects(self, chunk: bytes, pos: int, elements: list) -> int:
+        """
+        Fast path decoding the flat objects that start at ``pos`` with a single regex match each,
+        instead of scanning them token by token.
+        :return: The position of the first element left to the token scanner.
+        """
+        match = _FLAT_OBJECT.match(chunk, pos)
+        while match is not None:
+            elements.append(self._decode(match.group(1)))
+            pos = match.end()
+            match = _FLAT_OBJECT.match(chunk, pos)
+        return pos
+
+    def _scan_string(self, chunk: bytes, pos: int) -> int:
+        """
+        Consume string content up to its closing quote or the end of the chunk.
+        :return: The position to continue scanning from.
+        """
+        if self._escaped:
+            self._escaped = False
+            self._capture(chunk[pos:pos + 1])
+            return pos + 1
+        match = _STRING_SPECIAL.search(chunk, pos)
+        if match is None:
+            self._capture(chunk[pos:])
+            return len(chunk)
+        index = match.start()
+        if chunk[index] == _BACKSLASH:
+            self._capture(chunk[pos:index + 1])
+            self._escaped = True
+            return index + 1
+        self._capture(chunk[pos:index])
+        self._in_string = False
+        if self._key_buffer is not None:
+            self._current_key = bytes(self._key_buffer)
+            self._key_buffer = None
+            self._expect_key = False
+        return index + 1
+
+    def _capture(self, data: bytes) -> None:
+        if self._key_buffer is not None:
+            self._key_buffer += data
+
+    def _flush(self, tail: bytes, elements: list) -> None:
+        self._element += tail
+        raw = bytes(self._element).strip()
+        self._element = bytearray()
+        if raw:
+            elements.append(self._decode(raw))
+
+
+def check_content_length(headers: Mapping[str, str], max_body_size: Optional[int]) -> None:
+    """
+    Reject a response up front when its declared length exceeds the maximum body size.
+    :param headers: The response headers.
+    :param max_body_size: Maximum number of body bytes accepted (None is unbounded).
+    :raises CRMResponseTooLargeError: If ``Content-Length`` exceeds ``max_body_size``.
+    """
+    length = headers.get('Content-Length')
+    if max_body_size is not None and length and length.isdigit() and int(length) > max_body_size:
+        raise CRMResponseTooLargeError(max_body_size)
+
+
+def decode_error_body(decode: Callable[[bytes], Any], body: bytes) -> Any:
+    """
+    Decode the body of an error response, falling back to its text.
+    :param decode: Callable decoding JSON bytes.
+    :param body: The raw response body.
+    :return: The decoded body, or a dict with the body text under 'error'.
+    """
+    try:
+        return decode(body)
+    except Exception:  # pylint: disable=broad-exception-caught
+        return {'error': body.decode('utf-8', 'replace')}
@@ -0,0 +1,188 @@
+"""
+Caching, expiry-aware token provider for the HTTP transports.
+"""
+import asyncio
+import base64
+import inspect
+import json
+import threading
+import time
+from typing import Any, Awaitable, Callable, Optional, Union
+from ds_crm_sdk.logging import logger
+
+TokenFetcher = Callable[[], Union[str, Awaitable[str]]]
+
+
+def jwt_expiry(token: str) -> Optional[float]:
+    """
+    Read the ``exp`` claim of a JWT without verifying it.
+    :param token: The token, optionally prefixed with ``Bearer``.
+    :return: The expiry as a unix timestamp, or None if the token is not a JWT with ``exp``.
+    """
+    parts = token.split()[-1].split('.') if token else []
+    if len(parts) != 3:
+        return None
+    try:
+        claims = json.loads(base64.urlsafe_b64decode(parts[1] + '=' * (-len(parts[1]) % 4)))
+        return float(claims['exp'])
+    except (ValueError, KeyError, TypeError):
+        return None
+
+
+class CachedTokenProvider:
+    """
+    Token provider that caches the token returned by ``fetch`` until shortly before it expires.
+
+    The expiry is taken from ``ttl`` when given, otherwise from the JWT ``exp`` claim; tokens
+    without either are cached until ``invalidate()``. Within ``refresh_margin`` seconds of the
+    expiry the current token is still returned while a single background refresh runs, and once
+    expired concurrent callers wait for one shared fetch instead of each calling ``fetch``.
+
+    Sync transports call the provider; async transports await ``aget()``, which awaits coroutine
+    fetchers and runs plain callables on the default executor so the event loop never blocks.
+    """
+
+    def __init__(self, fetch: TokenFetcher, ttl: Optional[float] = None,
+                 refresh_margin: float = 60.0, clock: Callable[[], float] = time.time):
+        """
+        Initialize the provider.
+        :param fetch: Callable or coroutine function returning a token (e.g. ``Bearer <jwt>``).
+        :param ttl: Seconds a fetched token is valid for; read from the JWT ``exp`` when None.
+        :param refresh_margin: Seconds before the expiry at which the token is refreshed.
+        :param clock: Wall clock returning unix timestamps, mainly for tests.
+        """
+        self._fetch = fetch
+        self._ttl = ttl
+        self._refresh_margin = refresh_margin
+        self._clock = clock
+        self._token: Optional[str] = None
+        self._expires_at: Optional[float] = None
+        self._lock = threading.Lock()
+        self._fetch_lock = threading.Lock()
+        self._refreshing = False
+        self._task: Optional[asyncio.Future] = None
+        self._stats = {'fetches': 0, 'background_refreshes': 0, 'failures': 0}
+
+    def __call__(self) -> str:
+        """
+        Return the cached token, fetching it first when missing or expired.
+        :return: The token.
+        :raises TypeError: If ``fetch`` is a coroutine function (use ``aget`` instead).
+        """
+        token, expired, refresh = self._check()
+        if not expired:
+            if refresh:
+                threading.Thread(target=self._background_refresh, daemon=True).start()
+            return token
+        with self._fetch_lock:
+            token, expired, _ = self._check(claim=False)
+            if not expired:
+                return token
+            return self._store(self._call_fetch())
+
+    async def aget(self) -> str:
+        """
+        Return the cached token, fetching it first when missing or expired, without blocking
+        the event loop.
+        :return: The token.
+        """
+        token, expired, refresh = self._check()
+        if not expired and not refresh:
+            return token
+        with self._lock:
+            if self._task is None or self._task.done():
+                self._task = asyncio.ensure_future(self._afetch())
+            task = self._task
+        if not expired:
+            task.add_done_callback(self._consume_failure)
+            return token
+        return await asyncio.shield(task)
+
+    def invalidate(self) -> None:
+        """
+        Drop the cached token so that the next call fetches a new one (e.g. after a 401).
+        """
+        with self._lock:
+            self._token = None
+            self._expires_at = None
+
+    def stats(self) -> dict:
+        """
+        Snapshot of the provider counters.
+        :return: Dict with fetches, background refreshes, failures and the token expiry.
+        """
+        with self._lock:
+            return {**self._stats, 'expires_at': self._expires_at}
+
+    def _check(self, claim: bool = True):
+        """
+        Inspect the cached token.
+        :param claim: Claim the background refresh when the token is within the refresh margin.
+        :return: Tuple of the token, whether it must be fetched before use and whether the
+                 caller claimed a background refresh.
+        """
+        now = self._clock()
+        with self._lock:
+            token, expires_at = self._token, self._expires_at
+            if token is None or (expires_at is not None and now >= expires_at):
+                return token, True, False
+            if expires_at is None or now < expires_at - self._refresh_margin:
+                return token, False, False
+            if not claim or self._refreshing:
+                return token, False, False
+            self._refreshing = True
+            self._stats['background_refreshes'] += 1
+            return token, False, True
+
+    def _call_fetch(self) -> str:
+        if inspect.iscoroutinefunction(self._fetch):
+            raise TypeError("Coroutine token fetchers can only be used with async transports")
+        with self._lock:
+            self._stats['fetches'] += 1
+        try:
+            return self._fetch()
+        except Exception:
+            with self._lock:
+                self._stats['failures'] += 1
+            raise
+
+    async def _afetch(self) -> str:
+        with self._lock:
+            self._stats['fetches'] += 1
+        try:
+            if inspect.iscoroutinefunction(self._fetch):
+                token = await self._fetch()
+            else:
+                token = await asyncio.get_running_loop().run_in_executor(None, self._fetch)
+                if inspect.isawaitable(token):
+                    token = await token
+        except Exception:
+            with self._lock:
+                self._stats['failures'] += 1
+                self._refreshing = False
+            raise
+        return self._store(token)
+
+    def _store(self, token: str) -> str:
+        now = self._clock()
+        expires_at = now + self._ttl if self._ttl is not None else jwt_expiry(token)
+        with self._lock:
+            self._token = token
+            self._expires_at = expires_at
+            self._refreshing = False
+        return token
+
+    def _background_refresh(self) -> None:
+        try:
+            with self._fetch_lock:
+                self._store(self._call_fetch())
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            with self._lock:
+                self._refreshing = False
+            logger.warning("[token_provider] Background token refresh failed: {error}", error=e)
+
+    @staticmethod
+    def _consume_failure(task: Any) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning("[token_provider] Background token refresh failed: {error}",
+                           error=task.exception())
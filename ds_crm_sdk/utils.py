@@ -0,0 +1,45 @@
+"""
+Small helpers shared across the CRM SDK.
+"""
+import importlib
+import sys
+from typing import Any, Callable, Dict, Hashable, List, Tuple
+
+
+def freeze(value: Any) -> Hashable:
+    """
+    Convert request params (nested dicts, lists and scalars) into a hashable, order-independent
+    value suitable for use in cache keys.
+    :param value: The value to freeze.
+    :return: A hashable representation of the value.
+    """
+    if isinstance(value, dict):
+        return tuple(sorted((key, freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple, set)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def lazy_attributes(package: str, attributes: Dict[str, str]
+                    ) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Build the module ``__getattr__`` and ``__dir__`` (PEP 562) of a package whose public names
+    are only imported from their submodule when first accessed, so that importing the package
+    does not import the dependencies of every submodule.
+    :param package: ``__name__`` of the package.
+    :param attributes: Public names mapped to the relative name of their submodule.
+    :return: The ``__getattr__`` and ``__dir__`` functions of the package.
+    """
+    def __getattr__(name: str) -> Any:
+        module = attributes.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module, package), name)
+        # Later lookups find the global and skip __getattr__
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | set(attributes))
+
+    return __getattr__, __dir__
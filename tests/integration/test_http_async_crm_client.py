@@ -1,5 +1,6 @@
+import json
 import unittest
-from unittest.mock import AsyncMock, patch
+from unittest.mock import MagicMock, patch
 from http import HTTPStatus
 from ds_crm_sdk.clients.http.async_crm_client import AsyncCRMClient
 from ds_crm_sdk.transports.http import DSAsyncHTTPTransport
@@ -17,15 +18,17 @@ class TestAsyncHTTPCRMClient(unittest.IsolatedAsyncioTestCase):
             base_url=self.base_url,
             client_origin=ClientOrigin.EWAP,
             transport=self.transport)
+        self.addAsyncCleanup(self.transport.aclose)
         self.patcher = patch('httpx.AsyncClient.request')
         self.mock_request = self.patcher.start()
+        self.mock_request.return_value = MagicMock()
         self.addCleanup(self.patcher.stop)
 
     async def test_get_account(self):
         # Mock the response with status and return data
         self.mock_request.return_value.status_code = HTTPStatus.OK
         account = DummyAccountFactory()
-        self.mock_request.return_value.json = AsyncMock(return_value={'account': account.to_dict()})
+        self.mock_request.return_value.content = json.dumps({'account': account.to_dict()}).encode()
 
         # Trigger the request
         data, status_code = await self.client.get_account(account_id=str(account.id))
@@ -54,7 +57,7 @@ class TestAsyncHTTPCRMClient(unittest.IsolatedAsyncioTestCase):
         ]
         filtered_accounts = [account for account in accounts if account.email_address == patched_email]
         expected_response = {'accounts': [account.to_dict() for account in filtered_accounts]}
-        self.mock_request.return_value.json = AsyncMock(return_value=expected_response)
+        self.mock_request.return_value.content = json.dumps(expected_response).encode()
 
         # Trigger the request
         filters = {'email': patched_email}
@@ -88,7 +91,7 @@ class TestAsyncHTTPCRMClient(unittest.IsolatedAsyncioTestCase):
         self.mock_request.return_value.status_code = HTTPStatus.OK
         # Generate a list of dummy account types using the factory
         account_types = [DummyAccountFactory().to_dict() for _ in range(3)]
-        self.mock_request.return_value.json.return_value = {'account_types': account_types}
+        self.mock_request.return_value.content = json.dumps({'account_types': account_types}).encode()
 
         # Trigger the request
         data, status_code = await self.client.get_account_types(limit=3, offset=0)
@@ -111,7 +114,7 @@ class TestAsyncHTTPCRMClient(unittest.IsolatedAsyncioTestCase):
         self.mock_request.return_value.status_code = HTTPStatus.OK
         # Generate a dummy account type using the factory
         account_type = DummyAccountTypeFactory()
-        self.mock_request.return_value.json.return_value = {'account_type': account_type.to_dict()}
+        self.mock_request.return_value.content = json.dumps({'account_type': account_type.to_dict()}).encode()
         # Trigger the request
         data, status_code = await self.client.get_account_type(type_id=account_type.id)
         self.mock_request.assert_called_once()
@@ -127,4 +130,32 @@ class TestAsyncHTTPCRMClient(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(status_code, HTTPStatus.OK)
         self.assertEqual(data['account_type'], account_type.to_dict())
 
+    async def test_get_accounts_by_ids(self):
+        accounts = {str(account.id): account.to_dict() for account in DummyAccountFactory.create_batch(5)}
+
+        async def respond(**kwargs):
+            account_id = kwargs['url'].rsplit('/', 1)[-1]
+            response = MagicMock(status_code=HTTPStatus.OK)
+            response.content = json.dumps({'account': accounts[account_id]}).encode()
+            return response
+
+        self.mock_request.side_effect = respond
+        results = await self.client.get_accounts_by_ids(list(accounts), concurrency=2)
+        self.assertEqual([result.key for result in results], list(accounts))
+        self.assertTrue(all(result.ok for result in results))
+        self.assertEqual([result.data['account'] for result in results], list(accounts.values()))
+
+    async def test_create_accounts(self):
+        self.mock_request.return_value.status_code = HTTPStatus.CREATED
+        self.mock_request.return_value.content = json.dumps({'account': {'id': 1}}).encode()
+        accounts = [{'created_by': 'system', 'user_id': str(index), 'first_name': 'first',
+                     'last_name': 'last'} for index in range(4)]
+        accounts.append({'first_name': 'missing required fields'})
+
+        report = await self.client.create_accounts(accounts, concurrency=2)
+        self.assertEqual(self.mock_request.await_count, 4)
+        self.assertEqual(sorted(report.succeeded), [0, 1, 2, 3])
+        self.assertEqual(list(report.failed), [4])
+        self.assertGreater(report.throughput, 0)
+
 # Note: Above 2 tests are sufficient to cover the basic functionality of the AsyncCRMClient.
@@ -1,11 +1,13 @@
+import json
 import unittest
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 from http import HTTPStatus
 from ds_crm_sdk.clients.http.crm_client import CRMClient
 from ds_crm_sdk.transports.http import DSHTTPTransport
 from ds_crm_sdk.constants import ClientOrigin
 from ds_crm_sdk.clients.http.endpoints import AccountEndpoint, AccountTypesEndpoint
 from ds_crm_sdk.constants import SortOrder
+from ds_crm_sdk.dtos import AccountRequestDTO
 from tests.fixtures import DummyAccountFactory, DummyAccountTypeFactory
 
 
@@ -19,7 +21,8 @@ class TestHTTPCRMClient(unittest.TestCase):
             base_url=self.base_url,
             transport=self.transport
         )
-        self.patcher = patch('requests.request')
+        self.addCleanup(self.client.close)
+        self.patcher = patch('requests.Session.request')
         self.mock_request = self.patcher.start()
         self.addCleanup(self.patcher.stop)
 
@@ -28,7 +31,7 @@ class TestHTTPCRMClient(unittest.TestCase):
         self.mock_request.return_value.status_code = HTTPStatus.OK
         # Generate a dummy account using the factory
         account = DummyAccountFactory()
-        self.mock_request.return_value.json.return_value = {'account': account.to_dict()}
+        self.mock_request.return_value.content = json.dumps({'account': account.to_dict()}).encode()
 
         # Trigger the request
         data, status_code = self.client.get_account(account_id=str(account.id))
@@ -58,7 +61,7 @@ class TestHTTPCRMClient(unittest.TestCase):
         ]
         filtered_accounts = [account for account in accounts if account.email_address == patched_email]
         expected_response = {'accounts': [account.to_dict() for account in filtered_accounts]}
-        self.mock_request.return_value.json.return_value = expected_response
+        self.mock_request.return_value.content = json.dumps(expected_response).encode()
         # Trigger the request
         filters = {'email': patched_email}
         data, status_code = self.client.get_accounts(offset=0, limit=5, sort_by='created',
@@ -92,7 +95,7 @@ class TestHTTPCRMClient(unittest.TestCase):
         self.mock_request.return_value.status_code = HTTPStatus.OK
         # Generate a list of dummy account types using the factory
         account_types = [DummyAccountTypeFactory().to_dict() for _ in range(3)]
-        self.mock_request.return_value.json.return_value = {'account_types': account_types}
+        self.mock_request.return_value.content = json.dumps({'account_types': account_types}).encode()
 
         # Trigger the request
         data, status_code = self.client.get_account_types(limit=3, offset=0)
@@ -115,7 +118,7 @@ class TestHTTPCRMClient(unittest.TestCase):
         self.mock_request.return_value.status_code = HTTPStatus.OK
         # Generate a dummy account type using the factory
         account_type = DummyAccountTypeFactory()
-        self.mock_request.return_value.json.return_value = {'account_type': account_type.to_dict()}
+        self.mock_request.return_value.content = json.dumps({'account_type': account_type.to_dict()}).encode()
         # Trigger the request
         data, status_code = self.client.get_account_type(type_id=account_type.id)
         self.mock_request.assert_called_once()
@@ -131,4 +134,43 @@ class TestHTTPCRMClient(unittest.TestCase):
         self.assertEqual(status_code, HTTPStatus.OK)
         self.assertEqual(data['account_type'], account_type.to_dict())
 
+    def test_iter_accounts(self):
+        accounts = [DummyAccountFactory().to_dict() for _ in range(7)]
+
+        def respond(**kwargs):
+            offset, limit = kwargs['params']['offset'], kwargs['params']['limit']
+            response = MagicMock(status_code=HTTPStatus.OK)
+            response.content = json.dumps({'accounts': accounts[offset:offset + limit]}).encode()
+            return response
+
+        self.mock_request.side_effect = respond
+        data = list(self.client.iter_accounts(filters={'type_id': 7}, page_size=3))
+        self.assertEqual(data, accounts)
+        self.assertEqual(self.mock_request.call_count, 3)
+        for _, kwargs in self.mock_request.call_args_list:
+            self.assertEqual(kwargs['params']['type_id'], 7)
+            self.assertEqual(kwargs['url'], f"{self.base_url}{AccountEndpoint.ACCOUNTS.value}")
+
+    def test_create_accounts(self):
+        def respond(**kwargs):
+            response = MagicMock(status_code=HTTPStatus.CREATED)
+            response.content = json.dumps({'account': {'name': json.loads(kwargs['data'])['account_data']['first_name']}}).encode()
+            return response
+
+        self.mock_request.side_effect = respond
+        accounts = [AccountRequestDTO(created_by='system', user_id=str(index),
+                                      first_name=f'first-{index}', last_name='last')
+                    for index in range(5)]
+        accounts.insert(2, {'created_by': 'system'})
+        report = self.client.create_accounts(accounts, concurrency=3)
+
+        self.assertEqual(self.mock_request.call_count, 5)
+        self.assertEqual(sorted(report.succeeded), [0, 1, 3, 4, 5])
+        self.assertEqual(list(report.failed), [2])
+        self.assertEqual(report.failed[2].status_code, HTTPStatus.UNPROCESSABLE_ENTITY)
+        self.assertEqual(report.succeeded[3].data['account']['name'], 'first-2')
+        for _, kwargs in self.mock_request.call_args_list:
+            self.assertEqual(kwargs['method'], 'POST')
+            self.assertEqual(json.loads(kwargs['data'])['meta']['client_origin'], ClientOrigin.EWAP)
+
 # Note: Above 4 tests are sufficient to cover the basic functionality of the CRMClient.
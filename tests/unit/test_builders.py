@@ -1,6 +1,9 @@
+import datetime
 import unittest
+import warnings
+from ds_crm_sdk.payloads import MainPayloadBuilder
 from ds_crm_sdk.payloads.factory import get_main_payload_builder
-from ds_crm_sdk.constants import ClientOrigin
+from ds_crm_sdk.constants import ClientOrigin, SortOrder
 from ds_crm_sdk.payloads.base_request_models import (WebPayloadBase, EWAPPayloadBase,
                                                      MobileAPIPayloadBase, AdminDashboardPayloadBase)
 
@@ -36,4 +39,40 @@ class TestBuilder(unittest.TestCase):
 
         # Test for unsupported client origin
         with self.assertRaises(ValueError):
-            get_main_payload_builder("unsupported_origin")
\ No newline at end of file
+            get_main_payload_builder("unsupported_origin")
+
+
+class TestMainPayloadBuilder(unittest.TestCase):
+    CASES = [
+        {},
+        {'offset': 0, 'limit': 10, 'sort_by': 'name', 'sort_order': SortOrder.DESC, 'filters': None},
+        {'offset': 20, 'limit': 5, 'sort_order': 'ASC',
+         'filters': {'status': SortOrder.ASC, 'created': datetime.date(2024, 1, 2),
+                     'ids': (1, 2), 'deleted': None, 'limit': 3}},
+        {'filters': ['not', 'a', 'dict']},
+        {'limit': float('nan'), 'sort_by': SortOrder.ASC, 'filters': {'score': [float('inf')]}},
+    ]
+
+    def test_fast_path_matches_the_pydantic_model_dump(self):
+        for client_origin in [*ClientOrigin, 'web']:
+            builder = MainPayloadBuilder(client_origin=client_origin)
+            for extra in self.CASES:
+                with warnings.catch_warnings():
+                    warnings.simplefilter('ignore')
+                    expected = builder._build_with_model(**extra)  # pylint: disable=protected-access
+                payload = builder.build_main_payload(**extra)
+                self.assertEqual(repr(payload), repr(expected), msg=(client_origin, extra))
+
+    def test_invalid_keys_and_origins_are_rejected(self):
+        with self.assertRaises(ValueError):
+            MainPayloadBuilder(client_origin=ClientOrigin.WEB).build_main_payload(page=1)
+        with self.assertRaises(ValueError):
+            MainPayloadBuilder(client_origin='unsupported_origin').build_main_payload()
+
+    def test_payloads_do_not_share_state(self):
+        builder = MainPayloadBuilder(client_origin=ClientOrigin.EWAP)
+        filters = {'name': 'acme'}
+        builder.build_main_payload(filters=filters)['extra'] = 1
+        self.assertEqual(builder.build_main_payload(filters=filters),
+                         {'client_origin': 'ewap', 'name': 'acme'})
+        self.assertEqual(filters, {'name': 'acme'})
@@ -0,0 +1,151 @@
+import asyncio
+import threading
+import time
+import unittest
+from http import HTTPStatus
+from ds_crm_sdk.clients.http.bulk import aiter_bounded, gather_bounded, gather_bounded_threads
+from ds_crm_sdk.clients.http.crm_client import CRMClient
+from ds_crm_sdk.constants import ClientOrigin
+from ds_crm_sdk.exceptions import CRMBulkCancelledError, CRMBulkOperationError
+from ds_crm_sdk.loadtest import StubCRMServer
+from ds_crm_sdk.transports.http import DSHTTPTransport
+
+
+class TestBoundedBulk(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.started = []
+
+    async def _call(self, key):
+        self.started.append(key)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.001 * (key % 3))
+        self.in_flight -= 1
+        if key == 13:
+            return {'error': 'not found'}, HTTPStatus.NOT_FOUND
+        return {'id': key}, HTTPStatus.OK
+
+    async def test_results_are_in_input_order_with_per_item_status(self):
+        results = await gather_bounded(self._call, range(30), concurrency=4)
+        self.assertEqual([result.index for result in results], list(range(30)))
+        self.assertEqual([result.key for result in results], list(range(30)))
+        self.assertLessEqual(self.max_in_flight, 4)
+        self.assertFalse(results[13].ok)
+        self.assertEqual(results[13].status_code, HTTPStatus.NOT_FOUND)
+        self.assertTrue(all(result.ok for result in results if result.key != 13))
+
+    async def test_stream_yields_as_completed(self):
+        seen = [result.key async for result in aiter_bounded(self._call, range(6), concurrency=6)]
+        self.assertEqual(sorted(seen), list(range(6)))
+        self.assertEqual(seen[:2], [0, 3])
+
+    async def test_fatal_status_cancels_outstanding_work(self):
+        async def call(key):
+            if key == 2:
+                return {'error': 'denied'}, HTTPStatus.UNAUTHORIZED
+            await asyncio.sleep(0.01)
+            self.started.append(key)
+            return {'id': key}, HTTPStatus.OK
+
+        with self.assertRaises(CRMBulkOperationError) as context:
+            await gather_bounded(call, range(100), concurrency=3)
+        self.assertEqual(context.exception.result.key, 2)
+        await asyncio.sleep(0.02)
+        self.assertLess(len(self.started), 10)
+
+    async def test_exceptions_propagate(self):
+        async def call(key):
+            raise RuntimeError(f'boom {key}')
+
+        with self.assertRaises(RuntimeError):
+            await gather_bounded(call, range(5), concurrency=2)
+
+
+class TestBoundedBulkThreads(unittest.TestCase):
+    def setUp(self):
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def _call(self, key):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(0.005)
+        with self.lock:
+            self.in_flight -= 1
+        return {'id': key}, HTTPStatus.CREATED
+
+    def test_runs_concurrently_and_keeps_input_order(self):
+        results = gather_bounded_threads(self._call, iter(range(40)), concurrency=8)
+        self.assertEqual([result.data['id'] for result in results], list(range(40)))
+        self.assertEqual(self.max_in_flight, 8)
+
+    def test_fatal_status_reports_completed_items(self):
+        def call(key):
+            if key == 5:
+                return {'error': 'forbidden'}, HTTPStatus.FORBIDDEN
+            return self._call(key)
+
+        with self.assertRaises(CRMBulkOperationError) as context:
+            gather_bounded_threads(call, range(1000), concurrency=2)
+        completed = context.exception.completed
+        self.assertTrue(all(result.ok for result in completed))
+        self.assertLess(len(completed), 20)
+
+    def test_slow_calls_time_out(self):
+        def call(key):
+            time.sleep(0.5 if key == 2 else 0)
+            return {'id': key}, HTTPStatus.OK
+
+        started = time.perf_counter()
+        results = gather_bounded_threads(call, range(6), concurrency=3, timeout=0.1)
+        self.assertLess(time.perf_counter() - started, 0.45)
+        self.assertEqual([result.status_code for result in results],
+                         [200, 200, HTTPStatus.GATEWAY_TIMEOUT, 200, 200, 200])
+
+    def test_cancel_stops_pending_calls(self):
+        cancel = threading.Event()
+
+        def call(key):
+            if key == 3:
+                cancel.set()
+            return self._call(key)
+
+        with self.assertRaises(CRMBulkCancelledError) as context:
+            gather_bounded_threads(call, range(1000), concurrency=2, cancel=cancel)
+        self.assertLess(len(context.exception.completed), 10)
+        cancel.set()
+        with self.assertRaises(CRMBulkCancelledError):
+            gather_bounded_threads(call, range(10), cancel=cancel)
+
+
+class TestClientMap(unittest.TestCase):
+    def setUp(self):
+        self.server = StubCRMServer(latency=0.02).start()
+        self.addCleanup(self.server.stop)
+        transport = DSHTTPTransport(lambda: 'Bearer t')
+        self.addCleanup(transport.close)
+        self.client = CRMClient(base_url=self.server.url, client_origin=ClientOrigin.WEB,
+                                transport=transport, max_workers=8)
+        self.addCleanup(self.client.close)
+
+    def test_lookups_share_the_client_pool(self):
+        started = time.perf_counter()
+        results = self.client.get_accounts_by_ids([str(index) for index in range(16)])
+        self.assertLess(time.perf_counter() - started, 16 * 0.02)
+        self.assertEqual([result.key for result in results], [str(index) for index in range(16)])
+        self.assertTrue(all(result.ok for result in results))
+        types = self.client.map(self.client.get_account_type, ['1', '2'], concurrency=1)
+        self.assertEqual([result.status_code for result in types], [200, 200])
+
+    def test_close_shuts_the_pool_down(self):
+        with self.client:
+            self.client.get_account_types_by_ids(['1'])
+            threads = [thread.name for thread in threading.enumerate()]
+            self.assertTrue(any(name.startswith('ds-crm-client') for name in threads))
+        self.assertFalse(any(thread.name.startswith('ds-crm-client')
+                             for thread in threading.enumerate()))
+        self.assertTrue(self.client.get_account_addresses_by_ids('1', ['2'])[0].ok)
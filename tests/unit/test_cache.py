@@ -0,0 +1,100 @@
+import threading
+import unittest
+from http import HTTPStatus
+from unittest.mock import MagicMock
+from ds_crm_sdk.clients.http.cache import FRESH, STALE, ResponseCache
+from ds_crm_sdk.clients.http.crm_client import CRMClient
+from ds_crm_sdk.clients.http.endpoints import AccountEndpoint, AccountTypesEndpoint
+from ds_crm_sdk.constants import ClientOrigin
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestResponseCache(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.cache = ResponseCache(ttls={AccountTypesEndpoint.ACCOUNT_TYPE: 10},
+                                   maxsize=2, stale_ttl=5, clock=self.clock)
+
+    def _key(self, type_id):
+        return self.cache.make_key(AccountTypesEndpoint.ACCOUNT_TYPE, f'/types/{type_id}',
+                                   {'client_origin': 'web', 'filters': {'b': 1, 'a': [1, 2]}})
+
+    def test_only_endpoints_with_ttl_are_cached(self):
+        self.assertEqual(self.cache.ttl_for('/api/crm/account_types/{type_id}'), 10)
+        self.assertIsNone(self.cache.ttl_for(AccountEndpoint.ACCOUNTS))
+
+    def test_fresh_stale_and_expired(self):
+        key = self._key(1)
+        self.assertEqual(self.cache.lookup(key), (None, None))
+        self.cache.store(key, ({'id': 1}, HTTPStatus.OK))
+        self.assertEqual(self.cache.lookup(key), (FRESH, ({'id': 1}, HTTPStatus.OK)))
+        self.clock.now = 12
+        self.assertEqual(self.cache.lookup(key)[0], STALE)
+        self.assertTrue(self.cache.begin_refresh(key))
+        self.assertFalse(self.cache.begin_refresh(key))
+        self.cache.end_refresh(key)
+        self.clock.now = 16
+        self.assertEqual(self.cache.lookup(key), (None, None))
+        stats = self.cache.stats()
+        self.assertEqual((stats['hits'], stats['stale_hits'], stats['misses']), (1, 1, 2))
+        self.assertEqual(stats['size'], 0)
+
+    def test_lru_eviction_and_invalidation(self):
+        for type_id in (1, 2):
+            self.cache.store(self._key(type_id), ({'id': type_id}, HTTPStatus.OK))
+        self.cache.lookup(self._key(1))
+        self.cache.store(self._key(3), ({'id': 3}, HTTPStatus.OK))
+        self.assertEqual(self.cache.lookup(self._key(2)), (None, None))
+        self.assertEqual(self.cache.lookup(self._key(1))[0], FRESH)
+        self.assertEqual(self.cache.stats()['evictions'], 1)
+        self.assertEqual(self.cache.invalidate(AccountTypesEndpoint.ACCOUNT_TYPE), 2)
+        self.assertEqual(self.cache.stats()['size'], 0)
+
+
+class TestCachedCRMClient(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.cache = ResponseCache(ttls={AccountTypesEndpoint.ACCOUNT_TYPE: 60,
+                                         AccountTypesEndpoint.ACCOUNT_TYPES: 60},
+                                   stale_ttl=60, clock=self.clock)
+        self.transport = MagicMock()
+        self.transport.send.return_value = ({'account_type': {'id': 1}}, HTTPStatus.OK)
+        self.client = CRMClient(base_url='https://crm.test', client_origin=ClientOrigin.WEB,
+                                transport=self.transport, cache=self.cache)
+
+    def test_reference_data_is_served_from_cache(self):
+        for _ in range(3):
+            self.assertEqual(self.client.get_account_type(type_id='1'),
+                             ({'account_type': {'id': 1}}, HTTPStatus.OK))
+        self.client.get_account_types(limit=5)
+        self.client.get_account_types(limit=5)
+        self.client.get_account_types(limit=6)
+        self.assertEqual(self.transport.send.call_count, 3)
+
+    def test_uncached_endpoints_and_errors_hit_the_transport(self):
+        self.client.get_account(account_id='1')
+        self.client.get_account(account_id='1')
+        self.transport.send.return_value = ({'error': 'boom'}, HTTPStatus.BAD_GATEWAY)
+        self.client.get_account_type(type_id='2')
+        self.client.get_account_type(type_id='2')
+        self.assertEqual(self.transport.send.call_count, 4)
+
+    def test_stale_entries_are_refreshed_in_the_background(self):
+        self.client.get_account_type(type_id='1')
+        self.clock.now = 61
+        refreshed = threading.Event()
+        end_refresh = self.cache.end_refresh
+        self.cache.end_refresh = lambda key: (end_refresh(key), refreshed.set())
+        self.transport.send.return_value = ({'account_type': {'id': 2}}, HTTPStatus.OK)
+
+        self.assertEqual(self.client.get_account_type(type_id='1')[0], {'account_type': {'id': 1}})
+        self.assertTrue(refreshed.wait(timeout=1))
+        self.assertEqual(self.client.get_account_type(type_id='1')[0], {'account_type': {'id': 2}})
+        self.assertEqual(self.transport.send.call_count, 2)
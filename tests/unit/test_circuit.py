@@ -0,0 +1,130 @@
+import unittest
+from http import HTTPStatus
+from unittest.mock import MagicMock, patch
+import httpx
+from ds_crm_sdk.clients.http.crm_client import CRMClient
+from ds_crm_sdk.clients.http.endpoints import AccountAddressEndpoint, AccountEndpoint
+from ds_crm_sdk.constants import ClientOrigin
+from ds_crm_sdk.transports.http import DSAsyncHTTPTransport, DSHTTPTransport
+from ds_crm_sdk.transports.http.base import HTTPMethod
+from ds_crm_sdk.transports.http.circuit import (CLOSED, HALF_OPEN, OPEN, CircuitBreaker,
+                                                CircuitBreakerRegistry)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.changes = []
+        self.breaker = CircuitBreaker('/route', failure_rate_threshold=0.5, minimum_calls=4,
+                                      window_size=4, open_timeout=10, half_open_max_calls=2,
+                                      on_state_change=lambda *change: self.changes.append(change),
+                                      clock=self.clock)
+
+    def _call(self, success):
+        ticket = self.breaker.allow()
+        self.assertIsNotNone(ticket)
+        self.breaker.record(ticket, success)
+
+    def test_opens_on_failure_rate_and_closes_after_successful_probes(self):
+        for success in (True, False, True):
+            self._call(success)
+        self.assertEqual(self.breaker.state, CLOSED)
+        self._call(False)
+        self.assertEqual(self.breaker.state, OPEN)
+        self.assertIsNone(self.breaker.allow())
+        self.clock.now = 10
+        probes = [self.breaker.allow(), self.breaker.allow()]
+        self.assertIsNone(self.breaker.allow())
+        for ticket in probes:
+            self.breaker.record(ticket, True)
+        self.assertEqual(self.breaker.state, CLOSED)
+        self.assertEqual(self.changes, [('/route', CLOSED, OPEN), ('/route', OPEN, HALF_OPEN),
+                                        ('/route', HALF_OPEN, CLOSED)])
+        self.assertEqual(self.breaker.stats()['rejected'], 2)
+
+    def test_failed_probe_reopens(self):
+        for _ in range(4):
+            self._call(False)
+        self.clock.now = 10
+        self.breaker.record(self.breaker.allow(), None)
+        self.assertEqual(self.breaker.state, HALF_OPEN)
+        self._call(False)
+        self.assertEqual(self.breaker.state, OPEN)
+        self.clock.now = 15
+        self.assertIsNone(self.breaker.allow())
+
+    def test_failing_state_change_callback_does_not_escape(self):
+        def on_state_change(*_):
+            raise RuntimeError('boom')
+
+        breaker = CircuitBreaker('/route', minimum_calls=1, window_size=1, open_timeout=10,
+                                 on_state_change=on_state_change, clock=self.clock)
+        breaker.record(breaker.allow(), False)
+        self.assertEqual(breaker.state, OPEN)
+        self.clock.now = 10
+        self.assertIsNotNone(breaker.allow())
+        self.assertEqual(breaker.state, HALF_OPEN)
+
+    def test_late_call_admitted_while_closed_is_not_a_probe(self):
+        breaker = CircuitBreaker('/route', minimum_calls=1, window_size=1, open_timeout=10,
+                                 half_open_max_calls=1, clock=self.clock)
+        late = [breaker.allow(), breaker.allow()]
+        breaker.record(breaker.allow(), False)
+        self.clock.now = 10
+        probe = breaker.allow()
+        self.assertEqual(breaker.state, HALF_OPEN)
+        breaker.record(late[0], None)
+        self.assertIsNone(breaker.allow())
+        breaker.record(late[1], True)
+        self.assertEqual(breaker.state, HALF_OPEN)
+        breaker.record(probe, True)
+        self.assertEqual(breaker.state, CLOSED)
+
+
+class TestTransportCircuitBreaking(unittest.TestCase):
+    @patch('requests.Session.request')
+    def test_sick_route_fails_fast_while_others_stay_healthy(self, mock_request):
+        def request(method, url, **_):
+            response = MagicMock()
+            response.status_code = HTTPStatus.BAD_GATEWAY if '/addresses' in url else HTTPStatus.OK
+            response.content = b'{}'
+            return response
+
+        mock_request.side_effect = request
+        registry = CircuitBreakerRegistry(minimum_calls=2, window_size=2)
+        transport = DSHTTPTransport(token_provider=None, circuit_breakers=registry)
+        client = CRMClient(base_url='https://crm.test', client_origin=ClientOrigin.WEB,
+                           transport=transport)
+        for _ in range(5):
+            _, status = client.get_account_addresses(account_id='1')
+            self.assertEqual(client.get_account(account_id='1')[1], HTTPStatus.OK)
+        self.assertEqual(status, HTTPStatus.SERVICE_UNAVAILABLE)
+        self.assertEqual(mock_request.call_count, 7)
+        stats = registry.stats()
+        self.assertEqual(stats[AccountAddressEndpoint.ACCOUNT_ADDRESSES.value]['state'], OPEN)
+        self.assertEqual(stats[AccountEndpoint.SPECIFIC_ACCOUNT.value]['state'], CLOSED)
+        transport.close()
+
+
+class TestAsyncTransportCircuitBreaking(unittest.IsolatedAsyncioTestCase):
+    async def test_open_circuit_fails_fast(self):
+        client = httpx.AsyncClient(transport=httpx.MockTransport(
+            lambda request: httpx.Response(HTTPStatus.INTERNAL_SERVER_ERROR, json={})))
+        registry = CircuitBreakerRegistry(minimum_calls=1, window_size=1)
+        async with DSAsyncHTTPTransport(token_provider=None, client=client,
+                                        circuit_breakers=registry) as transport:
+            first = await transport.send(HTTPMethod.GET, 'https://crm.test/a', route='/a')
+            data, status = await transport.send(HTTPMethod.GET, 'https://crm.test/a', route='/a')
+            unguarded = await transport.send(HTTPMethod.GET, 'https://crm.test/a')
+        self.assertEqual(first[1], HTTPStatus.INTERNAL_SERVER_ERROR)
+        self.assertEqual((status, data), (HTTPStatus.SERVICE_UNAVAILABLE,
+                                          {'error': 'Circuit open for /a'}))
+        self.assertEqual(unguarded[1], HTTPStatus.INTERNAL_SERVER_ERROR)
@@ -0,0 +1,74 @@
+import asyncio
+import threading
+import unittest
+from http import HTTPStatus
+from unittest.mock import AsyncMock, MagicMock
+from ds_crm_sdk.clients.http.async_crm_client import AsyncCRMClient
+from ds_crm_sdk.clients.http.coalesce import RequestCoalescer
+from ds_crm_sdk.clients.http.crm_client import CRMClient
+from ds_crm_sdk.constants import ClientOrigin
+
+
+class TestRequestCoalescerThreads(unittest.TestCase):
+    def setUp(self):
+        self.coalescer = RequestCoalescer()
+        self.release = threading.Event()
+        self.sent = 0
+
+    def _send(self):
+        self.sent += 1
+        self.release.wait(timeout=1)
+        return {'account': {'id': '1'}}, HTTPStatus.OK
+
+    def test_identical_concurrent_calls_share_one_request(self):
+        client = CRMClient(base_url='https://crm.test', client_origin=ClientOrigin.WEB,
+                           transport=MagicMock(), coalescer=self.coalescer)
+        client._CRMClient__transport.send.side_effect = lambda **_: self._send()
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(client.get_account('1')))
+                   for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        while self.coalescer.stats()['collapsed'] < 7:
+            threading.Event().wait(0.001)
+        self.release.set()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(self.sent, 1)
+        self.assertEqual(results, [({'account': {'id': '1'}}, HTTPStatus.OK)] * 8)
+        self.assertEqual(self.coalescer.stats(), {'calls': 1, 'collapsed': 7, 'in_flight': 0})
+
+    def test_errors_are_shared_and_keys_are_not_kept(self):
+        key = self.coalescer.make_key('https://crm.test/a', {'limit': 1}, {})
+
+        def fail():
+            raise RuntimeError('boom')
+
+        with self.assertRaises(RuntimeError):
+            self.coalescer.do(key, fail)
+        self.assertEqual(self.coalescer.do(key, lambda: 'ok'), 'ok')
+        self.assertEqual(self.coalescer.stats()['calls'], 2)
+
+
+class TestRequestCoalescerAsync(unittest.IsolatedAsyncioTestCase):
+    async def test_identical_concurrent_calls_share_one_request(self):
+        release = asyncio.Event()
+
+        async def send(**_):
+            await release.wait()
+            return {'account': {'id': '1'}}, HTTPStatus.OK
+
+        transport = MagicMock()
+        transport.send = AsyncMock(side_effect=send)
+        coalescer = RequestCoalescer()
+        client = AsyncCRMClient(base_url='https://crm.test', client_origin=ClientOrigin.WEB,
+                                transport=transport, coalescer=coalescer)
+        pending = [asyncio.ensure_future(client.get_account('1')) for _ in range(5)]
+        other = asyncio.ensure_future(client.get_account('2'))
+        await asyncio.sleep(0)
+        pending[0].cancel()
+        release.set()
+        results = await asyncio.gather(*pending[1:], other)
+        self.assertEqual(transport.send.await_count, 2)
+        self.assertEqual(results[:4], [({'account': {'id': '1'}}, HTTPStatus.OK)] * 4)
+        self.assertEqual(coalescer.stats(), {'calls': 2, 'collapsed': 4, 'in_flight': 0})
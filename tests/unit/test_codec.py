@@ -0,0 +1,66 @@
+import json
+import unittest
+from http import HTTPStatus
+from unittest.mock import patch
+import httpx
+from ds_crm_sdk.constants import ClientOrigin, SortOrder
+from ds_crm_sdk.transports.http import DSAsyncHTTPTransport, DSHTTPTransport
+from ds_crm_sdk.transports.http.base import HTTPMethod
+from ds_crm_sdk.transports.http.codec import JSONCodec, available_codecs, get_codec
+
+DOCUMENT = {'meta': {'client_origin': ClientOrigin.WEB, 'sort_order': SortOrder.ASC},
+            'accounts': [{'id': 1, 'name': 'Zoë', 'is_active': True, 'rate': 0.5,
+                          'external_id': None}]}
+
+
+class TestCodecs(unittest.TestCase):
+    def test_installed_codecs_round_trip(self):
+        for name in available_codecs():
+            with self.subTest(codec=name):
+                codec = get_codec(name)
+                encoded = codec.dumps(DOCUMENT)
+                self.assertIsInstance(encoded, bytes)
+                self.assertEqual(json.loads(encoded), json.loads(json.dumps(DOCUMENT)))
+                self.assertEqual(codec.loads(encoded), json.loads(encoded))
+
+    def test_default_is_fastest_installed(self):
+        self.assertEqual(get_codec().name, next(iter(available_codecs())))
+        self.assertIn('json', available_codecs())
+
+    def test_unknown_codec(self):
+        with self.assertRaises(ValueError):
+            get_codec('yaml')
+
+    @patch('requests.Session.request')
+    def test_sync_transport_sends_encoded_body(self, mock_request):
+        mock_request.return_value.status_code = HTTPStatus.CREATED
+        mock_request.return_value.content = b'{"account":{"id":1}}'
+        with DSHTTPTransport(token_provider=None, codec=JSONCodec()) as transport:
+            data, status = transport.send(HTTPMethod.POST, 'https://crm.test/a',
+                                          payload={'name': 'Zoë'})
+        self.assertEqual((data, status), ({'account': {'id': 1}}, HTTPStatus.CREATED))
+        kwargs = mock_request.call_args.kwargs
+        self.assertEqual(kwargs['data'], '{"name":"Zoë"}'.encode())
+        self.assertEqual(kwargs['headers']['Content-Type'], 'application/json')
+
+
+class TestAsyncTransportCodec(unittest.IsolatedAsyncioTestCase):
+    async def test_async_transport_sends_encoded_body(self):
+        seen = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return httpx.Response(HTTPStatus.OK, content=request.content)
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with DSAsyncHTTPTransport(token_provider=None, client=client) as transport:
+            data, status = await transport.send(HTTPMethod.POST, 'https://crm.test/a',
+                                                payload={'ids': [1, 2]})
+            await transport.send(HTTPMethod.GET, 'https://crm.test/a')
+        self.assertEqual((data, status), ({'ids': [1, 2]}, HTTPStatus.OK))
+        self.assertEqual(seen[0].headers['Content-Type'], 'application/json')
+        self.assertNotIn('Content-Type', seen[1].headers)
+
+
+if __name__ == '__main__':
+    unittest.main()
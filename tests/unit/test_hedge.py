@@ -0,0 +1,143 @@
+import asyncio
+import threading
+import time
+import unittest
+from http import HTTPStatus
+from unittest.mock import MagicMock
+import httpx
+from ds_crm_sdk.clients.http.async_crm_client import AsyncCRMClient
+from ds_crm_sdk.clients.http.crm_client import CRMClient
+from ds_crm_sdk.clients.http.hedge import RequestHedger
+from ds_crm_sdk.constants import ClientOrigin
+from ds_crm_sdk.metrics import MetricsRegistry
+from ds_crm_sdk.transports.http import DSAsyncHTTPTransport
+
+ROUTE = '/api/crm/accounts/{account_id}'
+
+
+class TestRequestHedgerThreads(unittest.TestCase):
+    def setUp(self):
+        self.hedger = RequestHedger(delay=0.02, budget=1)
+        self.addCleanup(self.hedger.close)
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def _call(self, latencies, statuses=(HTTPStatus.OK, HTTPStatus.OK)):
+        def call():
+            with self.lock:
+                attempt = self.calls
+                self.calls += 1
+            time.sleep(latencies[attempt])
+            return {'attempt': attempt}, statuses[attempt]
+        return call
+
+    def test_fast_requests_are_not_hedged(self):
+        self.assertEqual(self.hedger.do(ROUTE, self._call([0])), ({'attempt': 0}, HTTPStatus.OK))
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(self.hedger.stats()['hedged'], 0)
+
+    def test_slow_request_is_hedged_and_the_hedge_wins(self):
+        started = time.perf_counter()
+        data, _ = self.hedger.do(ROUTE, self._call([0.5, 0]))
+        self.assertLess(time.perf_counter() - started, 0.4)
+        self.assertEqual(data, {'attempt': 1})
+        stats = self.hedger.stats()
+        self.assertEqual((stats['requests'], stats['hedged'], stats['hedge_wins']), (1, 1, 1))
+
+    def test_server_errors_do_not_win_the_race(self):
+        call = self._call([0.1, 0], statuses=(HTTPStatus.OK, HTTPStatus.SERVICE_UNAVAILABLE))
+        self.assertEqual(self.hedger.do(ROUTE, call), ({'attempt': 0}, HTTPStatus.OK))
+        self.assertEqual(self.hedger.stats()['hedge_wins'], 0)
+
+    def test_budget_caps_hedges(self):
+        hedger = RequestHedger(delay=0, budget=0.1)
+        self.addCleanup(hedger.close)
+        for _ in range(20):
+            hedger.do(ROUTE, lambda: (time.sleep(0.001), HTTPStatus.OK))
+        stats = hedger.stats()
+        self.assertLessEqual(stats['hedged'], 3)
+        self.assertEqual(stats['hedged'] + stats['rejected'], 20)
+
+    def test_requests_are_not_capped_by_the_hedge_pool(self):
+        hedger = RequestHedger(delay=1, max_workers=1)
+        self.addCleanup(hedger.close)
+        threads = [threading.Thread(target=hedger.do,
+                                    args=(ROUTE, lambda: (time.sleep(0.1), HTTPStatus.OK)))
+                   for _ in range(5)]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertLess(time.perf_counter() - started, 0.3)
+        self.assertEqual(hedger.stats()['hedged'], 0)
+
+    def test_requests_run_on_the_calling_thread_until_hedging_starts(self):
+        hedger = RequestHedger(min_samples=20)
+        self.addCleanup(hedger.close)
+        response = hedger.do(ROUTE, lambda: (threading.current_thread(), HTTPStatus.OK))
+        self.assertIs(response[0], threading.current_thread())
+
+    def test_delay_follows_the_observed_percentile(self):
+        hedger = RequestHedger(min_samples=20)
+        self.addCleanup(hedger.close)
+        self.assertIsNone(hedger.delay_for(ROUTE))
+        for index in range(20):
+            hedger._finish(ROUTE, time.perf_counter() - index / 100, None, hedge=False)
+        self.assertAlmostEqual(hedger.delay_for(ROUTE), 0.19, places=2)
+        self.assertEqual(hedger.stats()['delays'], {ROUTE: {'delay': hedger.delay_for(ROUTE)}})
+
+    def test_sync_client(self):
+        client = CRMClient(base_url='https://crm.test', client_origin=ClientOrigin.WEB,
+                           transport=MagicMock(), hedger=self.hedger)
+        call = self._call([0.5, 0])
+        client._CRMClient__transport.send.side_effect = lambda **_: call()
+        self.assertEqual(client.get_account('1'), ({'attempt': 1}, HTTPStatus.OK))
+        self.assertIs(client.hedger, self.hedger)
+
+
+class TestRequestHedgerAsync(unittest.IsolatedAsyncioTestCase):
+    async def test_loser_is_cancelled_and_reported(self):
+        slow = asyncio.Event()
+
+        async def handler(request):
+            if request.url.path.endswith('/slow'):
+                await slow.wait()
+            return httpx.Response(HTTPStatus.OK, content=b'{"id": "1"}')
+
+        attempts = []
+        metrics = MetricsRegistry()
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        hedger = RequestHedger(delay=0.01, budget=1)
+        async with DSAsyncHTTPTransport(None, client=client, hooks=metrics.hooks) as transport:
+            crm = AsyncCRMClient(base_url='https://crm.test', client_origin=ClientOrigin.WEB,
+                                 transport=transport, hedger=hedger)
+
+            async def send(**request):
+                attempts.append(request['endpoint'])
+                if len(attempts) == 1:
+                    request['endpoint'] += '/slow'
+                return await transport.send(**request)
+
+            crm._AsyncCRMClient__transport = MagicMock(send=send)
+            self.assertEqual(await crm.get_account('1'), ({'id': '1'}, HTTPStatus.OK))
+            self.assertEqual(transport.in_flight, 0)
+        self.assertEqual(len(attempts), 2)
+        self.assertEqual(hedger.stats()['hedge_wins'], 1)
+        account = metrics.snapshot()['routes']['GET ' + ROUTE]
+        self.assertEqual(account['requests'], {200: 1, 499: 1})
+        self.assertEqual(account['errors'], {'CancelledError': 1})
+        self.assertEqual(account['in_flight'], 0)
+
+    async def test_fast_requests_are_not_hedged(self):
+        hedger = RequestHedger(delay=1)
+
+        async def call():
+            return {}, HTTPStatus.OK
+
+        self.assertEqual(await hedger.ado(ROUTE, call), ({}, HTTPStatus.OK))
+        self.assertEqual(hedger.stats()['hedged'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+import unittest
+from http import HTTPStatus
+from unittest.mock import MagicMock, patch
+import httpx
+import requests
+from ds_crm_sdk.clients.http.async_crm_client import AsyncCRMClient
+from ds_crm_sdk.clients.http.crm_client import CRMClient
+from ds_crm_sdk.constants import ClientOrigin
+from ds_crm_sdk.loadtest import StubCRMServer
+from ds_crm_sdk.transports.http import (DSAsyncHTTPTransport, DSHTTPTransport, RateLimiter,
+                                        RequestHooks, RetryPolicy)
+from ds_crm_sdk.transports.http.hooks import make_traceparent
+
+PARENT = '00-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331-01'
+
+
+class Recorder:
+    def __init__(self, **options):
+        self.events = []
+        self.hooks = RequestHooks(**{name: self.recorder(name) for name in (
+            'on_request_start', 'on_response', 'on_error', 'on_retry')}, **options)
+
+    def recorder(self, name):
+        return lambda event: self.events.append((name, event.attempt, event.status_code))
+
+    def names(self):
+        return [name for name, _, _ in self.events]
+
+
+class TestTraceparent(unittest.TestCase):
+    def test_make_traceparent(self):
+        child = make_traceparent(PARENT)
+        self.assertRegex(child, r'^00-0af7651916cd43dd8448eb211c80319c-[0-9a-f]{16}-01$')
+        self.assertNotEqual(child, PARENT)
+        for parent in (None, 'garbage', '00-' + '0' * 32 + '-b7ad6b7169203331-01'):
+            self.assertRegex(make_traceparent(parent), r'^00-[0-9a-f]{32}-[0-9a-f]{16}-01$')
+            self.assertNotIn('0' * 32, make_traceparent(parent))
+
+
+class TestSyncHooks(unittest.TestCase):
+    def setUp(self):
+        self.server = StubCRMServer().start()
+        self.addCleanup(self.server.stop)
+
+    def test_phases_route_origin_and_traceparent(self):
+        events = []
+        hooks = RequestHooks(on_response=events.append, traceparent=lambda: PARENT)
+        with DSHTTPTransport(lambda: 'Bearer t') as transport:
+            client = CRMClient(base_url=self.server.url, client_origin=ClientOrigin.WEB,
+                               transport=transport, hooks=hooks)
+            _, status = client.get_account(account_id='42')
+        self.assertEqual(status, HTTPStatus.OK)
+        [event] = events
+        self.assertEqual(event.route, '/api/crm/accounts/{account_id}')
+        self.assertEqual((event.method, event.origin, event.status_code), ('GET', 'web', 200))
+        self.assertTrue(event.traceparent.startswith('00-0af7651916cd43dd8448eb211c80319c-'))
+        self.assertTrue({'build', 'token', 'ttfb', 'download', 'decode', 'total'}
+                        <= set(event.timings))
+        self.assertNotIn('connect', event.timings)
+        phases = sum(seconds for phase, seconds in event.timings.items() if phase != 'total')
+        self.assertLessEqual(phases, event.timings['total'] + 1e-6)
+
+    def test_shared_hooks_fire_once_and_broken_callbacks_are_ignored(self):
+        recorder = Recorder()
+        recorder.hooks.on_response += (MagicMock(side_effect=RuntimeError('boom')),)
+        with DSHTTPTransport(lambda: 'Bearer t', hooks=recorder.hooks) as transport:
+            client = CRMClient(base_url=self.server.url, client_origin=ClientOrigin.WEB,
+                               transport=transport, hooks=recorder.hooks)
+            self.assertEqual(client.get_account_types()[1], HTTPStatus.OK)
+        self.assertEqual(recorder.names(), ['on_request_start', 'on_response'])
+
+    def test_retry_and_rate_limit_events(self):
+        server = StubCRMServer(error_rate=1, error_statuses=[HTTPStatus.SERVICE_UNAVAILABLE])
+        recorder = Recorder()
+        policy = RetryPolicy(max_attempts=2, backoff_base=0.001, respect_retry_after=False)
+        limiter = RateLimiter(rate=1, burst=1, block=False)
+        with server, DSHTTPTransport(lambda: 'Bearer t', retry_policy=policy,
+                                     rate_limiter=limiter, hooks=recorder.hooks) as transport:
+            client = CRMClient(base_url=server.url, client_origin=ClientOrigin.WEB,
+                               transport=transport)
+            client.get_account(account_id='1')
+            client.get_account(account_id='1')
+        self.assertEqual(recorder.events, [('on_request_start', 1, None), ('on_retry', 1, 503),
+                                           ('on_response', 2, 503), ('on_request_start', 1, None),
+                                           ('on_response', 1, 429)])
+
+    def test_error_event(self):
+        recorder = Recorder()
+        transport = DSHTTPTransport(lambda: 'Bearer t', hooks=recorder.hooks)
+        with patch('requests.Session.request', side_effect=requests.ConnectionError('refused')):
+            _, status = transport.send('GET', 'https://crm.test/api/crm/accounts')
+        self.assertEqual(status, HTTPStatus.INTERNAL_SERVER_ERROR)
+        self.assertEqual(recorder.events, [('on_request_start', 1, None), ('on_error', 1, 500)])
+
+
+class TestAsyncHooks(unittest.IsolatedAsyncioTestCase):
+    async def test_client_hooks_with_connect_phase(self):
+        events = []
+        hooks = RequestHooks(on_response=events.append, traceparent=True)
+        with StubCRMServer() as server:
+            async with DSAsyncHTTPTransport(lambda: 'Bearer t') as transport:
+                client = AsyncCRMClient(base_url=server.url, client_origin=ClientOrigin.WEB,
+                                        transport=transport, hooks=hooks)
+                await client.get_account_addresses(account_id='1')
+                await client.get_account_addresses(account_id='1')
+        self.assertEqual([event.route for event in events],
+                         ['/api/crm/accounts/{account_id}/addresses'] * 2)
+        self.assertIn('connect', events[0].timings)
+        self.assertNotIn('connect', events[1].timings)
+        self.assertNotEqual(events[0].traceparent, events[1].traceparent)
+
+    async def test_traceparent_header_is_sent(self):
+        seen = []
+
+        def handler(request):
+            seen.append(request.headers.get('traceparent'))
+            return httpx.Response(HTTPStatus.OK, content=b'{}')
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        hooks = RequestHooks(traceparent=True)
+        async with DSAsyncHTTPTransport(None, client=client, hooks=hooks) as transport:
+            await transport.send('GET', 'https://crm.test/api/crm/accounts')
+            await transport.send('GET', 'https://crm.test/api/crm/accounts',
+                                 headers={'traceparent': PARENT})
+        self.assertRegex(seen[0], r'^00-[0-9a-f]{32}-[0-9a-f]{16}-01$')
+        self.assertEqual(seen[1], PARENT)
+
+
+if __name__ == '__main__':
+    unittest.main()
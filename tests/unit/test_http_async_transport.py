@@ -0,0 +1,92 @@
+import asyncio
+import unittest
+from http import HTTPStatus
+import httpx
+from ds_crm_sdk.transports.http import DSAsyncHTTPTransport, RateLimiter
+from ds_crm_sdk.transports.http.base import HTTPMethod
+from ds_crm_sdk.transports.http.conditional import ConditionalRequestCache
+
+
+class TestDSAsyncHTTPTransportPooling(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.release = asyncio.Event()
+        self.release.set()
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            await self.release.wait()
+            return httpx.Response(HTTPStatus.OK, json={'path': request.url.path,
+                                                       'auth': request.headers.get('Authorization')})
+
+        self.mock_transport = httpx.MockTransport(handler)
+
+    def _transport(self) -> DSAsyncHTTPTransport:
+        return DSAsyncHTTPTransport(token_provider=lambda: 'token',
+                                    client=httpx.AsyncClient(transport=self.mock_transport))
+
+    async def test_client_is_shared_across_concurrent_requests(self):
+        transport = DSAsyncHTTPTransport(token_provider=lambda: 'token',
+                                         limits=httpx.Limits(max_connections=5))
+        client = transport._get_client()  # pylint: disable=protected-access
+        self.assertIs(client, transport._get_client())  # pylint: disable=protected-access
+        await transport.aclose()
+
+        async with self._transport() as transport:
+            results = await asyncio.gather(*[
+                transport.send(method=HTTPMethod.GET, endpoint=f'https://crm.test/{i}')
+                for i in range(10)
+            ])
+        self.assertEqual([status for _, status in results], [HTTPStatus.OK] * 10)
+        self.assertEqual(results[3][0], {'path': '/3', 'auth': 'token'})
+
+    async def test_aclose_drains_in_flight_requests(self):
+        transport = self._transport()
+        self.release.clear()
+        pending = asyncio.ensure_future(transport.send(method=HTTPMethod.GET,
+                                                       endpoint='https://crm.test/slow'))
+        await asyncio.sleep(0)
+        self.assertEqual(transport.in_flight, 1)
+        closing = asyncio.ensure_future(transport.aclose())
+        await asyncio.sleep(0)
+        data, status = await transport.send(method=HTTPMethod.GET, endpoint='https://crm.test/new')
+        self.assertEqual(status, HTTPStatus.SERVICE_UNAVAILABLE)
+        self.assertIn('error', data)
+        self.release.set()
+        await closing
+        self.assertEqual(await pending, ({'path': '/slow', 'auth': 'token'}, HTTPStatus.OK))
+        self.assertEqual(transport.in_flight, 0)
+
+    async def test_aclose_drains_requests_waiting_for_the_rate_limiter(self):
+        transport = DSAsyncHTTPTransport(
+            token_provider=lambda: 'token', rate_limiter=RateLimiter(rate=20, burst=1),
+            client=httpx.AsyncClient(transport=self.mock_transport))
+        await transport.send(method=HTTPMethod.GET, endpoint='https://crm.test/first')
+        queued = asyncio.ensure_future(transport.send(method=HTTPMethod.GET,
+                                                      endpoint='https://crm.test/queued'))
+        await asyncio.sleep(0)
+        self.assertEqual(transport.in_flight, 1)
+        await transport.aclose()
+        self.assertTrue(queued.done())
+        self.assertEqual((await queued)[1], HTTPStatus.OK)
+        with self.assertRaises(RuntimeError):
+            await transport.send(method=HTTPMethod.GET, endpoint='https://crm.test/closed')
+
+    async def test_conditional_get_reuses_remembered_body(self):
+        seen = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request.headers.get('If-None-Match'))
+            if request.headers.get('If-None-Match') == '"v2"':
+                return httpx.Response(HTTPStatus.NOT_MODIFIED)
+            return httpx.Response(HTTPStatus.OK, json={'id': 1}, headers={'ETag': '"v2"'})
+
+        cache = ConditionalRequestCache()
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with DSAsyncHTTPTransport(token_provider=None, client=client,
+                                        conditional_cache=cache) as transport:
+            for _ in range(3):
+                self.assertEqual(await transport.send(method=HTTPMethod.GET,
+                                                      endpoint='https://crm.test/types',
+                                                      params={'limit': 5}),
+                                 ({'id': 1}, HTTPStatus.OK))
+        self.assertEqual(seen, [None, '"v2"', '"v2"'])
+        self.assertEqual(cache.stats()['not_modified'], 2)
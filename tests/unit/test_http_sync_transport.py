@@ -0,0 +1,118 @@
+import json
+import threading
+import unittest
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from ds_crm_sdk.transports.http import DSHTTPTransport
+from ds_crm_sdk.transports.http.base import HTTPMethod
+from ds_crm_sdk.transports.http.conditional import ConditionalRequestCache
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        if self.path.startswith('/etag') and self.headers.get('If-None-Match') == '"v1"':
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        body = json.dumps({'path': self.path}).encode()
+        self.send_response(HTTPStatus.OK)
+        self.send_header('Content-Type', 'application/json')
+        if self.path.startswith('/etag'):
+            self.send_header('ETag', '"v1"')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestDSHTTPTransportPooling(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), _KeepAliveHandler)
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.base_url = f'http://127.0.0.1:{cls.server.server_address[1]}'
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def test_connections_are_reused(self):
+        with DSHTTPTransport(token_provider=lambda: 'token', pool_maxsize=2) as transport:
+            for _ in range(5):
+                data, status = transport.send(method=HTTPMethod.GET, endpoint=f'{self.base_url}/a')
+                self.assertEqual(status, HTTPStatus.OK)
+                self.assertEqual(data['path'], '/a')
+            stats = transport.pool_stats()
+        self.assertEqual(stats['requests_sent'], 5)
+        self.assertEqual(stats['connections_opened'], 1)
+        self.assertEqual(stats['idle_connections'], 1)
+        self.assertEqual(stats['in_flight'], 0)
+
+    def test_close_releases_pool_and_transport_reopens(self):
+        transport = DSHTTPTransport(token_provider=None)
+        transport.send(method=HTTPMethod.GET, endpoint=f'{self.base_url}/a')
+        transport.close()
+        self.assertEqual(transport.pool_stats()['pools'], 0)
+        _, status = transport.send(method=HTTPMethod.GET, endpoint=f'{self.base_url}/b')
+        self.assertEqual(status, HTTPStatus.OK)
+        transport.close()
+
+    def test_idle_connections_are_evicted(self):
+        with DSHTTPTransport(token_provider=None, idle_timeout=0) as transport:
+            transport.send(method=HTTPMethod.GET, endpoint=f'{self.base_url}/a')
+            transport.send(method=HTTPMethod.GET, endpoint=f'{self.base_url}/a')
+            self.assertEqual(transport.pool_stats()['idle_evictions'], 2)
+
+    def test_thread_safe_sharing(self):
+        with DSHTTPTransport(token_provider=None, pool_maxsize=4, pool_block=True) as transport:
+            statuses = []
+
+            def worker():
+                for _ in range(10):
+                    statuses.append(transport.send(method=HTTPMethod.GET,
+                                                   endpoint=f'{self.base_url}/t')[1])
+
+            threads = [threading.Thread(target=worker) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            stats = transport.pool_stats()
+        self.assertEqual(len(statuses), 80)
+        self.assertTrue(all(status == HTTPStatus.OK for status in statuses))
+        self.assertLessEqual(stats['connections_opened'], 4)
+
+    def test_conditional_get_reuses_remembered_body(self):
+        cache = ConditionalRequestCache()
+        with DSHTTPTransport(token_provider=None, conditional_cache=cache) as transport:
+            first = transport.send(method=HTTPMethod.GET, endpoint=f'{self.base_url}/etag')
+            second = transport.send(method=HTTPMethod.GET, endpoint=f'{self.base_url}/etag')
+            transport.send(method=HTTPMethod.GET, endpoint=f'{self.base_url}/a')
+        self.assertEqual(first, ({'path': '/etag'}, HTTPStatus.OK))
+        self.assertEqual(second, first)
+        stats = cache.stats()
+        self.assertEqual((stats['conditional_requests'], stats['not_modified']), (1, 1))
+        self.assertEqual(stats['size'], 1)
+
+    def test_conditional_get_is_remembered_per_caller(self):
+        user = {'id': 'a'}
+        cache = ConditionalRequestCache(identity=lambda: user['id'])
+        tokens = iter(f'Bearer {index}' for index in range(10))
+        with DSHTTPTransport(token_provider=lambda: next(tokens),
+                             conditional_cache=cache) as transport:
+            transport.send(method=HTTPMethod.GET, endpoint=f'{self.base_url}/etag')
+            user['id'] = 'b'
+            transport.send(method=HTTPMethod.GET, endpoint=f'{self.base_url}/etag')
+            user['id'] = 'a'
+            transport.send(method=HTTPMethod.GET, endpoint=f'{self.base_url}/etag',
+                           headers={'X-Client-Origin': 'web'})
+            transport.send(method=HTTPMethod.GET, endpoint=f'{self.base_url}/etag')
+        stats = cache.stats()
+        self.assertEqual((stats['not_modified'], stats['size']), (1, 3))
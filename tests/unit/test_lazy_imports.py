@@ -0,0 +1,42 @@
+import json
+import subprocess
+import sys
+import unittest
+import ds_crm_sdk.transports.http as transports
+
+HEAVY = ('loguru', 'requests', 'httpx', 'pydantic')
+
+
+def loaded_after(statement):
+    """
+    Run an import statement in a fresh interpreter and return the heavy dependencies it loaded.
+    """
+    code = (f"import json, sys\n{statement}\n"
+            f"print(json.dumps([m for m in {HEAVY!r} if m in sys.modules]))")
+    output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True,
+                            check=True).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+class TestLazyImports(unittest.TestCase):
+    def test_only_the_transport_in_use_is_imported(self):
+        self.assertEqual(loaded_after('import ds_crm_sdk'), [])
+        self.assertEqual(loaded_after('import ds_crm_sdk.transports.http'), [])
+        self.assertNotIn('httpx', loaded_after(
+            'from ds_crm_sdk.transports.http import DSHTTPTransport, RetryPolicy'))
+        self.assertNotIn('requests', loaded_after(
+            'from ds_crm_sdk.transports import DSAsyncHTTPTransport'))
+        self.assertEqual(loaded_after('from ds_crm_sdk.clients.http.crm_client import CRMClient'),
+                         ['loguru', 'pydantic'])
+
+    def test_attributes_resolve_on_access(self):
+        from ds_crm_sdk.transports.http.http_sync import DSHTTPTransport
+        self.assertIs(transports.DSHTTPTransport, DSHTTPTransport)
+        self.assertIn('DSHTTPTransport', vars(transports))
+        self.assertIn('RateLimiter', dir(transports))
+        with self.assertRaises(AttributeError):
+            transports.DSMissingTransport  # pylint: disable=pointless-statement
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+import asyncio
+import unittest
+from http import HTTPStatus
+from unittest.mock import AsyncMock, MagicMock
+from ds_crm_sdk.clients.http.async_crm_client import AsyncCRMClient
+from ds_crm_sdk.clients.http.loader import AccountLoader
+from ds_crm_sdk.constants import ClientOrigin
+from ds_crm_sdk.dtos.responses import AccountResponse
+from ds_crm_sdk.loadtest import StubCRMServer
+from ds_crm_sdk.transports.http import DSAsyncHTTPTransport
+
+
+class TestAccountLoaderWithServer(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.server = StubCRMServer().start()
+        self.addCleanup(self.server.stop)
+        self.transport = DSAsyncHTTPTransport(lambda: 'Bearer t')
+        self.addAsyncCleanup(self.transport.aclose)
+
+    def _client(self, **options):
+        return AsyncCRMClient(base_url=self.server.url, client_origin=ClientOrigin.WEB,
+                              transport=self.transport, **options)
+
+    async def test_lookups_of_a_tick_are_sent_as_one_request(self):
+        client = self._client()
+        loader = client.account_loader()
+        single = await client.get_account('3')
+        results = await asyncio.gather(*(loader.load(account_id) for account_id in '1231'))
+        self.assertEqual([data['account']['id'] for data, _ in results], [1, 2, 3, 1])
+        self.assertEqual(results[2], single)
+        self.assertEqual(loader.stats(), {'loads': 4, 'cache_hits': 1, 'batches': 1,
+                                          'fallbacks': 0, 'pending': 0})
+        self.assertEqual(await loader.load('2'), results[1])
+        self.assertEqual(loader.stats()['cache_hits'], 2)
+
+    async def test_batch_size_and_response_models(self):
+        loader = self._client(response_models=True).account_loader(max_batch_size=2,
+                                                                   window=0.01)
+        results = await loader.load_many(['1', '2', '3'])
+        self.assertEqual(loader.stats()['batches'], 2)
+        self.assertTrue(all(isinstance(data, AccountResponse) for data, _ in results))
+        self.assertEqual([data.account.id for data, _ in results], [1, 2, 3])
+
+
+class TestAccountLoader(unittest.IsolatedAsyncioTestCase):
+    def _client(self, page):
+        client = MagicMock()
+        client.get_accounts = AsyncMock(return_value=page)
+        client.get_account = AsyncMock(
+            return_value=({'error': 'Account not found'}, HTTPStatus.NOT_FOUND))
+        return client
+
+    async def test_missing_ids_are_looked_up_one_by_one(self):
+        client = self._client(({'accounts': [{'id': 1}]}, HTTPStatus.OK))
+        loader = AccountLoader(client, separator=None)
+        found, missing = await loader.load_many([1, 2])
+        self.assertEqual(found, ({'account': {'id': 1}}, HTTPStatus.OK))
+        self.assertEqual(missing[1], HTTPStatus.NOT_FOUND)
+        client.get_accounts.assert_awaited_once_with(filters={'ids': ['1', '2']}, offset=0,
+                                                     limit=2)
+        client.get_account.assert_awaited_once_with(account_id='2')
+        await loader.load(2)
+        self.assertEqual(client.get_account.await_count, 2)
+
+    async def test_failed_batches_reach_every_caller_and_are_not_cached(self):
+        client = self._client(({'error': 'unavailable'}, HTTPStatus.SERVICE_UNAVAILABLE))
+        loader = AccountLoader(client)
+        results = await loader.load_many(['1', '2'])
+        self.assertEqual(results, [({'error': 'unavailable'}, HTTPStatus.SERVICE_UNAVAILABLE)] * 2)
+        client.get_accounts.side_effect = RuntimeError('boom')
+        with self.assertRaises(RuntimeError):
+            await loader.load('1')
+        self.assertEqual(client.get_accounts.await_count, 2)
+
+    async def test_prime_and_clear(self):
+        client = self._client(({'accounts': [{'id': 1}]}, HTTPStatus.OK))
+        loader = AccountLoader(client)
+        loader.prime(1, ({'account': {'id': 1, 'name': 'primed'}}, HTTPStatus.OK))
+        self.assertEqual((await loader.load('1'))[0]['account']['name'], 'primed')
+        loader.clear(1)
+        self.assertEqual((await loader.load('1'))[0], {'account': {'id': 1}})
+        with self.assertRaises(ValueError):
+            AccountLoader(client, max_batch_size=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+import io
+import json
+import unittest
+from contextlib import redirect_stdout
+from http import HTTPStatus
+from ds_crm_sdk.clients.http.async_crm_client import AsyncCRMClient
+from ds_crm_sdk.clients.http.crm_client import CRMClient
+from ds_crm_sdk.constants import ClientOrigin
+from ds_crm_sdk.loadtest import LoadReport, StubCRMServer, run_async, run_sync
+from ds_crm_sdk.loadtest.__main__ import main
+from ds_crm_sdk.transports.http import DSAsyncHTTPTransport, DSHTTPTransport
+
+
+def _token():
+    return 'Bearer test'
+
+
+class TestStubCRMServer(unittest.TestCase):
+    def setUp(self):
+        self.server = StubCRMServer(record_size=10, page_size=5).start()
+        self.addCleanup(self.server.stop)
+        self.transport = DSHTTPTransport(_token)
+        self.addCleanup(self.transport.close)
+        self.client = CRMClient(base_url=self.server.url, client_origin=ClientOrigin.WEB,
+                                transport=self.transport)
+
+    def test_routes(self):
+        data, status = self.client.get_account(account_id='42')
+        self.assertEqual(status, HTTPStatus.OK)
+        self.assertEqual(data['account']['id'], 42)
+        self.assertEqual(len(data['account']['description']), 10)
+        data, status = self.client.get_accounts(limit=50)
+        self.assertEqual(len(data['accounts']), 5)
+        data, status = self.client.get_account_address(account_id='1', address_id='7')
+        self.assertEqual(data['address']['id'], 7)
+        data, status = self.client.get_account_types(limit=2)
+        self.assertEqual(len(data['account_types']), 2)
+
+    def test_unknown_route(self):
+        self.assertEqual(self.server.respond('DELETE', '/api/crm/accounts', {}, None)[0],
+                         HTTPStatus.NOT_FOUND)
+
+    def test_error_rate(self):
+        server = StubCRMServer(error_rate=1, error_statuses=[HTTPStatus.BAD_GATEWAY])
+        self.assertEqual(server.respond('GET', '/api/crm/accounts', {}, None),
+                         (HTTPStatus.BAD_GATEWAY, {'error': 'Injected failure'}))
+        with self.assertRaises(ValueError):
+            StubCRMServer(error_rate=2)
+
+
+class TestLoadRunners(unittest.TestCase):
+    def test_report(self):
+        report = LoadReport(mode='sync', operation='get_account', concurrency=1, elapsed=2.0)
+        for index in range(1, 101):
+            report.record(index / 1000, status_code=HTTPStatus.OK)
+        report.record(0.5, status_code=HTTPStatus.SERVICE_UNAVAILABLE)
+        report.record(0.5, error=TimeoutError())
+        self.assertEqual(report.requests, 102)
+        self.assertEqual(report.failed, 2)
+        self.assertEqual(report.throughput, 51)
+        self.assertEqual(report.percentile(50), 0.051)
+        self.assertEqual(report.summary()['errors'], {'503': 1, 'TimeoutError': 1})
+
+    def test_run_sync_counts_errors(self):
+        with StubCRMServer(error_rate=0.5, seed=7) as server, DSHTTPTransport(_token) as transport:
+            client = CRMClient(base_url=server.url, client_origin=ClientOrigin.WEB,
+                               transport=transport)
+            report = run_sync(client, operation='mixed', concurrency=4, requests=40)
+        self.assertEqual(report.requests, 40)
+        self.assertGreater(report.failed, 0)
+        self.assertEqual(set(report.errors), {'500', '503'})
+
+    def test_run_sync_requires_a_bound(self):
+        with self.assertRaises(ValueError):
+            run_sync(client=None)
+
+    def test_cli_json(self):
+        output = io.StringIO()
+        with redirect_stdout(output):
+            self.assertEqual(main(['--mode', 'sync', '--requests', '10', '--concurrency', '2',
+                                   '--json']), 0)
+        [summary] = json.loads(output.getvalue())
+        self.assertEqual(summary['requests'], 10)
+        self.assertEqual(set(summary['latency_ms']), {'p50', 'p95', 'p99'})
+
+
+class TestAsyncLoadRunner(unittest.IsolatedAsyncioTestCase):
+    async def test_run_async_paced(self):
+        with StubCRMServer() as server:
+            async with DSAsyncHTTPTransport(_token) as transport:
+                client = AsyncCRMClient(base_url=server.url, client_origin=ClientOrigin.WEB,
+                                        transport=transport)
+                report = await run_async(client, operation='get_accounts', concurrency=4,
+                                         requests=20, rps=200)
+        self.assertEqual(report.requests, 20)
+        self.assertEqual(report.failed, 0)
+        self.assertGreaterEqual(report.elapsed, 19 / 200)
+
+
+if __name__ == '__main__':
+    unittest.main()
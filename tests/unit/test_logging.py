@@ -0,0 +1,114 @@
+import sys
+import unittest
+from ds_crm_sdk import logging as sdk_logging
+from ds_crm_sdk.clients.http.crm_client import CRMClient
+from ds_crm_sdk.constants import ClientOrigin
+from ds_crm_sdk.dtos import AccountRequestDTO
+from ds_crm_sdk.loadtest import StubCRMServer
+from ds_crm_sdk.logging import (REDACTED, configure_logging, get_log_policy, log_request,
+                                log_response, logger, redact, sample_bodies)
+from ds_crm_sdk.transports.http import DSHTTPTransport
+
+
+class Rendered:
+    def __init__(self):
+        self.count = 0
+
+    def __str__(self):
+        self.count += 1
+        return 'rendered'
+
+
+class LoggingTestCase(unittest.TestCase):
+    def setUp(self):
+        policy = get_log_policy()
+        self.addCleanup(setattr, sdk_logging, '_policy', policy)
+        self.records = []
+        sink = logger.add(lambda message: self.records.append(message.record), level='DEBUG')
+        self.addCleanup(logger.remove, sink)
+
+    def messages(self, level=None):
+        return [record['message'] for record in self.records
+                if level is None or record['level'].name == level]
+
+
+class TestRedaction(unittest.TestCase):
+    def test_nested_fields_are_redacted_case_insensitively(self):
+        body = {'account_data': {'Email': 'a@b.c', 'name': 'Acme',
+                                 'contacts': [{'phone': '123', 'role': 'owner'}]}}
+        self.assertEqual(redact(body), {'account_data': {
+            'Email': REDACTED, 'name': 'Acme', 'contacts': [{'phone': REDACTED, 'role': 'owner'}]}})
+        self.assertEqual(body['account_data']['Email'], 'a@b.c')
+        self.assertEqual(redact('plain'), 'plain')
+
+
+class TestLogPolicy(LoggingTestCase):
+    def test_configure_logging(self):
+        policy = configure_logging(body_sample_rate=0.5, redacted_fields=['Secret'])
+        self.assertEqual(policy.body_sample_rate, 0.5)
+        self.assertEqual(policy.redacted_fields, frozenset({'secret'}))
+        self.assertIsNone(configure_logging(body_sample_rate=0.25).slow_request_threshold)
+        with self.assertRaises(ValueError):
+            configure_logging(body_sample_rate=2)
+
+    def test_sampling(self):
+        configure_logging(body_sample_rate=0)
+        self.assertFalse(sample_bodies())
+        sdk_logging._policy = sdk_logging.LogPolicy(body_sample_rate=0.5, sample=lambda: 0.7)
+        self.assertFalse(sample_bodies())
+        sdk_logging._policy = sdk_logging.LogPolicy(body_sample_rate=0.5, sample=lambda: 0.2)
+        self.assertTrue(sample_bodies())
+
+    def test_bodies_are_redacted_and_kept_in_extra(self):
+        log_request('create_account', '/api/crm/accounts', {'email': 'a@b.c', 'name': 'Acme'})
+        [record] = self.records
+        self.assertIn("'email': '***'", record['message'])
+        self.assertIn("'name': 'Acme'", record['message'])
+        self.assertEqual(record['extra']['route'], '/api/crm/accounts')
+
+    def test_slow_requests(self):
+        configure_logging(slow_request_threshold=0.5)
+        log_response('get', '/api/crm/accounts', 200, 0.1)
+        self.assertEqual(self.records, [])
+        log_response('get', '/api/crm/accounts', 200, 0.75)
+        self.assertEqual(self.messages('WARNING'),
+                         ['[get] Slow request to /api/crm/accounts: status 200 in 0.750s'])
+        self.assertEqual(self.records[0]['extra']['elapsed'], 0.75)
+
+
+class TestLaziness(unittest.TestCase):
+    def test_bodies_are_not_rendered_when_the_level_is_disabled(self):
+        logger.remove()
+        self.addCleanup(logger.add, sys.stderr)
+        logger.add(lambda message: None, level='INFO')
+        self.addCleanup(logger.remove)
+        body = Rendered()
+        log_request('create_account', '/api/crm/accounts', body)
+        log_response('create_account', '/api/crm/accounts', 201, 0.01, body, sampled=True)
+        self.assertEqual(body.count, 0)
+        logger.info("{body}", body=body)
+        self.assertEqual(body.count, 1)
+
+
+class TestClientLogging(LoggingTestCase):
+    def test_create_account_bodies_and_slow_gets(self):
+        account = AccountRequestDTO(created_by='system', user_id='1', first_name='Ada',
+                                    last_name='Lovelace', email_address='ada@example.test')
+        with StubCRMServer() as server, DSHTTPTransport(lambda: 'Bearer t') as transport:
+            client = CRMClient(base_url=server.url, client_origin=ClientOrigin.WEB,
+                               transport=transport)
+            client.create_account(account)
+            sent, received = self.messages('DEBUG')
+            configure_logging(body_sample_rate=0, slow_request_threshold=0)
+            client.create_account(account)
+            client.get_account(account_id='1')
+        self.assertTrue(sent.startswith('[create_account] Sending request to /api/crm/accounts'))
+        self.assertNotIn('Lovelace', sent + received)
+        self.assertIn("'email_address': '***'", sent)
+        self.assertEqual(len(self.messages('DEBUG')), 2)
+        slow = self.messages('WARNING')
+        self.assertEqual(len(slow), 2)
+        self.assertIn('/api/crm/accounts/{account_id}: status 200', slow[1])
+
+if __name__ == '__main__':
+    unittest.main()
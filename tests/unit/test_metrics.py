@@ -0,0 +1,118 @@
+import asyncio
+import re
+import unittest
+from http import HTTPStatus
+from unittest.mock import patch
+import httpx
+import requests
+from ds_crm_sdk.clients.http.async_crm_client import AsyncCRMClient
+from ds_crm_sdk.clients.http.cache import ResponseCache
+from ds_crm_sdk.clients.http.crm_client import CRMClient
+from ds_crm_sdk.clients.http.hedge import RequestHedger
+from ds_crm_sdk.constants import ClientOrigin
+from ds_crm_sdk.loadtest import StubCRMServer
+from ds_crm_sdk.metrics import MetricsRegistry
+from ds_crm_sdk.transports.http import (CircuitBreakerRegistry, DSAsyncHTTPTransport,
+                                        DSHTTPTransport, RateLimiter)
+
+ACCOUNT_ROUTE = 'GET /api/crm/accounts/{account_id}'
+
+
+class TestMetricsRegistry(unittest.TestCase):
+    def setUp(self):
+        self.server = StubCRMServer().start()
+        self.addCleanup(self.server.stop)
+        self.registry = MetricsRegistry(buckets=(0.001, 10))
+        self.transport = DSHTTPTransport(lambda: 'Bearer t', hooks=self.registry.hooks)
+        self.addCleanup(self.transport.close)
+        self.client = CRMClient(base_url=self.server.url, client_origin=ClientOrigin.WEB,
+                                transport=self.transport)
+
+    def test_snapshot(self):
+        self.client.get_account(account_id='1')
+        self.client.get_account(account_id='2')
+        self.client.get_account_address(account_id='1', address_id='404/x')
+        routes = self.registry.snapshot()['routes']
+        self.assertEqual(set(routes), {ACCOUNT_ROUTE,
+                                       'GET /api/crm/accounts/{account_id}/addresses/{address_id}'})
+        account = routes[ACCOUNT_ROUTE]
+        self.assertEqual(account['requests'], {200: 2})
+        self.assertEqual(account['in_flight'], 0)
+        self.assertEqual(account['latency']['count'], 2)
+        self.assertEqual(account['latency']['buckets'][float('inf')], 2)
+        self.assertIn('ttfb', account['phases'])
+
+    def test_errors_are_counted_by_type(self):
+        with patch('requests.Session.request', side_effect=requests.ConnectionError('refused')):
+            self.client.get_account(account_id='1')
+        account = self.registry.snapshot()['routes'][ACCOUNT_ROUTE]
+        self.assertEqual(account['requests'], {500: 1})
+        self.assertEqual(account['errors'], {'ConnectionError': 1})
+
+    def test_render_prometheus(self):
+        breakers = CircuitBreakerRegistry()
+        breakers.get('/api/crm/accounts')
+        self.registry.track('pool', self.transport)
+        self.registry.track('circuit', breakers)
+        self.registry.track('cache', ResponseCache())
+        self.client.get_account(account_id='7')
+        text = self.registry.render_prometheus()
+        labels = 'method="GET",route="/api/crm/accounts/{account_id}"'
+        self.assertIn(f'ds_crm_sdk_requests_total{{{labels},status="200"}} 1\n', text)
+        self.assertIn(f'ds_crm_sdk_request_duration_seconds_bucket{{{labels},le="+Inf"}} 1\n', text)
+        self.assertIn(f'ds_crm_sdk_request_duration_seconds_count{{{labels}}} 1\n', text)
+        self.assertIn('# TYPE ds_crm_sdk_requests_in_flight gauge\n', text)
+        self.assertIn('ds_crm_sdk_pool_requests_sent 1\n', text)
+        self.assertIn('ds_crm_sdk_circuit_state{key="/api/crm/accounts",state="closed"} 1\n', text)
+        self.assertIn('ds_crm_sdk_cache_hits 0\n', text)
+        sample = re.compile(r'^[a-zA-Z_:][a-zA-Z0-9_:]*(\{.*\})? [-+0-9.eInf]+$')
+        for line in text.splitlines():
+            self.assertTrue(line.startswith('# ') or sample.match(line), line)
+
+    def test_stats_nested_per_route_are_labelled(self):
+        hedger = RequestHedger(min_samples=1)
+        hedger._finish('/api/crm/accounts', 0.0, None, hedge=False)
+        self.registry.track('hedger', hedger)
+        text = self.registry.render_prometheus()
+        self.assertIn('ds_crm_sdk_hedger_requests 0\n', text)
+        self.assertRegex(text, r'ds_crm_sdk_hedger_delay\{key="/api/crm/accounts"\} [0-9.e+-]+\n')
+
+    def test_track_rejects_unknown_components(self):
+        with self.assertRaises(TypeError):
+            self.registry.track('nothing', object())
+
+
+class TestAsyncMetrics(unittest.IsolatedAsyncioTestCase):
+    async def test_request_cancelled_while_rate_limited_is_finished(self):
+        registry = MetricsRegistry()
+        client = httpx.AsyncClient(transport=httpx.MockTransport(
+            lambda request: httpx.Response(HTTPStatus.OK, content=b'{}')))
+        async with DSAsyncHTTPTransport(None, client=client, hooks=registry.hooks,
+                                        rate_limiter=RateLimiter(rate=1, burst=1)) as transport:
+            await transport.send('GET', 'https://crm.test/a', route='/a')
+            queued = asyncio.ensure_future(transport.send('GET', 'https://crm.test/a', route='/a'))
+            await asyncio.sleep(0.01)
+            queued.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await queued
+        route = registry.snapshot()['routes']['GET /a']
+        self.assertEqual(route['in_flight'], 0)
+        self.assertEqual(route['requests'], {200: 1, 499: 1})
+
+    async def test_client_hooks_and_pool_stats(self):
+        registry = MetricsRegistry()
+        with StubCRMServer() as server:
+            async with DSAsyncHTTPTransport(lambda: 'Bearer t') as transport:
+                registry.track('pool', transport)
+                client = AsyncCRMClient(base_url=server.url, client_origin=ClientOrigin.WEB,
+                                        transport=transport, hooks=registry.hooks)
+                _, status = await client.get_account_types()
+                stats = registry.snapshot()['components']['pool']
+        self.assertEqual(status, HTTPStatus.OK)
+        self.assertEqual(stats, {'connections_open': 1, 'idle_connections': 1, 'in_flight': 0})
+        self.assertEqual(registry.snapshot()['routes']['GET /api/crm/account_types']['requests'],
+                         {200: 1})
+
+
+if __name__ == '__main__':
+    unittest.main()
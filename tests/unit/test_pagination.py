@@ -0,0 +1,88 @@
+import asyncio
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from ds_crm_sdk.clients.http.pagination import iter_pages, aiter_pages
+from ds_crm_sdk.exceptions import CRMRequestError
+
+
+def _page(offset, limit, total):
+    return {'accounts': [{'id': i} for i in range(offset, min(offset + limit, total))]}, HTTPStatus.OK
+
+
+class TestIterPages(unittest.TestCase):
+    def test_yields_all_records_in_order(self):
+        for prefetch in (0, 1, 3):
+            records = list(iter_pages(lambda offset, limit: _page(offset, limit, 23), 'accounts',
+                                      page_size=5, prefetch=prefetch))
+            self.assertEqual([record['id'] for record in records], list(range(23)))
+
+    def test_max_items_caps_records_and_requests(self):
+        offsets = []
+
+        def fetch(offset, limit):
+            offsets.append(offset)
+            return _page(offset, limit, 100)
+
+        records = list(iter_pages(fetch, 'accounts', page_size=10, prefetch=2, max_items=15))
+        self.assertEqual(len(records), 15)
+        self.assertEqual(sorted(offsets), [0, 10])
+
+    def test_next_page_is_fetched_while_current_page_is_consumed(self):
+        second_page_requested = threading.Event()
+
+        def fetch(offset, limit):
+            if offset == 10:
+                second_page_requested.set()
+            return _page(offset, limit, 20)
+
+        iterator = iter_pages(fetch, 'accounts', page_size=10, prefetch=1)
+        next(iterator)
+        self.assertTrue(second_page_requested.wait(timeout=1))
+        self.assertEqual(len(list(iterator)), 19)
+
+    def test_invalid_arguments_raise_when_called(self):
+        with self.assertRaises(ValueError):
+            iter_pages(lambda offset, limit: _page(offset, limit, 1), 'accounts', page_size=0)
+        with self.assertRaises(ValueError):
+            aiter_pages(lambda offset, limit: _page(offset, limit, 1), 'accounts', prefetch=-1)
+
+    def test_shared_executor_busy_elsewhere_does_not_block(self):
+        release = threading.Event()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            executor.submit(release.wait)
+            records = list(iter_pages(lambda offset, limit: _page(offset, limit, 23), 'accounts',
+                                      page_size=5, prefetch=2, executor=executor))
+            release.set()
+        self.assertEqual([record['id'] for record in records], list(range(23)))
+
+    def test_failed_page_raises(self):
+        pages = iter_pages(lambda offset, limit: ({'error': 'boom'}, HTTPStatus.BAD_GATEWAY),
+                           'accounts', page_size=10)
+        with self.assertRaises(CRMRequestError) as context:
+            list(pages)
+        self.assertEqual(context.exception.status_code, HTTPStatus.BAD_GATEWAY)
+
+
+class TestAsyncIterPages(unittest.IsolatedAsyncioTestCase):
+    async def test_yields_all_records_and_prefetches(self):
+        in_flight = []
+
+        async def fetch(offset, limit):
+            in_flight.append(offset)
+            await asyncio.sleep(0)
+            return _page(offset, limit, 23)
+
+        records = [record async for record in aiter_pages(fetch, 'accounts', page_size=5,
+                                                           prefetch=2)]
+        self.assertEqual([record['id'] for record in records], list(range(23)))
+        self.assertEqual(in_flight[:3], [0, 5, 10])
+
+    async def test_max_items(self):
+        async def fetch(offset, limit):
+            return _page(offset, limit, 100)
+
+        records = [record async for record in aiter_pages(fetch, 'accounts', page_size=10,
+                                                           max_items=3)]
+        self.assertEqual(len(records), 3)
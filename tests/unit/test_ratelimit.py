@@ -0,0 +1,97 @@
+import asyncio
+import threading
+import time
+import unittest
+from http import HTTPStatus
+from unittest.mock import AsyncMock, MagicMock, patch
+from ds_crm_sdk.clients.http.async_crm_client import AsyncCRMClient
+from ds_crm_sdk.clients.http.crm_client import CRMClient
+from ds_crm_sdk.clients.http.endpoints import AccountEndpoint
+from ds_crm_sdk.constants import ClientOrigin
+from ds_crm_sdk.transports.http import DSHTTPTransport
+from ds_crm_sdk.transports.http.base import HTTPMethod
+from ds_crm_sdk.transports.http.ratelimit import ROUTE, RateLimiter, TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTokenBucket(unittest.TestCase):
+    def test_burst_then_steady_rate(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2, burst=3, clock=clock)
+        self.assertEqual([bucket.reserve() for _ in range(3)], [0, 0, 0])
+        self.assertIsNone(bucket.reserve(max_wait=0))
+        self.assertEqual(bucket.reserve(), 0.5)
+        self.assertEqual(bucket.reserve(), 1.0)
+        clock.now = 1.0
+        self.assertEqual(bucket.reserve(), 0.5)
+
+    def test_invalid_settings(self):
+        with self.assertRaises(ValueError):
+            TokenBucket(rate=0, burst=1)
+        with self.assertRaises(ValueError):
+            RateLimiter(rate=1, scope='tenant')
+
+
+class TestRateLimiter(unittest.TestCase):
+    def test_rejecting_limiter_keeps_buckets_per_origin(self):
+        limiter = RateLimiter(rate=1, burst=2, block=False, clock=FakeClock())
+        self.assertEqual([limiter.acquire(origin=ClientOrigin.WEB) for _ in range(3)],
+                         [True, True, False])
+        self.assertTrue(limiter.acquire(origin='ewap'))
+        self.assertEqual(limiter.stats()['web'], {'allowed': 2, 'rejected': 1, 'waited': 0.0})
+
+    def test_blocking_limiter_is_shared_across_threads(self):
+        limiter = RateLimiter(rate=200, burst=1)
+        started = time.monotonic()
+        threads = [threading.Thread(target=lambda: [limiter.acquire('web') for _ in range(5)])
+                   for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertGreaterEqual(time.monotonic() - started, 19 / 200)
+        self.assertEqual(limiter.stats()['web']['allowed'], 20)
+
+    def test_client_rejects_without_sending(self):
+        transport = MagicMock()
+        transport.send.return_value = ({}, HTTPStatus.OK)
+        client = CRMClient(base_url='https://crm.test', client_origin=ClientOrigin.WEB,
+                           transport=transport,
+                           rate_limiter=RateLimiter(rate=1, scope=ROUTE, block=False,
+                                                    rates={AccountEndpoint.ACCOUNTS: 2}))
+        statuses = [client.get_accounts()[1] for _ in range(3)]
+        self.assertEqual(statuses, [HTTPStatus.OK, HTTPStatus.OK, HTTPStatus.TOO_MANY_REQUESTS])
+        self.assertEqual(client.get_account(account_id='1')[1], HTTPStatus.OK)
+        self.assertEqual(transport.send.call_count, 3)
+
+    @patch('requests.Session.request')
+    def test_transport_limits_per_origin_header(self, mock_request):
+        mock_request.return_value.status_code = HTTPStatus.OK
+        mock_request.return_value.content = b'{}'
+        transport = DSHTTPTransport(token_provider=None,
+                                    rate_limiter=RateLimiter(rate=1, block=False))
+        statuses = [transport.send(HTTPMethod.GET, 'https://crm.test/a',
+                                   headers={'X-Client-Origin': origin})[1]
+                    for origin in (ClientOrigin.WEB, ClientOrigin.WEB, ClientOrigin.EWAP)]
+        self.assertEqual(statuses, [HTTPStatus.OK, HTTPStatus.TOO_MANY_REQUESTS, HTTPStatus.OK])
+        self.assertEqual(mock_request.call_count, 2)
+        transport.close()
+
+
+class TestAsyncRateLimiter(unittest.IsolatedAsyncioTestCase):
+    async def test_async_client_waits_for_tokens(self):
+        transport = MagicMock()
+        transport.send = AsyncMock(return_value=({}, HTTPStatus.OK))
+        client = AsyncCRMClient(base_url='https://crm.test', client_origin=ClientOrigin.WEB,
+                                transport=transport, rate_limiter=RateLimiter(rate=100, burst=2))
+        started = time.monotonic()
+        results = await asyncio.gather(*[client.get_account(account_id=str(i)) for i in range(6)])
+        self.assertGreaterEqual(time.monotonic() - started, 0.035)
+        self.assertEqual([status for _, status in results], [HTTPStatus.OK] * 6)
@@ -0,0 +1,100 @@
+import json
+import unittest
+from http import HTTPStatus
+from unittest.mock import MagicMock, patch
+import httpx
+from ds_crm_sdk.clients.http.async_crm_client import AsyncCRMClient
+from ds_crm_sdk.clients.http.cache import ResponseCache
+from ds_crm_sdk.clients.http.crm_client import CRMClient
+from ds_crm_sdk.clients.http.endpoints import AccountEndpoint
+from ds_crm_sdk.constants import ClientOrigin
+from ds_crm_sdk.dtos import AccountDTO, AccountResponse, AccountsPage, AccountTypesPage
+from ds_crm_sdk.transports.http import DSAsyncHTTPTransport, DSHTTPTransport
+from ds_crm_sdk.transports.http.base import HTTPMethod
+
+PAGE = {'accounts': [{'id': 1, 'name': 'Acme', 'tier': 'gold'}, {'id': 2, 'name': 'Initech'}],
+        'total': 2}
+
+
+def _response(status_code, body):
+    response = MagicMock()
+    response.status_code = status_code
+    response.content = json.dumps(body).encode()
+    response.json.return_value = body
+    return response
+
+
+class TestSyncTypedResponses(unittest.TestCase):
+    @patch('requests.Session.request')
+    def test_transport_validates_from_bytes(self, mock_request):
+        mock_request.return_value = _response(HTTPStatus.OK, PAGE)
+        transport = DSHTTPTransport(token_provider=None)
+        data, status = transport.send(HTTPMethod.GET, 'https://crm.test/api/crm/accounts',
+                                      response_model=AccountsPage)
+        self.assertEqual(status, HTTPStatus.OK)
+        self.assertIsInstance(data, AccountsPage)
+        self.assertEqual([account.id for account in data.accounts], [1, 2])
+        self.assertEqual(data.accounts[0].tier, 'gold')
+        self.assertEqual(data.total, 2)
+        mock_request.return_value.json.assert_not_called()
+        transport.close()
+
+    @patch('requests.Session.request')
+    def test_errors_stay_dicts(self, mock_request):
+        mock_request.return_value = _response(HTTPStatus.NOT_FOUND, {'error': 'Not found'})
+        transport = DSHTTPTransport(token_provider=None)
+        data, status = transport.send(HTTPMethod.GET, 'https://crm.test/api/crm/accounts/9',
+                                      response_model=AccountResponse)
+        self.assertEqual((data, status), ({'error': 'Not found'}, HTTPStatus.NOT_FOUND))
+        transport.close()
+
+    def test_client_selects_model_per_endpoint(self):
+        transport = MagicMock()
+        transport.send.return_value = ({}, HTTPStatus.OK)
+        client = CRMClient(base_url='https://crm.test', client_origin=ClientOrigin.WEB,
+                           transport=transport, response_models=True)
+        client.get_account(account_id='1')
+        self.assertIs(transport.send.call_args.kwargs['response_model'], AccountResponse)
+        client.get_account_types()
+        self.assertIs(transport.send.call_args.kwargs['response_model'], AccountTypesPage)
+        untyped = CRMClient(base_url='https://crm.test', client_origin=ClientOrigin.WEB,
+                            transport=transport)
+        untyped.get_account(account_id='1')
+        self.assertIsNone(transport.send.call_args.kwargs['response_model'])
+
+    def test_iter_accounts_yields_models(self):
+        transport = MagicMock()
+        transport.send.side_effect = [(AccountsPage.model_validate(PAGE), HTTPStatus.OK),
+                                      (AccountsPage(), HTTPStatus.OK)]
+        client = CRMClient(base_url='https://crm.test', client_origin=ClientOrigin.WEB,
+                           transport=transport, response_models=True)
+        accounts = list(client.iter_accounts(page_size=2, prefetch=0))
+        self.assertEqual([account.name for account in accounts], ['Acme', 'Initech'])
+        self.assertTrue(all(isinstance(account, AccountDTO) for account in accounts))
+
+    def test_cache_keys_typed_and_dict_responses_apart(self):
+        cache = ResponseCache(ttls={AccountEndpoint.ACCOUNTS: 60})
+        transport = MagicMock()
+        transport.send.return_value = ({}, HTTPStatus.OK)
+        for response_models in (False, True):
+            CRMClient(base_url='https://crm.test', client_origin=ClientOrigin.WEB,
+                      transport=transport, cache=cache,
+                      response_models=response_models).get_accounts()
+        self.assertEqual(transport.send.call_count, 2)
+
+
+class TestAsyncTypedResponses(unittest.IsolatedAsyncioTestCase):
+    async def test_client_returns_models(self):
+        client = httpx.AsyncClient(transport=httpx.MockTransport(
+            lambda request: httpx.Response(HTTPStatus.OK, json={'account': {'id': 7}})))
+        async with DSAsyncHTTPTransport(token_provider=None, client=client) as transport:
+            crm = AsyncCRMClient(base_url='https://crm.test', client_origin=ClientOrigin.WEB,
+                                 transport=transport, response_models=True)
+            data, status = await crm.get_account(account_id='7')
+        self.assertEqual(status, HTTPStatus.OK)
+        self.assertIsInstance(data, AccountResponse)
+        self.assertEqual(data.account.id, 7)
+
+
+if __name__ == '__main__':
+    unittest.main()
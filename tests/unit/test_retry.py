@@ -0,0 +1,109 @@
+import json
+import unittest
+from http import HTTPStatus
+from unittest.mock import MagicMock, patch
+import httpx
+import requests
+from ds_crm_sdk.transports.http import (DSAsyncHTTPTransport, DSHTTPTransport, RetryBudget,
+                                        RetryPolicy)
+from ds_crm_sdk.transports.http.base import HTTPMethod
+from ds_crm_sdk.transports.http.retry import parse_retry_after
+
+
+def fake_response(status_code, headers=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.content = json.dumps({'status': int(status_code)}).encode()
+    return response
+
+
+class TestRetryPolicy(unittest.TestCase):
+    def setUp(self):
+        self.policy = RetryPolicy(max_attempts=4, backoff_base=0.5, backoff_max=1.5, jitter=False)
+
+    def test_capped_exponential_backoff(self):
+        self.assertEqual([self.policy.backoff(attempt) for attempt in (1, 2, 3, 4)],
+                         [0.5, 1.0, 1.5, 1.5])
+        jittered = RetryPolicy(backoff_base=1, uniform=lambda low, high: (low, high))
+        self.assertEqual(jittered.backoff(3), (0, 4))
+
+    def test_only_idempotent_methods_and_transient_failures_are_retried(self):
+        self.assertIsNone(self.policy.next_delay(HTTPMethod.GET, 1, status_code=HTTPStatus.OK))
+        self.assertIsNone(self.policy.next_delay(HTTPMethod.GET, 1,
+                                                 status_code=HTTPStatus.BAD_REQUEST))
+        self.assertIsNone(self.policy.next_delay(HTTPMethod.POST, 1,
+                                                 status_code=HTTPStatus.SERVICE_UNAVAILABLE))
+        self.assertEqual(self.policy.next_delay(HTTPMethod.GET, 1, error=ConnectionError()), 0.5)
+        self.assertIsNone(self.policy.next_delay(HTTPMethod.GET, 4, error=ConnectionError()))
+
+    def test_retry_after(self):
+        self.assertEqual(parse_retry_after('7'), 7)
+        self.assertEqual(parse_retry_after('Wed, 21 Oct 2015 07:28:10 GMT', now=1445412480), 10)
+        self.assertIsNone(parse_retry_after('soon'))
+        self.assertEqual(self.policy.next_delay(HTTPMethod.GET, 1, retry_after='3',
+                                                status_code=HTTPStatus.TOO_MANY_REQUESTS), 3)
+        self.assertEqual(self.policy.next_delay(HTTPMethod.GET, 1, retry_after='3',
+                                                status_code=HTTPStatus.BAD_GATEWAY), 0.5)
+        self.assertIsNone(self.policy.next_delay(HTTPMethod.GET, 1, retry_after='3600',
+                                                 status_code=HTTPStatus.SERVICE_UNAVAILABLE))
+
+    def test_budget_limits_retries(self):
+        budget = RetryBudget(ratio=0.5, min_tokens=1, max_tokens=2)
+        policy = RetryPolicy(budget=budget, jitter=False)
+        failed = {'status_code': HTTPStatus.SERVICE_UNAVAILABLE}
+        self.assertIsNotNone(policy.next_delay(HTTPMethod.GET, 1, **failed))
+        self.assertIsNotNone(policy.next_delay(HTTPMethod.GET, 1, **failed))
+        self.assertIsNone(policy.next_delay(HTTPMethod.GET, 1, **failed))
+        self.assertEqual(budget.stats()['requests'], 3)
+        self.assertEqual((budget.stats()['retries'], budget.stats()['rejected']), (2, 1))
+
+
+class TestTransportRetries(unittest.TestCase):
+    @patch('ds_crm_sdk.transports.http.http_sync.time.sleep')
+    @patch('requests.Session.request')
+    def test_sync_transport_retries_transient_failures(self, mock_request, mock_sleep):
+        mock_request.side_effect = [requests.ConnectionError('reset'),
+                                    fake_response(HTTPStatus.SERVICE_UNAVAILABLE,
+                                                  {'Retry-After': '2'}),
+                                    fake_response(HTTPStatus.OK)]
+        transport = DSHTTPTransport(token_provider=None,
+                                    retry_policy=RetryPolicy(max_attempts=3, jitter=False))
+        self.assertEqual(transport.send(HTTPMethod.GET, 'https://crm.test/a'),
+                         ({'status': 200}, HTTPStatus.OK))
+        self.assertEqual([call.args[0] for call in mock_sleep.call_args_list], [0.1, 2.0])
+        transport.close()
+
+    @patch('requests.Session.request')
+    def test_sync_transport_gives_up(self, mock_request):
+        mock_request.side_effect = requests.ConnectionError('down')
+        transport = DSHTTPTransport(token_provider=None,
+                                    retry_policy=RetryPolicy(max_attempts=2, backoff_base=0))
+        data, status = transport.send(HTTPMethod.GET, 'https://crm.test/a')
+        self.assertEqual((status, mock_request.call_count), (HTTPStatus.INTERNAL_SERVER_ERROR, 2))
+        self.assertIn('down', data['error'])
+        transport.close()
+
+
+class TestAsyncTransportRetries(unittest.IsolatedAsyncioTestCase):
+    async def test_async_transport_retries_transient_failures(self):
+        responses = [httpx.ConnectError('refused'),
+                     httpx.Response(HTTPStatus.TOO_MANY_REQUESTS, headers={'Retry-After': '0'}),
+                     httpx.Response(HTTPStatus.OK, json={'ok': True})]
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            result = responses.pop(0)
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        transport = DSAsyncHTTPTransport(
+            token_provider=None, client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            retry_policy=RetryPolicy(backoff_base=0))
+        async with transport:
+            self.assertEqual(await transport.send(HTTPMethod.GET, 'https://crm.test/a'),
+                             ({'ok': True}, HTTPStatus.OK))
+            responses.append(httpx.Response(HTTPStatus.SERVICE_UNAVAILABLE, json={}))
+            _, status = await transport.send(HTTPMethod.POST, 'https://crm.test/a', payload={'a': 1})
+        self.assertEqual(status, HTTPStatus.SERVICE_UNAVAILABLE)
+        self.assertEqual(responses, [])
@@ -0,0 +1,128 @@
+import json
+import unittest
+from http import HTTPStatus
+from unittest.mock import MagicMock, patch
+import httpx
+from ds_crm_sdk.clients.http.async_crm_client import AsyncCRMClient
+from ds_crm_sdk.clients.http.crm_client import CRMClient
+from ds_crm_sdk.constants import ClientOrigin
+from ds_crm_sdk.dtos import AddressDTO
+from ds_crm_sdk.exceptions import CRMRequestError, CRMResponseTooLargeError
+from ds_crm_sdk.transports.http import DSAsyncHTTPTransport, DSHTTPTransport
+from ds_crm_sdk.transports.http.streaming import JSONArrayStream
+
+ACCOUNTS = [{'id': index, 'name': f'Account "{index}" [{{x}}]', 'tags': ['a,b', {'k': '\\'}]}
+            for index in range(25)]
+BODY = json.dumps({'meta': {'accounts': [0]}, 'total': 25, 'accounts': ACCOUNTS,
+                   'note': 'accounts'}).encode()
+
+
+def _chunks(body: bytes, size: int):
+    return [body[index:index + size] for index in range(0, len(body), size)]
+
+
+class TestJSONArrayStream(unittest.TestCase):
+    def test_any_chunking_yields_the_top_level_array(self):
+        for size in (1, 2, 7, 64, len(BODY)):
+            with self.subTest(chunk_size=size):
+                parser = JSONArrayStream('accounts', decode=json.loads)
+                records = [record for chunk in _chunks(BODY, size) for record in parser.feed(chunk)]
+                parser.close()
+                self.assertEqual(records, ACCOUNTS)
+
+    def test_missing_key_and_scalar_elements(self):
+        parser = JSONArrayStream('addresses', decode=json.loads)
+        self.assertEqual(parser.feed(BODY), [])
+        self.assertFalse(parser.found)
+        parser = JSONArrayStream('ids', decode=json.loads)
+        self.assertEqual(parser.feed(b'{"ids": [1, "two", null, []]}'), [1, 'two', None, []])
+
+    def test_max_body_size_and_truncation(self):
+        parser = JSONArrayStream('accounts', decode=json.loads, max_body_size=100)
+        with self.assertRaises(CRMResponseTooLargeError):
+            for chunk in _chunks(BODY, 64):
+                parser.feed(chunk)
+        parser = JSONArrayStream('accounts', decode=json.loads)
+        parser.feed(BODY[:-20])
+        with self.assertRaises(ValueError):
+            parser.close()
+
+
+class TestSyncStreaming(unittest.TestCase):
+    def setUp(self):
+        self.transport = DSHTTPTransport(token_provider=None)
+        self.client = CRMClient(base_url='https://crm.test', client_origin=ClientOrigin.WEB,
+                                transport=self.transport)
+        self.patcher = patch('requests.Session.request')
+        self.mock_request = self.patcher.start()
+        self.addCleanup(self.patcher.stop)
+        self.addCleanup(self.transport.close)
+
+    def _respond(self, status_code, body, headers=None):
+        response = MagicMock(status_code=status_code, headers=headers or {}, content=body)
+        response.iter_content.side_effect = lambda chunk_size: iter(_chunks(body, chunk_size))
+        self.mock_request.return_value = response
+        return response
+
+    def test_stream_accounts(self):
+        response = self._respond(HTTPStatus.OK, BODY)
+        records = list(self.client.stream_accounts(limit=5000))
+        self.assertEqual(records, ACCOUNTS)
+        kwargs = self.mock_request.call_args.kwargs
+        self.assertTrue(kwargs['stream'])
+        self.assertEqual(kwargs['params']['limit'], 5000)
+        response.__exit__.assert_called_once()
+        self.assertEqual(self.transport.pool_stats()['in_flight'], 0)
+
+    def test_error_status_raises(self):
+        self._respond(HTTPStatus.NOT_FOUND, b'{"error": "Not found"}')
+        with self.assertRaises(CRMRequestError) as raised:
+            list(self.client.stream_account_addresses(account_id='1'))
+        self.assertEqual(raised.exception.status_code, HTTPStatus.NOT_FOUND)
+        self.assertEqual(raised.exception.data, {'error': 'Not found'})
+
+    def test_declared_length_over_limit_is_rejected_before_reading(self):
+        response = self._respond(HTTPStatus.OK, BODY, headers={'Content-Length': str(len(BODY))})
+        with self.assertRaises(CRMResponseTooLargeError):
+            list(self.client.stream_accounts(max_body_size=1024))
+        response.iter_content.assert_not_called()
+
+    def test_typed_records(self):
+        self._respond(HTTPStatus.OK, b'{"addresses": [{"id": 1, "is_default": true}, {"id": 2}]}')
+        client = CRMClient(base_url='https://crm.test', client_origin=ClientOrigin.WEB,
+                           transport=self.transport, response_models=True)
+        addresses = list(client.stream_account_addresses(account_id='1'))
+        self.assertEqual([address.id for address in addresses], [1, 2])
+        self.assertIsInstance(addresses[0], AddressDTO)
+        self.assertTrue(addresses[0].is_default)
+
+
+class TestAsyncStreaming(unittest.IsolatedAsyncioTestCase):
+    async def test_astream_accounts(self):
+        client = httpx.AsyncClient(transport=httpx.MockTransport(
+            lambda request: httpx.Response(HTTPStatus.OK, content=BODY)))
+        async with DSAsyncHTTPTransport(token_provider=None, client=client) as transport:
+            crm = AsyncCRMClient(base_url='https://crm.test', client_origin=ClientOrigin.WEB,
+                                 transport=transport)
+            records = [record async for record in crm.astream_accounts(limit=5000)]
+            self.assertEqual(transport.in_flight, 0)
+            with self.assertRaises(CRMResponseTooLargeError):
+                async for _ in crm.astream_accounts(max_body_size=256):
+                    pass
+        self.assertEqual(records, ACCOUNTS)
+
+    async def test_error_status_raises(self):
+        client = httpx.AsyncClient(transport=httpx.MockTransport(
+            lambda request: httpx.Response(HTTPStatus.BAD_GATEWAY, content=b'upstream down')))
+        async with DSAsyncHTTPTransport(token_provider=None, client=client) as transport:
+            crm = AsyncCRMClient(base_url='https://crm.test', client_origin=ClientOrigin.WEB,
+                                 transport=transport)
+            with self.assertRaises(CRMRequestError) as raised:
+                async for _ in crm.astream_account_addresses(account_id='1'):
+                    pass
+        self.assertEqual(raised.exception.status_code, HTTPStatus.BAD_GATEWAY)
+        self.assertEqual(raised.exception.data, {'error': 'upstream down'})
+
+
+if __name__ == '__main__':
+    unittest.main()
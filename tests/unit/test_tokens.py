@@ -0,0 +1,115 @@
+import asyncio
+import base64
+import json
+import threading
+import time
+import unittest
+from ds_crm_sdk.transports.http import CachedTokenProvider, DSAsyncHTTPTransport
+from ds_crm_sdk.transports.http.tokens import jwt_expiry
+
+
+def make_jwt(exp: float) -> str:
+    claims = base64.urlsafe_b64encode(json.dumps({'exp': exp}).encode()).decode().rstrip('=')
+    return f'Bearer header.{claims}.signature'
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestCachedTokenProvider(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.fetches = 0
+
+    def _fetch(self):
+        self.fetches += 1
+        return make_jwt(self.clock.now + 300)
+
+    def test_jwt_expiry(self):
+        self.assertEqual(jwt_expiry(make_jwt(1234)), 1234)
+        self.assertIsNone(jwt_expiry('opaque-token'))
+        self.assertIsNone(jwt_expiry('a.!!!.c'))
+
+    def test_token_is_cached_until_expiry(self):
+        provider = CachedTokenProvider(self._fetch, refresh_margin=0, clock=self.clock)
+        token = provider()
+        self.assertEqual([provider() for _ in range(5)], [token] * 5)
+        self.clock.now += 301
+        self.assertNotEqual(provider(), token)
+        self.assertEqual(self.fetches, 2)
+        provider.invalidate()
+        provider()
+        self.assertEqual(self.fetches, 3)
+
+    def test_proactive_refresh_runs_once_in_the_background(self):
+        release = threading.Event()
+
+        def fetch():
+            if self.fetches:
+                release.wait(timeout=1)
+            return self._fetch()
+
+        provider = CachedTokenProvider(fetch, refresh_margin=60, clock=self.clock)
+        token = provider()
+        self.clock.now += 250
+        self.assertEqual([provider() for _ in range(5)], [token] * 5)
+        release.set()
+        deadline = time.monotonic() + 1
+        while provider.stats()['expires_at'] == 1300 and time.monotonic() < deadline:
+            time.sleep(0.001)
+        self.assertEqual(provider.stats()['expires_at'], 1550)
+        self.assertEqual(self.fetches, 2)
+
+    def test_concurrent_callers_share_one_fetch(self):
+        def fetch():
+            time.sleep(0.02)
+            return self._fetch()
+
+        provider = CachedTokenProvider(fetch, ttl=60, clock=self.clock)
+        threads = [threading.Thread(target=provider) for _ in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(self.fetches, 1)
+
+    def test_coroutine_fetchers_need_aget(self):
+        async def fetch():
+            return 'token'
+
+        with self.assertRaises(TypeError):
+            CachedTokenProvider(fetch)()
+
+
+class TestCachedTokenProviderAsync(unittest.IsolatedAsyncioTestCase):
+    async def test_awaitable_fetch_is_single_flight(self):
+        fetches = []
+
+        async def fetch():
+            fetches.append(1)
+            await asyncio.sleep(0.01)
+            return 'Bearer opaque'
+
+        provider = CachedTokenProvider(fetch, ttl=60)
+        tokens = await asyncio.gather(*[provider.aget() for _ in range(10)])
+        self.assertEqual(tokens, ['Bearer opaque'] * 10)
+        self.assertEqual(len(fetches), 1)
+
+    async def test_sync_fetch_runs_off_the_event_loop(self):
+        loop_thread = threading.get_ident()
+        fetch_threads = []
+
+        def fetch():
+            fetch_threads.append(threading.get_ident())
+            return 'token'
+
+        transport = DSAsyncHTTPTransport(token_provider=CachedTokenProvider(fetch, ttl=60))
+        headers = await transport.aset_headers({'X-Client-Origin': 'web'})
+        self.assertEqual(headers, {'X-Client-Origin': 'web', 'Authorization': 'token'})
+        self.assertNotEqual(fetch_threads, [loop_thread])
+        await transport.aclose()